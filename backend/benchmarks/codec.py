@@ -0,0 +1,150 @@
+"""RASD FastAPI DynamoDB Codec Benchmark.
+
+Compares encoding and decoding large Data Access Request items with the `boto3`
+resource API path (`jsonable_encoder` and `TypeSerializer`/`TypeDeserializer`)
+against the fast item codec used with the low-level client.
+
+Usage:
+    poetry run poe benchmark-codec
+"""
+
+
+# Standard
+import datetime
+import timeit
+import uuid
+
+# Third-Party
+import boto3.dynamodb.types
+import fastapi.encoders
+
+# Local
+from rasd_fastapi.db import codec
+from rasd_fastapi.models import requests as req_models
+from rasd_fastapi.models.requests_vocabs import access
+from rasd_fastapi.models.requests_vocabs import anzsrc
+from rasd_fastapi.models.requests_vocabs import area
+from rasd_fastapi.models.requests_vocabs import frequency
+from rasd_fastapi.models.requests_vocabs import purposes
+from rasd_fastapi.schemas import audit
+
+# Typing
+from typing import Any, Callable
+
+
+# Constants
+DATASET_REQUESTS = (1, 10, 50)
+AUDIT_ENTRIES = 5
+REPEATS = 200
+
+
+def build_request(dataset_requests: int) -> req_models.DataAccessRequest:
+    """Builds a Data Access Request with many dataset requests.
+
+    Args:
+        dataset_requests (int): Number of dataset requests to include.
+
+    Returns:
+        req_models.DataAccessRequest: Data Access Request.
+    """
+    # Shortcuts
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    custodian_ids = [uuid.uuid4() for _ in range(dataset_requests)]
+
+    # Build and Return Data Access Request
+    return req_models.DataAccessRequest.parse_obj({
+        "id": "RASD-20230204-73df14",
+        "created_at": now,
+        "doi": "10.1000/182",
+        "dataset_requests": [
+            {
+                "id": f"RASD-20230204-73df14-{i + 1:02d}",
+                "metadata_id": uuid.uuid4(),
+                "metadata_title": "Benchmark Dataset",
+                "metadata_data_source_doi": "10.1000/182",
+                "metadata_data_source_url": "https://example.com/dataset",
+                "custodian_id": custodian_id,
+                "custodian_name": "Benchmark Custodian",
+                "custodian_email": "custodian@example.com",
+                "audit": [
+                    {"action": audit.Action.APPROVED, "by": "admin@example.com", "at": now}
+                    for _ in range(AUDIT_ENTRIES)
+                ],
+                "notes": "Benchmark notes",
+            }
+            for (i, custodian_id) in enumerate(custodian_ids)
+        ],
+        "custodian_ids": custodian_ids,
+        "requestor_id": uuid.uuid4(),
+        "requestor_given_name": "Given",
+        "requestor_family_name": "Family",
+        "requestor_email": "requestor@example.com",
+        "requestor_organisation_id": uuid.uuid4(),
+        "requestor_organisation_name": "Benchmark Organisation",
+        "requestor_organisation_email": "organisation@example.com",
+        "requestor_organisation_address": "1 Benchmark Street",
+        "requestor_organisation_indigenous_body": False,
+        "project_title": "Benchmark Project",
+        "project_purpose": list(purposes.Purpose)[0],
+        "project_research": list(anzsrc.ResearchClassification)[0],
+        "project_commercial": False,
+        "project_public_benefit_explanation": "Benchmark",
+        "data_requested": "Benchmark",
+        "data_relevance_explanation": "Benchmark",
+        "data_frequency": frequency.Frequency.SINGLE_ONCE_OFF,
+        "data_area": area.Area.WHOLE_DATASET,
+        "data_security_explanation": "Benchmark",
+        "data_access": list(access.Access)[0],
+        "data_access_explanation": "Benchmark",
+        "data_distribution_explanation": "Benchmark",
+        "data_accept_transformed": True,
+    })
+
+
+def measure(function: Callable[[], Any]) -> float:
+    """Measures the mean time taken by a function.
+
+    Args:
+        function (Callable[[], Any]): Function to measure.
+
+    Returns:
+        float: Mean time taken in microseconds.
+    """
+    # Measure and Return
+    return min(timeit.repeat(function, number=REPEATS, repeat=3)) / REPEATS * 1e6
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    # Construct Serialiser and Deserialiser
+    serializer = boto3.dynamodb.types.TypeSerializer()
+    deserializer = boto3.dynamodb.types.TypeDeserializer()
+
+    # Print Header
+    print(f"{'Datasets':>8} | {'Encode (resource)':>17} | {'Encode (codec)':>14} | {'Decode (resource)':>17} | {'Decode (codec)':>14}")  # noqa: E501
+
+    # Loop through Sizes
+    for n in DATASET_REQUESTS:
+        # Build Item
+        model = build_request(n)
+        item = codec.encode_item(model)
+
+        # Measure Resource API Path
+        encode_resource = measure(
+            lambda: {k: serializer.serialize(v) for (k, v) in fastapi.encoders.jsonable_encoder(model).items()},  # noqa: B023,E501
+        )
+        decode_resource = measure(
+            lambda: {k: deserializer.deserialize(v) for (k, v) in item.items()},  # type: ignore[arg-type]  # noqa: B023
+        )
+
+        # Measure Codec Path
+        encode_codec = measure(lambda: codec.encode_item(model))  # noqa: B023
+        decode_codec = measure(lambda: codec.decode_item(item))  # noqa: B023
+
+        # Print Results
+        print(f"{n:>8} | {encode_resource:>15.0f}us | {encode_codec:>12.0f}us | {decode_resource:>15.0f}us | {decode_codec:>12.0f}us")  # noqa: E501
+
+
+# Run
+if __name__ == "__main__":
+    main()
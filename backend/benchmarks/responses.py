@@ -0,0 +1,163 @@
+"""RASD FastAPI Response Serialisation Benchmark.
+
+Compares serialising pages of Data Access Requests with FastAPI's default path
+(validating against the response model, `jsonable_encoder` and `JSONResponse`)
+against the `FastJSONResponse` used by `prevalidated` endpoints.
+
+Usage:
+    poetry run poe benchmark-responses
+"""
+
+
+# Standard
+import asyncio
+import datetime
+import json
+import timeit
+import uuid
+
+# Third-Party
+import fastapi.responses
+import fastapi.routing
+import fastapi.utils
+
+# Local
+from rasd_fastapi.api import responses
+from rasd_fastapi.models import requests as req_models
+from rasd_fastapi.models.requests_vocabs import access
+from rasd_fastapi.models.requests_vocabs import anzsrc
+from rasd_fastapi.models.requests_vocabs import area
+from rasd_fastapi.models.requests_vocabs import frequency
+from rasd_fastapi.models.requests_vocabs import purposes
+from rasd_fastapi.schemas import audit
+from rasd_fastapi.schemas import pagination
+
+# Typing
+from typing import Any, Callable
+
+
+# Constants
+PAGE_SIZES = (10, 100, 1_000)
+REPEATS = 5
+
+
+def build_request(index: int) -> req_models.DataAccessRequest:
+    """Builds a Data Access Request with a single dataset request.
+
+    Args:
+        index (int): Index of the Data Access Request.
+
+    Returns:
+        req_models.DataAccessRequest: Data Access Request.
+    """
+    # Shortcuts
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    request_id = f"RASD-20230204-{index:06x}"
+    custodian_id = uuid.uuid4()
+
+    # Build and Return Data Access Request
+    return req_models.DataAccessRequest.parse_obj({
+        "id": request_id,
+        "created_at": now,
+        "doi": "10.1000/182",
+        "dataset_requests": [
+            {
+                "id": f"{request_id}-01",
+                "metadata_id": uuid.uuid4(),
+                "metadata_title": "Benchmark Dataset",
+                "metadata_data_source_doi": "10.1000/182",
+                "metadata_data_source_url": "https://example.com/dataset",
+                "custodian_id": custodian_id,
+                "custodian_name": "Benchmark Custodian",
+                "custodian_email": "custodian@example.com",
+                "audit": [{"action": audit.Action.APPROVED, "by": "admin@example.com", "at": now}],
+                "notes": "Benchmark notes",
+            }
+        ],
+        "custodian_ids": [custodian_id],
+        "requestor_id": uuid.uuid4(),
+        "requestor_given_name": "Given",
+        "requestor_family_name": "Family",
+        "requestor_email": "requestor@example.com",
+        "requestor_organisation_id": uuid.uuid4(),
+        "requestor_organisation_name": "Benchmark Organisation",
+        "requestor_organisation_email": "organisation@example.com",
+        "requestor_organisation_address": "1 Benchmark Street",
+        "requestor_organisation_indigenous_body": False,
+        "project_title": "Benchmark Project",
+        "project_purpose": list(purposes.Purpose)[0],
+        "project_research": list(anzsrc.ResearchClassification)[0],
+        "project_commercial": False,
+        "project_public_benefit_explanation": "Benchmark",
+        "data_requested": "Benchmark",
+        "data_relevance_explanation": "Benchmark",
+        "data_frequency": frequency.Frequency.SINGLE_ONCE_OFF,
+        "data_area": area.Area.WHOLE_DATASET,
+        "data_security_explanation": "Benchmark",
+        "data_access": list(access.Access)[0],
+        "data_access_explanation": "Benchmark",
+        "data_distribution_explanation": "Benchmark",
+        "data_accept_transformed": True,
+    })
+
+
+def measure(function: Callable[[], Any]) -> float:
+    """Measures the mean time taken by a function.
+
+    Args:
+        function (Callable[[], Any]): Function to measure.
+
+    Returns:
+        float: Mean time taken in milliseconds.
+    """
+    # Measure and Return
+    return min(timeit.repeat(function, number=REPEATS, repeat=3)) / REPEATS * 1e3
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    # Construct Response Field
+    # This is how FastAPI validates the return value of the endpoint
+    field = fastapi.utils.create_response_field(
+        name="Response",
+        type_=pagination.PaginatedResult[req_models.DataAccessRequest],
+    )
+    loop = asyncio.new_event_loop()
+
+    # Construct Serialisers
+    def default(page: pagination.PaginatedResult) -> bytes:
+        content = loop.run_until_complete(fastapi.routing.serialize_response(
+            field=field,
+            response_content=page,
+            is_coroutine=True,
+        ))
+        return fastapi.responses.JSONResponse(content=content).body
+
+    def fast(page: pagination.PaginatedResult) -> bytes:
+        return responses.FastJSONResponse(content=page).body
+
+    # Print Header
+    print(f"{'Items':>6} | {'Default':>10} | {'Fast':>10} | {'Speedup':>7}")
+
+    # Loop through Sizes
+    for n in PAGE_SIZES:
+        # Build Page
+        page = pagination.PaginatedResult(count=n, cursor=None, results=[build_request(i) for i in range(n)])
+
+        # Check Serialisers are Equivalent
+        assert json.loads(default(page)) == json.loads(fast(page))  # noqa: S101
+
+        # Measure Serialisers
+        default_time = measure(lambda: default(page))  # noqa: B023
+        fast_time = measure(lambda: fast(page))  # noqa: B023
+
+        # Print Results
+        print(f"{n:>6} | {default_time:>8.2f}ms | {fast_time:>8.2f}ms | {default_time / fast_time:>6.1f}x")
+
+    # Close Event Loop
+    loop.close()
+
+
+# Run
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""RASD FastAPI REST API Response Cache.
+
+Public endpoints that are requested repeatedly with the same parameters (such
+as searches from crawlers and the landing page) can cache their serialised
+responses under a normalised key of their parameters (see `search.results.key`),
+so that a warm container doesn't read the database again to answer them.
+
+Each cache holds at most `size` bytes of responses, evicting the least recently
+used responses first, and each response expires `ttl` seconds after it was
+built. The caches are registered with the tables that their responses are
+built from (see `db.cache`), and any write to those tables clears them. Each
+clear increments the generation of the cache, so that a response built from
+data read before a write is never cached after it.
+
+Cached responses are sent with a public `Cache-Control` header with the same
+lifetime, so that they can also be cached by API Gateway or CloudFront. A
+response that was cut short because its read budget ran out is neither cached
+nor sent as cacheable, so that the partial page is only ever seen once.
+
+The caches are per process, so a write only clears the caches of the container
+that handled it. Other containers (and any proxies) keep serving responses
+built before the write until they expire, so the `ttl` is the only bound on
+how stale a response can be across containers, and must be kept short (see
+`RESPONSE_CACHE_TTL`).
+"""
+
+
+# Standard
+import collections
+import threading
+import time
+
+# Third-Party
+import fastapi
+
+# Local
+from rasd_fastapi.api import responses
+from rasd_fastapi.db import budgets
+
+# Typing
+from typing import Any, Callable, Optional
+
+
+# Shortcuts
+# A cached response is its serialised body and its headers
+CachedResponse = tuple[bytes, dict[str, str]]
+
+
+class ResponseCache:
+    """LRU cache of serialised API responses."""
+
+    def __init__(self, name: str, ttl: float, size: int) -> None:
+        """Instantiates the response cache.
+
+        Args:
+            name (str): Name of the cache, used when reporting its statistics.
+            ttl (float): Seconds that a cached response is valid for.
+            size (int): Maximum number of bytes of responses to hold.
+        """
+        # Instance Variables
+        self.name = name
+        self.ttl = ttl
+        self.size = size
+        self.lock = threading.Lock()
+        self.entries: collections.OrderedDict[str, tuple[float, CachedResponse]] = collections.OrderedDict()
+        self.total = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def respond(
+        self,
+        key: str,
+        build: Callable[[], tuple[Any, dict[str, str]]],
+        budget: Optional[budgets.ReadBudget] = None,
+    ) -> fastapi.Response:
+        """Retrieves a cached response, building and caching it if required.
+
+        Args:
+            key (str): Normalised key of the request.
+            build (Callable[[], tuple[Any, dict[str, str]]]): Builds the
+                content and headers of the response. Any errors that it raises
+                are not cached.
+            budget (Optional[budgets.ReadBudget]): Optional read budget used
+                to build the response. If it is exhausted once the response is
+                built, then the response may be partial and is not cached.
+
+        Returns:
+            fastapi.Response: Cached or built response.
+        """
+        # Check Cache
+        cached = self.get(key)
+        if cached is None:
+            # Build Response
+            # The response is built outside of the lock, so that other requests
+            # aren't blocked while it is built
+            generation = self.generation
+            (content, headers) = build()
+            cached = (responses.FastJSONResponse(content=content).body, headers)
+
+            # Check Read Budget
+            if budget and budget.exhausted:
+                # Return Partial Response without Caching
+                (body, headers) = cached
+                return fastapi.Response(
+                    content=body,
+                    media_type="application/json",
+                    headers=headers | {"Cache-Control": "no-store"},
+                )
+
+            # Cache Response
+            self.put(key, cached, generation)
+
+        # Construct and Return Response
+        (body, headers) = cached
+        return fastapi.Response(
+            content=body,
+            media_type="application/json",
+            headers=headers | {"Cache-Control": f"public, max-age={int(self.ttl)}"},
+        )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Retrieves a cached response.
+
+        Args:
+            key (str): Normalised key of the request.
+
+        Returns:
+            Optional[CachedResponse]: Cached response, or None if it is not
+                cached or has expired.
+        """
+        # Lock
+        with self.lock:
+            # Check Entry
+            entry = self.entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                # Miss
+                self.discard(key)
+                self.misses += 1
+                return None
+
+            # Mark as Recently Used and Return
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, cached: CachedResponse, generation: int) -> None:
+        """Caches a response.
+
+        Args:
+            key (str): Normalised key of the request.
+            cached (CachedResponse): Response to cache.
+            generation (int): Generation of the cache when the response
+                started being built.
+        """
+        # Lock
+        with self.lock:
+            # Check Generation and Size
+            # Responses that are larger than the whole cache aren't cached
+            if generation != self.generation or len(cached[0]) > self.size:
+                return
+
+            # Add Entry
+            self.discard(key)
+            self.entries[key] = (time.monotonic(), cached)
+            self.total += len(cached[0])
+
+            # Evict Least Recently Used Entries
+            while self.total > self.size:
+                self.discard(next(iter(self.entries)))
+
+    def invalidate(self, key: str) -> None:
+        """Clears the cache after a write.
+
+        Any write can change any cached response, so every response is removed
+        rather than only those of the written item.
+
+        Args:
+            key (str): Primary key of the written item.
+        """
+        # Lock
+        with self.lock:
+            # Clear Entries
+            self.entries.clear()
+            self.total = 0
+            self.generation += 1
+
+    def stats(self) -> dict[str, int]:
+        """Retrieves the statistics of the cache.
+
+        Returns:
+            dict[str, int]: Number of hits, misses, cached responses and bytes.
+        """
+        # Lock
+        with self.lock:
+            # Return
+            return {"hits": self.hits, "misses": self.misses, "items": len(self.entries), "bytes": self.total}
+
+    def discard(self, key: str) -> None:
+        """Removes a response if it is cached.
+
+        The lock must be held by the caller.
+
+        Args:
+            key (str): Normalised key of the request.
+        """
+        # Remove Entry
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total -= len(entry[1][0])
@@ -0,0 +1,113 @@
+"""RASD FastAPI REST API Responses.
+
+FastAPI validates the return value of every endpoint against its response
+model, and then encodes it with `jsonable_encoder`, before serialising it. For
+endpoints that return models that have already been validated (such as pages
+of items read from the database), this is repeated work that grows with the
+size of the response.
+
+Endpoints decorated with `prevalidated` instead return a `FastJSONResponse`,
+which FastAPI sends as is, and which serialises the models straight to JSON
+bytes with `orjson`. The response model of the route is unchanged, so the
+OpenAPI schema is the same.
+"""
+
+
+# Standard
+import datetime
+import functools
+
+# Third-Party
+import fastapi
+import fastapi.responses
+import orjson
+import pydantic
+import pydantic.json
+
+# Typing
+from typing import Any, Awaitable, Callable, TypeVar
+
+
+# Constants
+Endpoint = TypeVar("Endpoint", bound=Callable[..., Awaitable[Any]])
+
+
+class FastJSONResponse(fastapi.responses.JSONResponse):
+    """JSON response serialised with `orjson`.
+
+    UUIDs, datetimes, enums and subclasses of `str` (such as `RASDIdentifier`
+    and `DOI`) are serialised natively by `orjson`, and everything else is
+    serialised in the same way as FastAPI (see `encode`). Dictionaries may be
+    keyed by enums (such as facet counts), which are serialised by value.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialises the content of the response.
+
+        Args:
+            content (Any): Content to serialise.
+
+        Returns:
+            bytes: Serialised content.
+        """
+        # Serialise and Return
+        return orjson.dumps(content, default=encode, option=orjson.OPT_NON_STR_KEYS)
+
+
+def encode(obj: Any) -> Any:
+    """Converts an object that `orjson` can't serialise natively.
+
+    Args:
+        obj (Any): Object to convert.
+
+    Returns:
+        Any: Object that `orjson` can serialise.
+    """
+    # Convert Models
+    # Fields are serialised by their aliases, as FastAPI does by default
+    if isinstance(obj, pydantic.BaseModel):
+        return obj.dict(by_alias=True)
+
+    # Convert Dates
+    # Subclasses of `datetime.date` (such as `ISO8601Date`) aren't serialised
+    # natively
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+
+    # Convert Everything Else (e.g., `Decimal`) and Return
+    return pydantic.json.pydantic_encoder(obj)
+
+
+def prevalidated(endpoint: Endpoint) -> Endpoint:
+    """Decorates an endpoint to skip validating its return value.
+
+    The endpoint must return an instance of its response model (or a response),
+    as the return value is serialised as it is, rather than being validated
+    against the response model, which would convert or filter it.
+
+    Headers and status codes set on an injected `fastapi.Response` (or on the
+    route) are not sent, so the endpoint must not rely on them.
+
+    Args:
+        endpoint (Endpoint): Endpoint to decorate.
+
+    Returns:
+        Endpoint: Decorated endpoint.
+    """
+    # Construct Decorated Endpoint
+    # The signature of the endpoint is preserved by `functools.wraps`, so that
+    # FastAPI still injects its dependencies and parameters
+    @functools.wraps(endpoint)
+    async def decorated(*args: Any, **kwargs: Any) -> Any:
+        # Call Endpoint
+        result = await endpoint(*args, **kwargs)
+
+        # Check for Response
+        if isinstance(result, fastapi.Response):
+            return result
+
+        # Construct and Return Response
+        return FastJSONResponse(content=result)
+
+    # Return
+    return decorated  # type: ignore[return-value]
@@ -12,6 +12,7 @@ from rasd_fastapi.api.v1.endpoints import metadata
 from rasd_fastapi.api.v1.endpoints import organisations
 from rasd_fastapi.api.v1.endpoints import registration
 from rasd_fastapi.api.v1.endpoints import requests
+from rasd_fastapi.api.v1.endpoints import vocabularies
 
 
 # Router
@@ -23,3 +24,4 @@ router.include_router(metadata.router, prefix="/metadata", tags=["Metadata"])
 router.include_router(organisations.router, prefix="/organisations", tags=["Organisations"])
 router.include_router(registration.router, prefix="/register", tags=["Registration"])
 router.include_router(requests.router, prefix="/access-requests", tags=["Access Requests"])
+router.include_router(vocabularies.router, prefix="/vocabularies", tags=["Vocabularies"])
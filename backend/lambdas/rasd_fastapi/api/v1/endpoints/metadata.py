@@ -2,6 +2,7 @@
 
 
 # Standard
+import datetime
 import uuid
 
 # Third-Party
@@ -11,8 +12,14 @@ import pydantic
 
 # Local
 from rasd_fastapi import utils
+from rasd_fastapi.api import caching
+from rasd_fastapi.api import responses
+from rasd_fastapi.db import budgets
+from rasd_fastapi.db import cache
 from rasd_fastapi.db import session
 from rasd_fastapi.core import security
+from rasd_fastapi.core import settings
+from rasd_fastapi.crud import base as crud_base
 from rasd_fastapi.crud import metadata as metadata_crud
 from rasd_fastapi.crud import organisations as org_crud
 from rasd_fastapi.models import metadata as metadata_models
@@ -25,32 +32,50 @@ from rasd_fastapi.models.metadata_vocabs import security_classifications
 from rasd_fastapi.schemas import auth
 from rasd_fastapi.schemas import metadata as metadata_schemas
 from rasd_fastapi.schemas import pagination
+from rasd_fastapi.search import results
+from rasd_fastapi.search import spatial
+from rasd_fastapi.search import temporal
 
 # Typing
-from typing import Optional
+from typing import Optional, Union
 
 
 # Router
 router = fastapi.APIRouter()
 
+# Response Caches
+# Search responses are built from the Metadata, so are cleared by any write to
+# the Metadata table
+search_cache = cache.register(
+    settings.SETTINGS.AWS_DYNAMODB_TABLE_METADATA,
+    caching.ResponseCache(
+        "metadata-search",
+        ttl=settings.SETTINGS.RESPONSE_CACHE_TTL,
+        size=settings.SETTINGS.RESPONSE_CACHE_SIZE,
+    ),
+)
+
 
 @router.get(r"", response_model=pagination.PaginatedResult[metadata_models.RASDMetadata])
+@responses.prevalidated
 async def list_metadata(
     *,
     user: auth.User = fastapi.Depends(security.require_admin_or_custodian),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
     active_only: bool = True,
     limit: Optional[int] = None,
-    cursor: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
 ) -> pagination.PaginatedResult[metadata_models.RASDMetadata]:
     """List Metadata endpoint for REST API.
 
     Args:
         user (auth.User): Currently logged in user via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
         active_only (bool): Show only active metadata.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[uuid.UUID]): Optional pagination cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
 
     Returns:
         pagination.PaginatedResult[metadata_models.RASDMetadata]: Retrieved
@@ -67,63 +92,297 @@ async def list_metadata(
         organisation_id=org_id,  # Restrict to user's Organisation (if applicable)
     )
 
-    # Scan Metadata and Return
-    return metadata_crud.metadata.scan(
-        db_session,
-        filter=filters,
-        limit=limit,
-        cursor=cursor,
-    )
+    # Handle Cursor Errors
+    try:
+        # Scan Metadata and Return
+        return metadata_crud.metadata.scan(
+            db_session,
+            filter=filters,
+            limit=limit,
+            cursor=cursor,
+            budget=budget,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
 
-@router.get(r"/search", response_model=pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary])
+@router.get(r"/search", response_model=metadata_schemas.RASDMetadataSearchResult)
 async def search_metadata(
     *,
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
+    q: Optional[str] = None,
     active_only: bool = True,
     title: Optional[str] = None,
     abstract: Optional[str] = None,
     keywords: Optional[set[keywords.Keyword]] = fastapi.Query(None),  # noqa: B008
     locations: Optional[set[locations.Location]] = fastapi.Query(None),  # noqa: B008
     organisation_id: Optional[uuid.UUID] = None,
+    north: Optional[float] = fastapi.Query(None, ge=-90, le=90),  # noqa: B008
+    south: Optional[float] = fastapi.Query(None, ge=-90, le=90),  # noqa: B008
+    east: Optional[float] = fastapi.Query(None, ge=-180, le=180),  # noqa: B008
+    west: Optional[float] = fastapi.Query(None, ge=-180, le=180),  # noqa: B008
+    temporal_coverage_from: Optional[datetime.date] = None,
+    temporal_coverage_to: Optional[datetime.date] = None,
     limit: Optional[int] = None,
-    cursor: Optional[uuid.UUID] = None,
-) -> pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+    cursor: Optional[str] = None,
+    facets: bool = False,
+) -> fastapi.Response:
     """List Metadata endpoint for REST API.
 
+    Searches for active Metadata are served from the catalogue snapshot, and
+    the `X-Catalogue-Version` header reports the catalogue version that the
+    snapshot is of.
+
+    Responses are cached under a normalised key of the search (see
+    `api.caching`), and may be cached by proxies for the same lifetime.
+
+    The spatial filter matches metadata whose bounding box overlaps the box
+    given by `north`, `south`, `east` and `west`, which must all be supplied.
+    A `west` longitude greater than the `east` longitude crosses the
+    antimeridian. The temporal filter matches metadata whose temporal coverage
+    overlaps the dates given by `temporal_coverage_from` and
+    `temporal_coverage_to`, either of which may be omitted for an open
+    interval. The spatial and temporal filters can only be used with
+    `active_only`.
+
     Args:
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
+        q (Optional[str]): Free text query to rank results by relevance to.
         active_only (bool): Show only active metadata.
         title (Optional[str]): Filter results based on `title`.
         abstract (Optional[str]): Filter results based on `abstract`.
         keywords (Optional[set[keywords.Keyword]]): Filter results based on `keywords`.
         locations (Optional[set[locations.Location]]): Filter results based on `locations`.
         organisation_id (Optional[uuid.UUID]): Filter results based on `organisation_id`.
+        north (Optional[float]): Northern latitude of the spatial filter.
+        south (Optional[float]): Southern latitude of the spatial filter.
+        east (Optional[float]): Eastern longitude of the spatial filter.
+        west (Optional[float]): Western longitude of the spatial filter.
+        temporal_coverage_from (Optional[datetime.date]): Start of the temporal filter.
+        temporal_coverage_to (Optional[datetime.date]): End of the temporal filter.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[uuid.UUID]): Optional pagination cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
+        facets (bool): Whether to count the active metadata matching the
+            search for each keyword, location, format and access rights.
 
     Returns:
-        pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
-            Retrieved page of Non-Sensitive Metadata.
+        fastapi.Response: Serialised page of Non-Sensitive Metadata (see
+            `metadata_schemas.RASDMetadataSearchResult`), with optional facet
+            counts.
     """
-    # Build Filter
-    filters = metadata_crud.metadata.build_filter(
-        active_only,
-        title,
-        abstract,
-        keywords,
-        locations,
-        organisation_id,
+    # Construct Normalised Key
+    # Text is lowercased, as searches are case insensitive, and the sets of
+    # keywords and locations are sorted (see `results.key`)
+    key = results.key(
+        q=" ".join(q.lower().split()) if q else None,
+        active_only=active_only,
+        title=title.lower() if title else None,
+        abstract=abstract.lower() if abstract else None,
+        keywords=keywords,
+        locations=locations,
+        organisation_id=organisation_id,
+        bbox=(north, south, east, west),
+        coverage=(temporal_coverage_from, temporal_coverage_to),
+        limit=limit,
+        cursor=cursor,
+        facets=facets,
+    )
+
+    # Retrieve or Build Response
+    return search_cache.respond(
+        key,
+        lambda: search(
+            db_session=db_session,
+            budget=budget,
+            q=q,
+            active_only=active_only,
+            title=title,
+            abstract=abstract,
+            keywords=keywords,
+            locations=locations,
+            organisation_id=organisation_id,
+            north=north,
+            south=south,
+            east=east,
+            west=west,
+            temporal_coverage_from=temporal_coverage_from,
+            temporal_coverage_to=temporal_coverage_to,
+            limit=limit,
+            cursor=cursor,
+            facets=facets,
+        ),
+        budget=budget,
     )
 
-    # Scan Metadata and Return
-    # This will be automatically cast to the Non-Sensitive model by `fastapi`
-    return metadata_crud.metadata.scan(  # type: ignore[return-value]
+
+def search(
+    *,
+    db_session: boto3.Session,
+    budget: budgets.ReadBudget,
+    q: Optional[str],
+    active_only: bool,
+    title: Optional[str],
+    abstract: Optional[str],
+    keywords: Optional[set[keywords.Keyword]],
+    locations: Optional[set[locations.Location]],
+    organisation_id: Optional[uuid.UUID],
+    north: Optional[float],
+    south: Optional[float],
+    east: Optional[float],
+    west: Optional[float],
+    temporal_coverage_from: Optional[datetime.date],
+    temporal_coverage_to: Optional[datetime.date],
+    limit: Optional[int],
+    cursor: Optional[str],
+    facets: bool,
+) -> tuple[metadata_schemas.RASDMetadataSearchResult, dict[str, str]]:
+    """Searches Metadata for the search endpoint.
+
+    Args:
+        db_session (boto3.Session): Database session to use.
+        budget (budgets.ReadBudget): Read budget of the request.
+        q (Optional[str]): Free text query to rank results by relevance to.
+        active_only (bool): Show only active metadata.
+        title (Optional[str]): Filter results based on `title`.
+        abstract (Optional[str]): Filter results based on `abstract`.
+        keywords (Optional[set[keywords.Keyword]]): Filter results based on `keywords`.
+        locations (Optional[set[locations.Location]]): Filter results based on `locations`.
+        organisation_id (Optional[uuid.UUID]): Filter results based on `organisation_id`.
+        north (Optional[float]): Northern latitude of the spatial filter.
+        south (Optional[float]): Southern latitude of the spatial filter.
+        east (Optional[float]): Eastern longitude of the spatial filter.
+        west (Optional[float]): Western longitude of the spatial filter.
+        temporal_coverage_from (Optional[datetime.date]): Start of the temporal filter.
+        temporal_coverage_to (Optional[datetime.date]): End of the temporal filter.
+        limit (Optional[int]): Optional pagination limit.
+        cursor (Optional[str]): Optional opaque pagination cursor.
+        facets (bool): Whether to count the active metadata matching the
+            search for each keyword, location, format and access rights.
+
+    Raises:
+        fastapi.HTTPException: Raised if the search is invalid.
+
+    Returns:
+        tuple[metadata_schemas.RASDMetadataSearchResult, dict[str, str]]:
+            Retrieved page of Non-Sensitive Metadata, with optional facet
+            counts, and the headers of the response.
+    """
+    # Handle Cursor Errors
+    try:
+        # Search Metadata Summaries
+        # Free text queries are ranked by the in-memory ranked index, searches
+        # for active metadata are served by the catalogue snapshot, and other
+        # searches by a parallel scan. Only the attributes required for the
+        # summaries are read. The spatial and temporal filters are served by the snapshot's
+        # grid and interval indexes.
+        bbox = spatial.bounding_box(north=north, south=south, east=east, west=west)
+        coverage = temporal.interval(start=temporal_coverage_from, end=temporal_coverage_to)
+        page = metadata_crud.metadata.search(
+            db_session,
+            query=q,
+            active_only=active_only,
+            title=title,
+            abstract=abstract,
+            keywords=keywords,
+            locations=locations,
+            organisation_id=organisation_id,
+            bbox=bbox,
+            coverage=coverage,
+            limit=limit,
+            cursor=cursor,
+            budget=budget,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    # Count Facets
+    # The counts are served from the catalogue snapshot, without another scan
+    counts = metadata_crud.metadata.facets(
         db_session,
-        filter=filters,
-        limit=limit,
-        cursor=cursor,
+        query=q,
+        title=title,
+        abstract=abstract,
+        keywords=keywords,
+        locations=locations,
+        organisation_id=organisation_id,
+        bbox=bbox,
+        coverage=coverage,
+    ) if facets else None
+
+    # Report Catalogue Snapshot Version
+    headers = {}
+    if active_only and not q and (snapshot := metadata_crud.metadata.snapshot):
+        headers["X-Catalogue-Version"] = str(snapshot.version)
+
+    # Construct Search Result and Return
+    # The page has already been validated, so the result is not validated again
+    result = metadata_schemas.RASDMetadataSearchResult.construct(
+        count=page.count,
+        cursor=page.cursor,
+        results=page.results,
+        facets=counts,
     )
+    return (result, headers)
+
+
+@router.get(r"/suggest", response_model=list[metadata_schemas.RASDMetadataSuggestion])
+async def suggest_metadata(
+    *,
+    db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    q: str,
+    limit: int = fastapi.Query(10, ge=1, le=metadata_crud.typeahead.MAX_SUGGESTIONS),  # noqa: B008
+) -> list[metadata_schemas.RASDMetadataSuggestion]:
+    """Suggest Metadata search completions endpoint for REST API.
+
+    The completions are served from an in-memory prefix index of the active
+    metadata, so that the endpoint can be called on every keystroke.
+
+    Args:
+        db_session (boto3.Session): Dependency injection database session.
+        q (str): Text typed so far.
+        limit (int): Number of completions to return.
+
+    Returns:
+        list[metadata_schemas.RASDMetadataSuggestion]: Top completions.
+    """
+    # Suggest and Return
+    return metadata_crud.metadata.suggest(db_session, prefix=q, limit=limit)
+
+
+@router.get(r"/heatmap", response_model=metadata_schemas.RASDMetadataHeatmap)
+async def metadata_heatmap(
+    *,
+    db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    zoom: int = fastapi.Query(0, ge=0, lt=len(metadata_crud.heatmap.ZOOM_LEVELS)),  # noqa: B008
+) -> metadata_schemas.RASDMetadataHeatmap:
+    """Metadata coverage heatmap endpoint for REST API.
+
+    The counts are the number of active metadata whose bounding boxes
+    intersect each cell of a grid, as a flat array rather than one object per
+    metadata, so that the map can be drawn without downloading every bounding
+    box.
+
+    Args:
+        db_session (boto3.Session): Dependency injection database session.
+        zoom (int): Zoom level, from the coarsest grid.
+
+    Returns:
+        metadata_schemas.RASDMetadataHeatmap: Counts of each grid cell.
+    """
+    # Count and Return
+    return metadata_crud.metadata.coverage(db_session, zoom=zoom)
 
 
 @router.get(r"/access-rights", response_model=list[access_rights.AccessRights])
@@ -197,22 +456,53 @@ async def read_metadata(
     *,
     user: auth.User = fastapi.Depends(security.require_admin_or_custodian),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    response: fastapi.Response,
     pk: uuid.UUID,
-) -> metadata_models.RASDMetadata:
+    if_none_match: Optional[str] = fastapi.Header(None),  # noqa: B008
+) -> Union[metadata_models.RASDMetadata, fastapi.Response]:
     """Read Metadata endpoint for REST API.
 
+    The response has a strong `ETag` derived from the revision of the Metadata,
+    and a matching `If-None-Match` header is answered with `304 Not Modified`.
+
     Args:
         user (auth.User): Currently logged in user via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        response (fastapi.Response): Response to set the headers of.
         pk (uuid.UUID): Primary key of the Metadata to read.
+        if_none_match (Optional[str]): Entity tags of cached responses.
 
     Returns:
-        metadata_models.RASDMetadata: Retrieved Metadata.
+        Union[metadata_models.RASDMetadata, fastapi.Response]: Retrieved
+            Metadata, or an empty response if it is not modified.
     """
+    # Check Conditional Request
+    # The stored revision of the Metadata is read with only the attributes
+    # required to check permissions, so that an unmodified Metadata is answered
+    # without reading all of it. Metadata without a stored revision fall
+    # through to the full read below.
+    stored = metadata_crud.metadata.get_revision(
+        db_session,
+        pk=pk,
+        attributes=["organisation_id", "active"],
+    ) if if_none_match else None
+    if stored and crud_base.REVISION_ATTRIBUTE in stored:
+        # Check Permissions and Entity Tag
+        tag = utils.etag(stored[crud_base.REVISION_ATTRIBUTE], stored.get("active", True))
+        allowed = user.is_admin() or stored.get("organisation_id") == str(user.organisation_id)
+        if allowed and utils.etag_matches(if_none_match, tag):
+            # Not Modified
+            return utils.not_modified(tag, utils.PRIVATE_REVALIDATE)
+
     # Retrieve Metadata
-    metadata = utils.unwrap_or_404(
-        value=metadata_crud.metadata.get(db_session, pk=pk),
-    )
+    # A cached Metadata that is older than the stored revision read above is
+    # read again from the database, so that the response is never older than
+    # the revision that the entity tag was checked against
+    metadata = metadata_crud.metadata.get(db_session, pk=pk)
+    revision = stored.get(crud_base.REVISION_ATTRIBUTE) if stored else None
+    if metadata and revision and revision != crud_base.revision(metadata):
+        metadata = metadata_crud.metadata.get(db_session, pk=pk, cached=False)
+    metadata = utils.unwrap_or_404(value=metadata)
 
     # Check Permissions
     # Administrators can retrieve *any* Metadata, whereas Data Custodians can
@@ -224,10 +514,57 @@ async def read_metadata(
             status_code=fastapi.status.HTTP_404_NOT_FOUND,
         )
 
+    # Check Entity Tag
+    tag = utils.etag(crud_base.revision(metadata), metadata.active)
+    if utils.etag_matches(if_none_match, tag):
+        # Not Modified
+        return utils.not_modified(tag, utils.PRIVATE_REVALIDATE)
+
+    # Set Conditional Request Headers
+    response.headers["ETag"] = tag
+    response.headers["Cache-Control"] = utils.PRIVATE_REVALIDATE
+
     # Return Metadata
     return metadata
 
 
+@router.get(r"/{pk}/similar", response_model=list[metadata_schemas.RASDMetadataSummary])
+@responses.prevalidated
+async def similar_metadata(
+    *,
+    db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    pk: uuid.UUID,
+    limit: int = fastapi.Query(10, ge=1, le=metadata_crud.similarity.NEIGHBOURS),  # noqa: B008
+) -> list[metadata_schemas.RASDMetadataSummary]:
+    """Similar Metadata endpoint for REST API.
+
+    The similar metadata are the nearest neighbours of the active metadata by
+    the cosine similarity of their text and their keywords and locations,
+    which are precomputed for the whole catalogue snapshot.
+
+    Args:
+        db_session (boto3.Session): Dependency injection database session.
+        pk (uuid.UUID): Primary key of the Metadata.
+        limit (int): Number of similar Metadata to return.
+
+    Returns:
+        list[metadata_schemas.RASDMetadataSummary]: Most similar Metadata.
+    """
+    # Retrieve Similar Metadata
+    similar = metadata_crud.metadata.similar(db_session, pk=pk, limit=limit)
+
+    # Check Metadata
+    # Only active Metadata are in the catalogue
+    if similar is None:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_404_NOT_FOUND,
+        )
+
+    # Return
+    return similar
+
+
 @router.post(r"", response_model=metadata_models.RASDMetadata)
 async def create_metadata(
     *,
@@ -246,7 +583,8 @@ async def create_metadata(
         metadata_models.RASDMetadata: Created Metadata.
     """
     # Retrieve User Organisation
-    org = org_crud.organisation.get(db_session, pk=user.organisation_id)
+    # The custodian name is copied from the Organisation in the database
+    org = org_crud.organisation.get(db_session, pk=user.organisation_id, cached=False)
 
     # Check Organisation
     if not org:
@@ -297,8 +635,9 @@ async def update_metadata(
         metadata_models.RASDMetadata: Updated Metadata.
     """
     # Retrieve Metadata
+    # The update is based on the item in the database, not a cached copy
     metadata = utils.unwrap_or_404(
-        value=metadata_crud.metadata.get(db_session, pk=pk),
+        value=metadata_crud.metadata.get(db_session, pk=pk, cached=False),
     )
 
     # Check Permissions
@@ -10,8 +10,11 @@ import fastapi
 
 # Local
 from rasd_fastapi import utils
+from rasd_fastapi.api import responses
+from rasd_fastapi.db import budgets
 from rasd_fastapi.db import session
 from rasd_fastapi.core import security
+from rasd_fastapi.crud import base as crud_base
 from rasd_fastapi.crud import organisations as org_crud
 from rasd_fastapi.models import organisations as org_models
 from rasd_fastapi.schemas import auth
@@ -19,7 +22,7 @@ from rasd_fastapi.schemas import organisations as org_schemas
 from rasd_fastapi.schemas import pagination
 
 # Typing
-from typing import Optional
+from typing import Optional, Union
 
 
 # Router
@@ -27,53 +30,104 @@ router = fastapi.APIRouter()
 
 
 @router.get(r"", response_model=pagination.PaginatedResult[org_models.Organisation])
+@responses.prevalidated
 async def list_organisations(
     *,
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
     active_only: bool = True,
     limit: Optional[int] = None,
-    cursor: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
 ) -> pagination.PaginatedResult[org_models.Organisation]:
     """List Organisations endpoint for REST API.
 
     Args:
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
         active_only (bool): Show only active organisations.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[uuid.UUID]): Optional pagination cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
 
     Returns:
         pagination.PaginatedResult[org_models.Organisation]: Retrieved page of
             Organisations.
     """
-    # Scan Organisations and Return
-    return org_crud.organisation.scan(
-        db_session,
-        filter=org_crud.organisation.ActiveOnly if active_only else None,
-        limit=limit,
-        cursor=cursor,
-    )
+    # Handle Cursor Errors
+    try:
+        # Scan Organisations and Return
+        return org_crud.organisation.scan(
+            db_session,
+            filter=org_crud.organisation.ActiveOnly if active_only else None,
+            limit=limit,
+            cursor=cursor,
+            budget=budget,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
 
 @router.get(r"/{pk}", response_model=org_models.Organisation)
 async def read_organisation(
     *,
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    response: fastapi.Response,
     pk: uuid.UUID,
-) -> org_models.Organisation:
+    if_none_match: Optional[str] = fastapi.Header(None),  # noqa: B008
+) -> Union[org_models.Organisation, fastapi.Response]:
     """Read Organisation endpoint for REST API.
 
+    The response has a strong `ETag` derived from the revision of the
+    Organisation, and a matching `If-None-Match` header is answered with
+    `304 Not Modified`.
+
     Args:
         db_session (boto3.Session): Dependency injection database session.
+        response (fastapi.Response): Response to set the headers of.
         pk (uuid.UUID): Primary key of the Organisation to read.
+        if_none_match (Optional[str]): Entity tags of cached responses.
 
     Returns:
-        org_models.Organisation: Retrieved Organisation.
+        Union[org_models.Organisation, fastapi.Response]: Retrieved
+            Organisation, or an empty response if it is not modified.
     """
-    # Retrieve and Return Organisation
-    return utils.unwrap_or_404(
-        value=org_crud.organisation.get(db_session, pk=pk),
-    )
+    # Check Conditional Request
+    # Only the stored revision of the Organisation is read, so that an
+    # unmodified Organisation is answered without reading all of it
+    stored = org_crud.organisation.get_revision(db_session, pk=pk, attributes=["active"]) if if_none_match else None
+    if stored and crud_base.REVISION_ATTRIBUTE in stored:
+        # Check Entity Tag
+        tag = utils.etag(stored[crud_base.REVISION_ATTRIBUTE], stored.get("active", True))
+        if utils.etag_matches(if_none_match, tag):
+            # Not Modified
+            return utils.not_modified(tag, utils.PUBLIC_REVALIDATE)
+
+    # Retrieve Organisation
+    # A cached Organisation that is older than the stored revision read above
+    # is read again from the database, so that the response is never older
+    # than the revision that the entity tag was checked against
+    organisation = org_crud.organisation.get(db_session, pk=pk)
+    revision = stored.get(crud_base.REVISION_ATTRIBUTE) if stored else None
+    if organisation and revision and revision != crud_base.revision(organisation):
+        organisation = org_crud.organisation.get(db_session, pk=pk, cached=False)
+    organisation = utils.unwrap_or_404(value=organisation)
+
+    # Check Entity Tag
+    tag = utils.etag(crud_base.revision(organisation), organisation.active)
+    if utils.etag_matches(if_none_match, tag):
+        # Not Modified
+        return utils.not_modified(tag, utils.PUBLIC_REVALIDATE)
+
+    # Set Conditional Request Headers
+    response.headers["ETag"] = tag
+    response.headers["Cache-Control"] = utils.PUBLIC_REVALIDATE
+
+    # Return Organisation
+    return organisation
 
 
 @router.post(r"", response_model=org_models.Organisation)
@@ -132,8 +186,9 @@ async def update_organisation(
         org_models.Organisation: Updated Organisation.
     """
     # Retrieve Organisation
+    # The update is based on the item in the database, not a cached copy
     org = utils.unwrap_or_404(
-        value=org_crud.organisation.get(db_session, pk=pk),
+        value=org_crud.organisation.get(db_session, pk=pk, cached=False),
     )
 
     # Update and Return Organisation
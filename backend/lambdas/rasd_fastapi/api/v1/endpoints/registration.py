@@ -10,8 +10,10 @@ import fastapi
 
 # Local
 from rasd_fastapi import utils
+from rasd_fastapi.api import responses
 from rasd_fastapi.core import security
 from rasd_fastapi.crud import registration as reg_crud
+from rasd_fastapi.db import budgets
 from rasd_fastapi.db import session
 from rasd_fastapi.models import registration as reg_models
 from rasd_fastapi.schemas import auth
@@ -27,24 +29,29 @@ router = fastapi.APIRouter()
 
 
 @router.get(r"", response_model=pagination.PaginatedResult[reg_models.Registration])
+@responses.prevalidated
 async def list_registrations(
     *,
     admin: auth.User = fastapi.Depends(security.require_admin),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
     active_only: bool = True,
     status: Optional[reg_models.Status] = None,
     limit: Optional[int] = None,
-    cursor: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
+    newest_first: bool = False,
 ) -> pagination.PaginatedResult[reg_models.Registration]:
     """List Registrations endpoint for REST API.
 
     Args:
         admin (auth.User): Currently logged in admin via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
         active_only (bool): Show only active Registrations.
         status (Optional[reg_models.Status]): Filter Registrations by status.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[uuid.UUID]): Optional pagination cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
+        newest_first (bool): List the most recent Registrations first.
 
     Returns:
         pagination.PaginatedResult[reg_models.Registration]: Retrieved page of
@@ -56,13 +63,24 @@ async def list_registrations(
         status=status,  # Restrict to status (if applicable)
     )
 
-    # Scan Registrations and Return
-    return reg_crud.registration.scan(
-        db_session,
-        filter=filters,
-        limit=limit,
-        cursor=cursor,
-    )
+    # Handle Cursor Errors
+    try:
+        # Scan Registrations and Return
+        return reg_crud.registration.scan(
+            db_session,
+            filter=filters,
+            limit=limit,
+            cursor=cursor,
+            budget=budget,
+            newest_first=newest_first,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
 
 @router.get(r"/{pk}", response_model=reg_models.Registration)
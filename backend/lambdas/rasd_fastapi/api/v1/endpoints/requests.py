@@ -9,8 +9,14 @@ import pydantic
 # Local
 from rasd_fastapi import types
 from rasd_fastapi import utils
+from rasd_fastapi.api import caching
+from rasd_fastapi.api import responses
 from rasd_fastapi.core import security
+from rasd_fastapi.core import settings
+from rasd_fastapi.crud import base as crud_base
 from rasd_fastapi.crud import requests as req_crud
+from rasd_fastapi.db import budgets
+from rasd_fastapi.db import cache
 from rasd_fastapi.db import session
 from rasd_fastapi.models import requests as req_models
 from rasd_fastapi.models.requests_vocabs import access
@@ -24,31 +30,46 @@ from rasd_fastapi.schemas import pagination
 from rasd_fastapi.schemas import requests as req_schemas
 
 # Typing
-from typing import Optional
+from typing import Optional, Union
 
 
 # Router
 router = fastapi.APIRouter()
 
+# Response Caches
+# Summary responses are cleared by any write to the Data Access Requests table
+summary_cache = cache.register(
+    settings.SETTINGS.AWS_DYNAMODB_TABLE_ACCESS_REQUESTS,
+    caching.ResponseCache(
+        "access-request-summary",
+        ttl=settings.SETTINGS.RESPONSE_CACHE_TTL,
+        size=settings.SETTINGS.RESPONSE_CACHE_SIZE,
+    ),
+)
+
 
 @router.get(r"", response_model=pagination.PaginatedResult[req_models.DataAccessRequest])
+@responses.prevalidated
 async def list_data_access_requests(
     *,
     admin: auth.User = fastapi.Depends(security.require_admin),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
     active_only: bool = True,
     limit: Optional[int] = None,
-    cursor: Optional[types.rasd.RASDIdentifier] = None,
+    cursor: Optional[str] = None,
+    newest_first: bool = False,
 ) -> pagination.PaginatedResult[req_models.DataAccessRequest]:
     """List Data Access Requests endpoint for REST API.
 
     Args:
         admin (auth.User): Currently logged in admin via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
         active_only (bool): Show only active Data Access Requests.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[types.request_id.RASDIdentifier]): Optional pagination
-            cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
+        newest_first (bool): List the most recent Data Access Requests first.
 
     Returns:
         pagination.PaginatedResult[req_models.DataAccessRequest]: Retrieved page
@@ -59,33 +80,47 @@ async def list_data_access_requests(
         active_only=active_only,
     )
 
-    # Scan Data Access Requests and Return
-    return req_crud.data_access_request.scan(
-        db_session,
-        filter=filters,
-        limit=limit,
-        cursor=cursor,
-    )
+    # Handle Cursor Errors
+    try:
+        # Scan Data Access Requests in Parallel (or Newest First) and Return
+        return req_crud.data_access_request.scan(
+            db_session,
+            filter=filters,
+            limit=limit,
+            cursor=cursor,
+            segments=settings.SETTINGS.AWS_DYNAMODB_SCAN_SEGMENTS,
+            budget=budget,
+            newest_first=newest_first,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
 
 @router.get(r"/custodian", response_model=pagination.PaginatedResult[req_models.DataAccessRequest])
+@responses.prevalidated
 async def list_data_access_requests_custodian(
     *,
     user: auth.User = fastapi.Depends(security.require_admin_or_custodian),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
     active_only: bool = True,
     limit: Optional[int] = None,
-    cursor: Optional[types.rasd.RASDIdentifier] = None,
+    cursor: Optional[str] = None,
 ) -> pagination.PaginatedResult[req_models.DataAccessRequest]:
     """List Data Access Requests (Custodian) endpoint for REST API.
 
     Args:
         user (auth.User): Currently logged in user via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
         active_only (bool): Show only active Data Access Requests.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[types.request_id.RASDIdentifier]): Optional pagination
-            cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
 
     Returns:
         pagination.PaginatedResult[req_models.DataAccessRequest]: Retrieved page
@@ -97,13 +132,23 @@ async def list_data_access_requests_custodian(
         custodian_id=user.organisation_id,  # Restrict to User's Organisation
     )
 
-    # Scan Data Access Requests
-    page = req_crud.data_access_request.scan(
-        db_session,
-        filter=filters,
-        limit=limit,
-        cursor=cursor,
-    )
+    # Handle Cursor Errors
+    try:
+        # Scan Data Access Requests
+        page = req_crud.data_access_request.scan(
+            db_session,
+            filter=filters,
+            limit=limit,
+            cursor=cursor,
+            budget=budget,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
     # Censor Details for Custodian
     req_crud.data_access_request.censor_for_custodian(user, *page.results)
@@ -113,23 +158,25 @@ async def list_data_access_requests_custodian(
 
 
 @router.get(r"/requestor", response_model=pagination.PaginatedResult[req_models.DataAccessRequest])
+@responses.prevalidated
 async def list_data_access_requests_requestor(
     *,
     user: auth.User = fastapi.Depends(security.require_user),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    budget: budgets.ReadBudget = fastapi.Depends(budgets.read_budget),  # noqa: B008
     active_only: bool = True,
     limit: Optional[int] = None,
-    cursor: Optional[types.rasd.RASDIdentifier] = None,
+    cursor: Optional[str] = None,
 ) -> pagination.PaginatedResult[req_models.DataAccessRequest]:
     """List Data Access Requests (Requestor) endpoint for REST API.
 
     Args:
         user (auth.User): Currently logged in user via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        budget (budgets.ReadBudget): Dependency injection read budget.
         active_only (bool): Show only active Data Access Requests.
         limit (Optional[int]): Optional pagination limit.
-        cursor (Optional[types.request_id.RASDIdentifier]): Optional pagination
-            cursor.
+        cursor (Optional[str]): Optional opaque pagination cursor.
 
     Returns:
         pagination.PaginatedResult[req_models.DataAccessRequest]: Retrieved page
@@ -141,13 +188,23 @@ async def list_data_access_requests_requestor(
         requestor_id=user.id,  # Restrict to User's Requests
     )
 
-    # Scan Data Access Requests and Return
-    return req_crud.data_access_request.scan(
-        db_session,
-        filter=filters,
-        limit=limit,
-        cursor=cursor,
-    )
+    # Handle Cursor Errors
+    try:
+        # Scan Data Access Requests and Return
+        return req_crud.data_access_request.scan(
+            db_session,
+            filter=filters,
+            limit=limit,
+            cursor=cursor,
+            budget=budget,
+        )
+
+    except ValueError as exc:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
 
 
 @router.get(r"/accesses", response_model=list[access.Access])
@@ -221,19 +278,55 @@ async def read_data_access_request(
     *,
     user: auth.User = fastapi.Depends(security.require_user),  # noqa: B008
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
+    response: fastapi.Response,
     pk: types.rasd.RASDIdentifier,
-) -> req_models.DataAccessRequest:
+    if_none_match: Optional[str] = fastapi.Header(None),  # noqa: B008
+) -> Union[req_models.DataAccessRequest, fastapi.Response]:
     """Read Data Access Request endpoint for REST API.
 
+    The response has a strong `ETag` derived from the revision of the Data
+    Access Request and the Organisation it is censored for (if any), and a
+    matching `If-None-Match` header is answered with `304 Not Modified`.
+
     Args:
         user (auth.User): Currently logged in user via dependency injection.
         db_session (boto3.Session): Dependency injection database session.
+        response (fastapi.Response): Response to set the headers of.
         pk (types.request_id.RASDIdentifier): Primary key of the Data Access
             Request to read.
+        if_none_match (Optional[str]): Entity tags of cached responses.
 
     Returns:
-        req_models.DataAccessRequest: Retrieved Data Access Request.
+        Union[req_models.DataAccessRequest, fastapi.Response]: Retrieved Data
+            Access Request, or an empty response if it is not modified.
     """
+    # Check Conditional Request
+    # The stored revision of the Data Access Request is read with only the
+    # attributes required to check permissions, so that an unmodified Data
+    # Access Request is answered without reading all of it. Data Access
+    # Requests without a stored revision fall through to the full read below.
+    stored = req_crud.data_access_request.get_revision(
+        db_session,
+        pk=pk,
+        attributes=["requestor_id", "custodian_ids", "active"],
+    ) if if_none_match else None
+    if stored and crud_base.REVISION_ATTRIBUTE in stored:
+        # Determine Permissions
+        is_requestor = str(user.id) == stored.get("requestor_id")
+        is_custodian = user.is_custodian() and str(user.organisation_id) in stored.get("custodian_ids", [])
+        is_censored = not user.is_admin() and not is_requestor and is_custodian
+
+        # Check Permissions and Entity Tag
+        tag = utils.etag(
+            stored[crud_base.REVISION_ATTRIBUTE],
+            stored.get("active", True),
+            user.organisation_id if is_censored else None,
+        )
+        allowed = user.is_admin() or is_requestor or is_custodian
+        if allowed and utils.etag_matches(if_none_match, tag):
+            # Not Modified
+            return utils.not_modified(tag, utils.PRIVATE_REVALIDATE)
+
     # Retrieve Data Access Request
     access_request = utils.unwrap_or_404(
         value=req_crud.data_access_request.get(db_session, pk=pk),
@@ -251,11 +344,30 @@ async def read_data_access_request(
             status_code=fastapi.status.HTTP_404_NOT_FOUND,
         )
 
+    # Calculate Entity Tag
+    # The entity tag is of the Data Access Request before it is censored, and
+    # the Organisation that it is censored for
+    is_censored = not user.is_admin() and not is_requestor and is_custodian
+    tag = utils.etag(
+        crud_base.revision(access_request),
+        access_request.active,
+        user.organisation_id if is_censored else None,
+    )
+
+    # Check Entity Tag
+    if utils.etag_matches(if_none_match, tag):
+        # Not Modified
+        return utils.not_modified(tag, utils.PRIVATE_REVALIDATE)
+
     # Check if Custodian Censoring is Required
-    if not user.is_admin() and not is_requestor and is_custodian:
+    if is_censored:
         # Censor Details for Custodian
         req_crud.data_access_request.censor_for_custodian(user, access_request)
 
+    # Set Conditional Request Headers
+    response.headers["ETag"] = tag
+    response.headers["Cache-Control"] = utils.PRIVATE_REVALIDATE
+
     # Return Data Access Request
     return access_request
 
@@ -265,21 +377,26 @@ async def read_data_access_request_summary(
     *,
     db_session: boto3.Session = fastapi.Depends(session.db_session),  # noqa: B008
     pk: types.rasd.RASDIdentifier,
-) -> req_models.DataAccessRequest:
+) -> fastapi.Response:
     """Read Data Access Request Summary endpoint for REST API.
 
+    Responses are cached by primary key (see `api.caching`), and may be cached
+    by proxies for the same lifetime.
+
     Args:
         db_session (boto3.Session): Dependency injection database session.
         pk (types.request_id.RASDIdentifier): Primary key of the Data Access
             Request to read.
 
     Returns:
-        req_schemas.DataAccessRequestSummary: Retrieved Data Access Request Summary.
+        fastapi.Response: Serialised Data Access Request Summary (see
+            `req_schemas.DataAccessRequestSummary`).
     """
-    # Retrieve and Return Data Access Request
-    # This will be automatically cast to the Non-Sensitive model by `fastapi`
-    return utils.unwrap_or_404(
-        value=req_crud.data_access_request.get(db_session, pk=pk),
+    # Retrieve or Build Response
+    # Only the attributes required for the summary are read
+    return summary_cache.respond(
+        str(pk),
+        lambda: (utils.unwrap_or_404(value=req_crud.data_access_request_summary.get(db_session, pk=pk)), {}),
     )
 
 
@@ -0,0 +1,128 @@
+"""RASD FastAPI Restricted Vocabularies REST API Endpoints.
+
+Every restricted vocabulary is served in a single bundle, which is serialised
+once at import. The bundle is versioned by a hash of its content, so that it
+can be cached indefinitely at its versioned URL, and revalidated cheaply at
+its unversioned URL.
+"""
+
+
+# Standard
+import hashlib
+
+# Third-Party
+import fastapi
+
+# Local
+from rasd_fastapi import utils
+from rasd_fastapi.models import metadata_vocabs
+from rasd_fastapi.models import requests_vocabs
+from rasd_fastapi.schemas import vocabularies as vocab_schemas
+
+# Typing
+from typing import Optional
+
+
+# Constants
+IMMUTABLE = "public, max-age=31536000, immutable"  # Versioned bundles never change
+
+# Router
+router = fastapi.APIRouter()
+
+
+def serialise() -> tuple[str, bytes]:
+    """Serialises the restricted vocabularies bundle.
+
+    Returns:
+        tuple[str, bytes]: Version and serialised bundle.
+    """
+    # Construct Vocabularies
+    metadata = vocab_schemas.MetadataVocabularies(
+        access_rights=list(metadata_vocabs.access_rights.AccessRights),
+        collection_methods=list(metadata_vocabs.collection_methods.CollectionMethod),
+        formats=list(metadata_vocabs.formats.Format),
+        keywords=list(metadata_vocabs.keywords.Keyword),
+        locations=list(metadata_vocabs.locations.Location),
+        security_classifications=list(metadata_vocabs.security_classifications.SecurityClassification),
+    )
+    access_requests = vocab_schemas.AccessRequestVocabularies(
+        accesses=list(requests_vocabs.access.Access),
+        areas=list(requests_vocabs.area.Area),
+        frequencies=list(requests_vocabs.frequency.Frequency),
+        industry_classifications=list(requests_vocabs.anzsic.IndustryClassification),
+        purposes=list(requests_vocabs.purposes.Purpose),
+        research_classifications=list(requests_vocabs.anzsrc.ResearchClassification),
+    )
+
+    # Calculate Version from Content
+    content = f"{metadata.json()}{access_requests.json()}"
+    version = hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    # Serialise and Return
+    bundle = vocab_schemas.Vocabularies(version=version, metadata=metadata, access_requests=access_requests)
+    return (version, bundle.json().encode())
+
+
+# Serialise Bundle
+VERSION, BUNDLE = serialise()
+ETAG = f'"{VERSION}"'
+
+
+@router.get(r"", response_model=vocab_schemas.Vocabularies)
+async def read_vocabularies(
+    *,
+    if_none_match: Optional[str] = fastapi.Header(None),  # noqa: B008
+) -> fastapi.Response:
+    """Read Restricted Vocabularies endpoint for REST API.
+
+    The bundle must be revalidated by clients, and a matching `If-None-Match`
+    header is answered with `304 Not Modified`.
+
+    Args:
+        if_none_match (Optional[str]): Entity tags of cached responses.
+
+    Returns:
+        fastapi.Response: Serialised bundle of every restricted vocabulary.
+    """
+    # Check Entity Tag
+    if utils.etag_matches(if_none_match, ETAG):
+        # Not Modified
+        return utils.not_modified(ETAG, utils.PUBLIC_REVALIDATE)
+
+    # Return Bundle
+    return fastapi.Response(
+        content=BUNDLE,
+        media_type="application/json",
+        headers={"ETag": ETAG, "Cache-Control": utils.PUBLIC_REVALIDATE},
+    )
+
+
+@router.get(r"/{version}", response_model=vocab_schemas.Vocabularies)
+async def read_vocabularies_version(version: str) -> fastapi.Response:
+    """Read Restricted Vocabularies Version endpoint for REST API.
+
+    The bundle is cached indefinitely by clients, as its content is identified
+    by its version.
+
+    Args:
+        version (str): Version of the bundle to read.
+
+    Raises:
+        fastapi.HTTPException: Raised if the version is not the current one.
+
+    Returns:
+        fastapi.Response: Serialised bundle of every restricted vocabulary.
+    """
+    # Check Version
+    if version != VERSION:
+        # Error
+        raise fastapi.HTTPException(
+            status_code=fastapi.status.HTTP_404_NOT_FOUND,
+        )
+
+    # Return Bundle
+    return fastapi.Response(
+        content=BUNDLE,
+        media_type="application/json",
+        headers={"ETag": ETAG, "Cache-Control": IMMUTABLE},
+    )
@@ -10,10 +10,10 @@ import string
 import uuid
 
 # Third-Party
-import boto3
 import pydantic
 
 # Local
+from rasd_fastapi.core import aws
 from rasd_fastapi.core import settings
 from rasd_fastapi.schemas import auth as auth_schemas
 
@@ -259,19 +259,13 @@ def forgot_password_confirm(
 
 
 def cognito_client() -> "CognitoIdentityProviderClient":
-    """Constructs a configured and authenticated Cognito client.
+    """Retrieves the shared configured and authenticated Cognito client.
 
     Returns:
         CognitoIdentityProviderClient: Configured and authenticated client.
     """
-    # Instantiate and Return AWS Client
-    return boto3.client(
-        "cognito-idp",
-        region_name=settings.SETTINGS.AWS_DEFAULT_REGION,
-        aws_access_key_id=settings.SETTINGS.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.SETTINGS.AWS_SECRET_ACCESS_KEY,
-        aws_session_token=settings.SETTINGS.AWS_SESSION_TOKEN,
-    )
+    # Retrieve and Return AWS Client
+    return aws.REGISTRY.client("cognito-idp")  # type: ignore[no-any-return]
 
 
 def temporary_password() -> pydantic.SecretStr:
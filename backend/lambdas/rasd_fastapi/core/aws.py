@@ -0,0 +1,242 @@
+"""RASD FastAPI AWS Sessions, Resources and Clients."""
+
+
+# Standard
+import concurrent.futures
+import threading
+
+# Third-Party
+import boto3
+import botocore.config
+
+# Local
+from rasd_fastapi.core import settings
+
+# Typing
+from typing import Any, Optional
+
+
+# Constants
+CREDENTIAL_ERRORS = {  # Error codes returned by AWS for expired or rotated credentials
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "InvalidClientTokenId",
+    "UnrecognizedClientException",
+}
+
+
+class Registry:
+    """Process-wide registry of AWS sessions, resources, tables and clients.
+
+    Constructing `boto3` sessions, resources and clients is one of the largest
+    costs of handling a request on a warm Lambda, so they are constructed once
+    per process and re-used across invocations instead.
+
+    Sessions and clients are thread-safe once constructed, so they are shared
+    between all threads (and constructed under a lock). Resources (and their
+    tables) are *not* thread-safe, so they are cached per thread.
+
+    If the credentials are rotated, then `reset` must be called so that the
+    settings are reloaded and everything is re-constructed with the new
+    credentials.
+    """
+
+    def __init__(self) -> None:
+        """Instantiates the registry."""
+        # Instance Variables
+        self.lock = threading.RLock()
+        self.local = threading.local()
+        self.generation = 0
+        self.session_: Optional[boto3.Session] = None
+        self.clients: dict[str, Any] = {}
+        self.executor_: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @property
+    def config(self) -> botocore.config.Config:
+        """Constructs the client configuration.
+
+        Returns:
+            botocore.config.Config: Client configuration with a connection pool
+                large enough for parallel scans and TCP keep-alive enabled.
+        """
+        # Construct and Return Configuration
+        return botocore.config.Config(
+            max_pool_connections=settings.SETTINGS.AWS_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            retries={"mode": "standard"},
+        )
+
+    def session(self) -> boto3.Session:
+        """Retrieves the shared authenticated boto3 session.
+
+        Returns:
+            boto3.Session: Authenticated boto3 session.
+        """
+        # Lock
+        with self.lock:
+            # Check for Session
+            if self.session_ is None:
+                # Construct Session
+                self.session_ = boto3.Session(
+                    region_name=settings.SETTINGS.AWS_DEFAULT_REGION,
+                    aws_access_key_id=settings.SETTINGS.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.SETTINGS.AWS_SECRET_ACCESS_KEY,
+                    aws_session_token=settings.SETTINGS.AWS_SESSION_TOKEN,
+                )
+
+            # Return
+            return self.session_
+
+    def client(self, service_name: str, db_session: Optional[boto3.Session] = None) -> Any:
+        """Retrieves the shared client for an AWS service.
+
+        Clients are only shared for the shared session. If another session is
+        supplied, then a new client is constructed for it.
+
+        Args:
+            service_name (str): Name of the AWS service (e.g., `sesv2`).
+            db_session (Optional[boto3.Session]): Optional session to use.
+
+        Returns:
+            Any: Configured and authenticated client.
+        """
+        # Check for Another Session
+        if db_session is not None and db_session is not self.session():
+            # Construct Unshared Client
+            return db_session.client(service_name, config=self.config)  # type: ignore[call-overload]
+
+        # Lock
+        with self.lock:
+            # Check for Client
+            if service_name not in self.clients:
+                # Construct Client
+                client = self.session().client(service_name, config=self.config)  # type: ignore[call-overload]
+                self.clients[service_name] = client
+
+            # Return
+            return self.clients[service_name]
+
+    def resource(self, service_name: str, db_session: Optional[boto3.Session] = None) -> Any:
+        """Retrieves the resource for an AWS service for the current thread.
+
+        Resources are only cached for the shared session. If another session
+        is supplied, then a new resource is constructed for it.
+
+        Args:
+            service_name (str): Name of the AWS service (e.g., `dynamodb`).
+            db_session (Optional[boto3.Session]): Optional session to use.
+
+        Returns:
+            Any: Configured and authenticated resource.
+        """
+        # Check for Another Session
+        if db_session is not None and db_session is not self.session():
+            # Construct Uncached Resource
+            return db_session.resource(service_name, config=self.config)  # type: ignore[call-overload]
+
+        # Retrieve Resources for the Current Thread
+        resources, _ = self.thread_cache()
+
+        # Check for Resource
+        if service_name not in resources:
+            # Construct Resource
+            # Construction is locked, as the session is not thread-safe
+            with self.lock:
+                resource = self.session().resource(service_name, config=self.config)  # type: ignore[call-overload]
+                resources[service_name] = resource
+
+        # Return
+        return resources[service_name]
+
+    def table(self, name: str, db_session: Optional[boto3.Session] = None) -> Any:
+        """Retrieves a DynamoDB table for the current thread.
+
+        Tables are only cached for the shared session. If another session is
+        supplied, then a new table is constructed for it.
+
+        Args:
+            name (str): Name of the DynamoDB table.
+            db_session (Optional[boto3.Session]): Optional session to use.
+
+        Returns:
+            Any: DynamoDB table.
+        """
+        # Check for Another Session
+        if db_session is not None and db_session is not self.session():
+            # Construct Uncached Table
+            return self.resource("dynamodb", db_session).Table(name)
+
+        # Retrieve Tables for the Current Thread
+        _, tables = self.thread_cache()
+
+        # Check for Table
+        if name not in tables:
+            # Construct Table
+            tables[name] = self.resource("dynamodb").Table(name)
+
+        # Return
+        return tables[name]
+
+    def thread_cache(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Retrieves the resources and tables cached for the current thread.
+
+        The cache is discarded if the registry has been reset since it was
+        created.
+
+        Returns:
+            tuple[dict[str, Any], dict[str, Any]]: Resources and tables cached
+                for the current thread.
+        """
+        # Check Generation
+        if getattr(self.local, "generation", None) != self.generation:
+            # Discard Cache
+            self.local.generation = self.generation
+            self.local.resources = {}
+            self.local.tables = {}
+
+        # Return
+        return self.local.resources, self.local.tables
+
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Retrieves the shared thread pool for concurrent requests.
+
+        The threads of the pool are re-used across invocations, so that the
+        resources and tables cached for each thread are re-used as well.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: Shared thread pool.
+        """
+        # Lock
+        with self.lock:
+            # Check for Executor
+            if self.executor_ is None:
+                # Construct Executor
+                self.executor_ = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=settings.SETTINGS.AWS_MAX_POOL_CONNECTIONS,
+                    thread_name_prefix="aws",
+                )
+
+            # Return
+            return self.executor_
+
+    def reset(self) -> None:
+        """Resets the registry, such as after a credential rotation.
+
+        The settings are reloaded (see `settings.load`), so that the rotated
+        credentials are used. The shared session and clients are discarded
+        immediately, and the resources and tables cached for each thread are
+        discarded the next time that thread uses the registry.
+        """
+        # Lock
+        with self.lock:
+            # Reload Settings
+            settings.SETTINGS = settings.load()
+
+            # Reset
+            self.session_ = None
+            self.clients = {}
+            self.generation += 1
+
+
+# Instantiate Registry Singleton
+REGISTRY = Registry()
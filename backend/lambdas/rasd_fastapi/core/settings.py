@@ -12,17 +12,29 @@ from typing import Optional
 
 secret_name = os.environ.get("RASD_SECRETS_NAME")
 
-sm_client = boto3.client('secretsmanager')
-
-# ARN
-try:
-    response = sm_client.get_secret_value(SecretId=secret_name)
-    secrets = json.loads(response['SecretString'])
-    print("type of secrets from arn:", type(secrets))
-    print(secrets.keys())
-except Exception as e:
-    secrets = {}
-    print("Error retrieving secret in ARN:", e)
+sm_client = boto3.client("secretsmanager")
+
+
+def retrieve_secrets() -> dict[str, str]:
+    """Retrieves the secrets of the RASD Backend from AWS Secrets Manager.
+
+    Returns:
+        dict[str, str]: Retrieved secrets, or empty if they could not be
+            retrieved.
+    """
+    # ARN
+    try:
+        response = sm_client.get_secret_value(SecretId=secret_name)
+        secrets = json.loads(response["SecretString"])
+        print("type of secrets from arn:", type(secrets))
+        print(secrets.keys())
+    except Exception as e:
+        secrets = {}
+        print("Error retrieving secret in ARN:", e)
+
+    # Return
+    return secrets  # type: ignore[no-any-return]
+
 
 class Settings(pydantic.BaseSettings):
     """Settings for the RASD Backend."""
@@ -39,18 +51,49 @@ class Settings(pydantic.BaseSettings):
     AWS_SECRET_ACCESS_KEY: str
     AWS_SESSION_TOKEN: Optional[str] = None
     AWS_DEFAULT_REGION: str = "ap-southeast-2"
+    AWS_MAX_POOL_CONNECTIONS: int = 32
 
     # AWS DynamoDB Settings
     AWS_DYNAMODB_TABLE_METADATA: str = "Metadata"
+    AWS_DYNAMODB_TABLE_CATALOGUE: str = "Catalogue"  # Holds the catalogue version of the Metadata
     AWS_DYNAMODB_TABLE_ORGANISATIONS: str = "Organisations"
     AWS_DYNAMODB_TABLE_REGISTRATIONS: str = "Registrations"
     AWS_DYNAMODB_TABLE_ACCESS_REQUESTS: str = "DataAccessRequests"
+    AWS_DYNAMODB_TABLE_ACCESS_REQUEST_CUSTODIANS: str = "DataAccessRequestCustodians"
+    AWS_DYNAMODB_SCAN_SEGMENTS: int = 4
+    AWS_DYNAMODB_TRUSTED_LOADS: bool = True
+    AWS_DYNAMODB_TRUSTED_LOADS_VERIFY: float = pydantic.Field(0.01, ge=0, le=1)
+    AWS_DYNAMODB_READ_BUDGET_ITEMS: Optional[int] = 10_000  # Items evaluated per request
+    AWS_DYNAMODB_READ_BUDGET_CAPACITY: Optional[float] = 500  # Read capacity units per request
+    AWS_DYNAMODB_READ_BUDGET_SECONDS: float = 20  # Less than the AWS API Gateway timeout
+    AWS_DYNAMODB_READ_BUDGET_MARGIN: float = 2  # Seconds reserved to return the response
 
     # AWS Cognito Settings
     AWS_COGNITO_POOL_ID: str
     AWS_COGNITO_CLIENT_ID: str
     AWS_COGNITO_CLIENT_SECRET_KEY: str
 
+    # Pagination Settings
+    CURSOR_SECRET_KEY: Optional[str] = None  # Defaults to a key derived from the AWS Cognito client secret
+
+    # Search Settings
+    SEARCH_RANKED_INDEX_TTL: float = 300  # Seconds before the in-memory ranked index is rebuilt
+    SEARCH_REBUILD_GRACE_SECONDS: float = 30  # Seconds a stale index is served for before searches wait for its rebuild
+    SEARCH_SNAPSHOT_DIRECTORY: Optional[str] = None  # Defaults to the temporary directory
+    SEARCH_SNAPSHOT_CHECK_SECONDS: float = 10  # Seconds between checks of the catalogue version
+    SEARCH_RESULT_CACHE_SIZE: int = 100_000  # Maximum IDs held across all cached search result sets
+    SEARCH_RESULT_CACHE_TTL: float = 60  # Seconds before a cached search result set expires
+
+    # Read Cache Settings
+    CACHE_ORGANISATIONS_TTL: Optional[float] = 60  # Seconds that Organisations are cached for, or None to disable
+    CACHE_ORGANISATIONS_SIZE: int = 1024  # Maximum number of cached Organisations
+    CACHE_METADATA_TTL: Optional[float] = 10  # Seconds that Metadata are cached for, or None to disable
+    CACHE_METADATA_SIZE: int = 1024  # Maximum number of cached Metadata
+
+    # Response Cache Settings
+    RESPONSE_CACHE_TTL: float = 30  # Seconds that public responses are cached for (keep short, bounds staleness)
+    RESPONSE_CACHE_SIZE: int = 16 * 1024 * 1024  # Maximum bytes of responses held by each response cache
+
     # AWS SES Settings
     EMAIL_FROM_NAME: str = "RASD"
     EMAIL_FROM_ADDRESS: str = "noreply@mail.develop.gaiadev.net.au"
@@ -67,6 +110,19 @@ class Settings(pydantic.BaseSettings):
     RASD_SUPPORT_EMAIL: str = "info@rasd.org.au"
 
 
+def load() -> Settings:
+    """Loads the settings from the secrets and the environment.
+
+    This is performed at import, and again whenever the secrets may have been
+    rotated (see `aws.Registry.reset`).
+
+    Returns:
+        Settings: Loaded settings.
+    """
+    # Load and Return
+    os.environ.update(retrieve_secrets())  # Add secrets to environment
+    return Settings()  # type: ignore[call-arg]
+
+
 # Instantiate Settings
-os.environ.update(secrets)  # Add secrets to environment
-SETTINGS = Settings()  # type: ignore[call-arg]
+SETTINGS = load()
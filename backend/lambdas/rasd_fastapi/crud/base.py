@@ -1,26 +1,56 @@
 """RASD FastAPI CRUD Base."""
 
 
+# Standard
+import functools
+import hashlib
+import json
+import operator
+import random
+import time
+
 # Third-Party
 import boto3
 import boto3.dynamodb.conditions
 import fastapi.encoders
+import pydantic
 
 # Local
-from rasd_fastapi.models import base as models_base
+from rasd_fastapi.core import aws
+from rasd_fastapi.core import settings
+from rasd_fastapi.db import budgets
+from rasd_fastapi.db import cache
+from rasd_fastapi.db import codec
+from rasd_fastapi.db import cursors
+from rasd_fastapi.db import trusted
 from rasd_fastapi.schemas import base as schemas_base
 from rasd_fastapi.schemas import pagination
 
 # Typing
-from typing import Any, Optional, Generic, TypeVar
+from typing import Any, Callable, Optional, Generic, Sequence, TypeVar, Union
 
 
 # TypeVars
-ModelType = TypeVar("ModelType", bound=models_base.BaseModel)
+ModelType = TypeVar("ModelType", bound=pydantic.BaseModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=schemas_base.BaseSchema)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=schemas_base.BaseSchema)
 PrimaryKeyType = TypeVar("PrimaryKeyType")
 
+# Constants
+BATCH_GET_SIZE = 100  # Maximum number of keys in a `BatchGetItem` request
+BATCH_GET_ATTEMPTS = 8
+BATCH_GET_BACKOFF = 0.05  # Seconds
+ORDER_INDEX = "CreatedIndex"  # Secondary index for listing items newest first
+ORDER_PARTITION_KEY = "listing"
+ORDER_PARTITION = "all"  # Every item of an ordered CRUD shares one partition
+ORDER_SORT_KEY = "created_at"
+REVISION_ATTRIBUTE = "revision"  # Content hash of an item, stored by CRUDs with revisions
+
+# Shortcuts
+# The position of a segment in a parallel scan is either not yet started
+# (`None`), in progress (the key to continue from) or finished (`False`)
+SegmentPosition = Union[None, dict[str, Any], bool]
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKeyType]):
     """CRUD Base Abstraction."""
@@ -33,6 +63,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
         model: type[ModelType],
         table: str,
         pk: str,
+        indexes: Optional[dict[str, str]] = None,
+        projected: bool = False,
+        client: bool = False,
+        ordered: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        revisions: bool = False,
     ) -> None:
         """Instantiates the CRUD abstraction.
 
@@ -43,33 +80,82 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
             model (type[ModelType]): CRUD model.
             table (str): Table that the model is in.
             pk (str): Primary key of the table.
+            indexes (Optional[dict[str, str]]): Mapping of attribute names to
+                the secondary indexes that have them as their partition key.
+            projected (bool): Whether to only read the attributes required by
+                the model from the database. This allows a smaller schema (such
+                as a summary) to be used as the model of a read-only CRUD.
+            client (bool): Whether to use the low-level DynamoDB client with
+                the fast item codec (see `codec`), rather than the resource API.
+                This is most beneficial for models with large nested items.
+            ordered (bool): Whether the table has the `CreatedIndex` secondary
+                index, with a partition shared by every item and `created_at`
+                as its sort key. This allows items to be listed newest first
+                with a single `query` (see `query_ordered`).
+            cache_ttl (Optional[float]): Seconds that items read by their
+                primary key are cached in memory for (see `db.cache`), or None
+                to always read them from the database.
+            cache_size (int): Maximum number of items to cache.
+            revisions (bool): Whether to store the revision of each item (see
+                `revision`) when it is written. This allows the revision to be
+                checked with a projected read (see `get_revision`), such as
+                when answering conditional requests.
         """
         # Instance Variables
         self.model = model
         self.table = table
         self.pk = pk
+        self.indexes = indexes or {}
+        self.client = client
+        self.ordered = ordered
+        self.revisions = revisions
+        self.cache: Optional[cache.ReadCache[ModelType]] = None
+
+        # Read-Through Cache
+        if cache_ttl is not None:
+            read_cache = cache.ReadCache[ModelType](f"{table}:{model.__name__}", cache_ttl, cache_size)
+            self.cache = cache.register(table, read_cache)
+
+        # Key Attributes
+        # These are the attributes of any key that a cursor may continue from
+        self.keys = [pk, *self.indexes, *([ORDER_PARTITION_KEY, ORDER_SORT_KEY] if ordered else [])]
+
+        # Projected Attributes
+        # The key attributes are always read, as they are required for pagination
+        self.attributes = [*self.keys, *(f.alias for f in model.__fields__.values())] if projected else None
 
     def get(
         self,
         db_session: boto3.Session,
         *,
         pk: PrimaryKeyType,
+        cached: bool = True,
     ) -> Optional[ModelType]:
         """Retrieves an item from the database using its primary key.
 
+        Reads that a write is based on should not be `cached`, as the cached
+        item may be older than the item in the database. These bypass the
+        cache, and are strongly consistent.
+
         Args:
             db_session (boto3.Session): Database session to use.
             pk (PrimaryKeyType): Primary key for item to retrieve.
+            cached (bool): Whether the item can be retrieved from the cache.
 
         Returns:
             Optional[ModelType]: Retrieved item if it exists, else None.
         """
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
+        # Check Cache
+        generation = self.cache.generation if self.cache else 0
+        if cached and self.cache and (cached_item := self.cache.get(str(pk))):
+            return cached_item
+
+        # Retrieve Table
+        table = self.get_table(db_session)
 
         # Retrieve Raw Item from Database
-        response = table.get_item(Key={self.pk: str(pk)})
+        consistency = {} if cached else {"ConsistentRead": True}
+        response = table.get_item(Key={self.pk: str(pk)}, **consistency, **self.projection())
         item = response.get("Item")
 
         # Check if Item Exists
@@ -77,83 +163,740 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
             return None
 
         # Parse from Raw Item
-        model = self.model.parse_obj(item)
+        model = self.load(item)
+
+        # Cache Item
+        if self.cache:
+            self.cache.put(str(pk), model, generation)
 
         # Return
         return model
 
+    def get_revision(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: PrimaryKeyType,
+        attributes: Sequence[str] = (),
+    ) -> Optional[dict[str, Any]]:
+        """Retrieves the stored revision of an item with a projected read.
+
+        Only the primary key, the revision and the supplied attributes of the
+        item are read. The revision is missing if the item was written before
+        the CRUD stored revisions.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (PrimaryKeyType): Primary key for item to retrieve.
+            attributes (Sequence[str]): Other attributes to retrieve, such as
+                those required to check permissions.
+
+        Returns:
+            Optional[dict[str, Any]]: Retrieved raw attributes if the item
+                exists, else None.
+        """
+        # Retrieve Table
+        table = self.get_table(db_session)
+
+        # Construct Projection
+        names = {f"#p{i}": a for (i, a) in enumerate(dict.fromkeys([self.pk, REVISION_ATTRIBUTE, *attributes]))}
+
+        # Retrieve Raw Attributes from Database
+        response = table.get_item(
+            Key={self.pk: str(pk)},
+            ProjectionExpression=", ".join(names),
+            ExpressionAttributeNames=names,
+        )
+
+        # Return
+        return response.get("Item")  # type: ignore[no-any-return]
+
+    def get_many(
+        self,
+        db_session: boto3.Session,
+        *,
+        pks: Sequence[PrimaryKeyType],
+        budget: Optional[budgets.ReadBudget] = None,
+        cached: bool = True,
+    ) -> list[Optional[ModelType]]:
+        """Retrieves multiple items from the database using their primary keys.
+
+        The items are retrieved with `BatchGetItem` requests of up to 100 keys
+        at a time, rather than one `GetItem` request per key. DynamoDB may not
+        process every key in a batch (e.g., when throttled), in which case the
+        unprocessed keys are retried with exponential backoff. Only the keys
+        that aren't cached are retrieved, if the CRUD is cached and the items
+        can be `cached` (see `get`).
+
+        Every supplied key is always retrieved, so callers that read many keys
+        within a budget should do so in batches, checking the budget between
+        them.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pks (Sequence[PrimaryKeyType]): Primary keys for items to retrieve.
+            budget (Optional[budgets.ReadBudget]): Optional read budget, which
+                is charged for the items retrieved from the database.
+            cached (bool): Whether the items can be retrieved from the cache.
+
+        Raises:
+            RuntimeError: Raised if the items could not all be retrieved.
+
+        Returns:
+            list[Optional[ModelType]]: Retrieved items in the same order as the
+                supplied primary keys, with None for items that don't exist.
+        """
+        # Retrieve Cached Items
+        # Every occurrence of a key is retrieved as its own copy
+        generation = self.cache.generation if self.cache else 0
+        found = [self.cache.get(str(pk)) if self.cache and cached else None for pk in pks]
+
+        # Retrieve Resource
+        resource = self.get_resource(db_session)
+
+        # Remove Cached and Duplicate Keys
+        # `BatchGetItem` rejects requests containing duplicate keys
+        keys = list(dict.fromkeys(str(pk) for (pk, model) in zip(pks, found) if model is None))
+
+        # Construct Keyword Args for Budget and Consistency
+        budgeted = budget.request() if budget else {}
+        consistency: dict[str, Any] = {} if cached else {"ConsistentRead": True}
+
+        # Retrieve Raw Items from Database in Batches
+        items: dict[str, dict[str, Any]] = {}
+        for i in range(0, len(keys), BATCH_GET_SIZE):
+            # Construct Request for Batch
+            request = {
+                self.table: {
+                    "Keys": [{self.pk: k} for k in keys[i:i + BATCH_GET_SIZE]],
+                    **consistency,
+                    **self.projection(),
+                },
+            }
+
+            # Loop until all keys in the batch have been processed
+            for attempt in range(BATCH_GET_ATTEMPTS):
+                # Check for Retry
+                if attempt:
+                    # Exponential backoff with full jitter
+                    time.sleep(random.uniform(0, BATCH_GET_BACKOFF * 2 ** attempt))
+
+                # Retrieve Batch
+                response = resource.batch_get_item(RequestItems=request, **budgeted)
+                items |= {str(item[self.pk]): item for item in response["Responses"].get(self.table, [])}
+
+                # Charge Budget
+                if budget:
+                    budget.charge(response)
+
+                # Check for Unprocessed Keys
+                if not (request := response.get("UnprocessedKeys")):
+                    break
+
+            else:
+                # Error
+                raise RuntimeError(f"Unable to retrieve all items from '{self.table}'")
+
+        # Parse Models from Raw Items in Order
+        models = [
+            model if model is not None else (self.load(items[str(pk)]) if str(pk) in items else None)
+            for (pk, model) in zip(pks, found)
+        ]
+
+        # Cache Retrieved Items
+        if self.cache:
+            for (pk, model) in zip(pks, models):
+                if model is not None and str(pk) in items:
+                    self.cache.put(str(pk), model, generation)
+
+        # Return
+        return models
+
     def scan(
         self,
         db_session: boto3.Session,
         *,
         filter: Optional[boto3.dynamodb.conditions.ConditionBase] = None,  # noqa: A002
         limit: Optional[int] = None,
-        cursor: Optional[PrimaryKeyType] = None,
+        cursor: Optional[str] = None,
+        segments: Optional[int] = None,
+        budget: Optional[budgets.ReadBudget] = None,
+        newest_first: bool = False,
+        consistent: bool = False,
     ) -> pagination.PaginatedResult[ModelType]:
         """Scans for items in the database matching the supplied filters.
 
+        If `newest_first` is supplied, then the items are listed in descending
+        order of creation with a `query` on the created index instead (see
+        `query_ordered`).
+
+        Otherwise, if the supplied filter requires an attribute to equal a
+        value, and that attribute is backed by a secondary index, then the scan
+        is automatically routed to a `query` on that index instead. This means
+        that we only pay for reading the matching items rather than reading
+        the entire table. Secondary indexes can't be read consistently, so
+        `consistent` scans are never routed to them.
+
+        Otherwise, if `segments` is supplied then the table is scanned as a
+        parallel scan (see `scan_parallel`).
+
+        In every case the `cursor` is an opaque signed string (see `cursors`),
+        and is only valid for the same filter and ordering it was returned for.
+
         Args:
             db_session (boto3.Session): Database session to use.
             filter (Optional[boto3.dynamodb.conditions.ConditionBase]): Optional
                 filters to use.
             limit (Optional[int]): Number of items to limit to.
-            cursor (Optional[PrimaryKeyType]): Cursor for pagination.
+            cursor (Optional[str]): Opaque cursor for pagination.
+            segments (Optional[int]): Optional number of parallel segments.
+            budget (Optional[budgets.ReadBudget]): Optional read budget. If it
+                is exhausted, then a partial page is returned.
+            newest_first (bool): Whether to list the items newest first. The
+                created index is never read consistently.
+            consistent (bool): Whether to scan the table with strongly
+                consistent reads, which cost twice as much.
+
+        Raises:
+            ValueError: Raised if the cursor is invalid.
 
         Returns:
             list[ModelType]: List of retrieved items if applicable.
         """
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
+        # Check whether an ordered listing was requested
+        if newest_first:
+            # Query the created index instead
+            return self.query_ordered(
+                db_session,
+                filter=filter,
+                limit=limit,
+                cursor=cursor,
+                budget=budget,
+            )
+
+        # Check whether the filter can be served by a secondary index
+        key, value, remaining = self.split_key_condition(filter)
+        if key and not consistent:
+            # Query the secondary index instead
+            return self.query(
+                db_session,
+                key=key,
+                value=value,
+                filter=remaining,
+                limit=limit,
+                cursor=cursor,
+                budget=budget,
+            )
+
+        # Check whether a parallel scan was requested
+        if segments and segments > 1:
+            # Scan the table in parallel segments instead
+            return self.scan_parallel(
+                db_session,
+                filter=filter,
+                limit=limit,
+                cursor=cursor,
+                segments=segments,
+                budget=budget,
+                consistent=consistent,
+            )
+
+        # Retrieve Table
+        table = self.get_table(db_session)
 
         # Construct Keyword Args for Scan
         filters = {"FilterExpression": filter} if filter else {}
-        start_key = {"ExclusiveStartKey": {self.pk: str(cursor)}} if cursor else {}
+        options = {"ConsistentRead": True} if consistent else {}
+        start_key = cursors.decode_key(cursor, [self.pk]) if cursor else None
 
         # Scan the Database
-        response = table.scan(
-            **filters,  # type: ignore[arg-type]
-            **start_key,  # type: ignore[arg-type]
+        items, last_key = self.paginate(
+            table.scan,
+            keys=[self.pk],
+            limit=limit,
+            start_key=start_key,
+            budget=budget,
+            **filters,
+            **options,
+            **self.projection(),
+        )
+
+        # Parse Models from Raw Items
+        models = [self.load(obj) for obj in items]
+
+        # Construct Paginated Result
+        page = pagination.PaginatedResult(
+            count=len(models),
+            cursor=cursors.encode(last_key) if last_key else None,
+            results=models,
         )
 
-        # Check if we need to keep scanning
-        while limit and response["Count"] < limit and "LastEvaluatedKey" in response:
-            # We need to keep scanning!
-            next_response = table.scan(
-                **filters,  # type: ignore[arg-type]
-                ExclusiveStartKey=response["LastEvaluatedKey"],
+        # Return
+        return page
+
+    def scan_all(
+        self,
+        db_session: boto3.Session,
+        *,
+        filter: Optional[boto3.dynamodb.conditions.ConditionBase] = None,  # noqa: A002
+        segments: Optional[int] = None,
+        consistent: bool = False,
+    ) -> list[ModelType]:
+        """Scans for every item in the database matching the supplied filter.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            filter (Optional[boto3.dynamodb.conditions.ConditionBase]): Filter.
+            segments (Optional[int]): Optional number of parallel scan segments.
+            consistent (bool): Whether to scan with strongly consistent reads.
+
+        Returns:
+            list[ModelType]: All matching items in the database.
+        """
+        # Loop through all pages
+        results: list[ModelType] = []
+        cursor = None
+        while True:
+            # Scan a page of items
+            page = self.scan(db_session, filter=filter, cursor=cursor, segments=segments, consistent=consistent)
+            results += page.results
+
+            # Check for next page
+            if not (cursor := page.cursor):
+                return results
+
+    def scan_parallel(
+        self,
+        db_session: boto3.Session,
+        *,
+        filter: Optional[boto3.dynamodb.conditions.ConditionBase] = None,  # noqa: A002
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        segments: int,
+        budget: Optional[budgets.ReadBudget] = None,
+        consistent: bool = False,
+    ) -> pagination.PaginatedResult[ModelType]:
+        """Scans for items in the database using a parallel scan.
+
+        The table is divided into `segments` using the DynamoDB `Segment` and
+        `TotalSegments` parameters, and each segment is scanned concurrently in
+        a thread pool. The `limit` is divided as evenly as possible between the
+        unfinished segments, and the results are merged in segment order.
+
+        As each segment is scanned independently, the returned cursor encodes
+        the position of *every* segment (see `encode_segments_cursor`).
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            filter (Optional[boto3.dynamodb.conditions.ConditionBase]): Optional
+                filters to use.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+            segments (int): Number of parallel segments.
+            budget (Optional[budgets.ReadBudget]): Optional read budget, which
+                is shared between the segments.
+            consistent (bool): Whether to scan with strongly consistent reads.
+
+        Raises:
+            ValueError: Raised if the cursor is invalid.
+
+        Returns:
+            pagination.PaginatedResult[ModelType]: Page of retrieved items.
+        """
+        # Decode Segment Positions
+        positions = decode_segments_cursor(cursor, segments, [self.pk]) if cursor else [None] * segments
+
+        # Divide the Limit between the Unfinished Segments
+        # If there is no limit, then each segment reads a single page
+        unfinished = [i for (i, p) in enumerate(positions) if p is not False]
+        limits: list[Optional[int]] = [None if not limit else 0] * segments
+        for (n, i) in enumerate(unfinished):
+            limits[i] = limit // len(unfinished) + (n < limit % len(unfinished)) if limit else None
+
+        # Construct Keyword Args for Scan
+        filters = {"FilterExpression": filter} if filter else {}
+        options = {"ConsistentRead": True} if consistent else {}
+
+        # Construct Scan Function for a Single Segment
+        def scan_segment(segment: int) -> tuple[list[dict[str, Any]], SegmentPosition]:
+            # Retrieve Position and Limit
+            position = positions[segment]
+            segment_limit = limits[segment]
+
+            # Check whether this segment needs to be scanned
+            # A segment is skipped if it is finished, or has no share of the limit
+            if position is False or segment_limit == 0:
+                return [], position
+
+            # Retrieve Table
+            # `boto3` resources are not thread-safe, so each thread of the
+            # shared thread pool has its own table.
+            table = self.get_table(db_session)
+
+            # Scan the Segment
+            items, last_key = self.paginate(
+                table.scan,
+                keys=[self.pk],
+                limit=segment_limit,
+                start_key=position if isinstance(position, dict) else None,
+                budget=budget,
+                Segment=segment,
+                TotalSegments=segments,
+                **filters,
+                **options,
+                **self.projection(),
             )
 
-            # Add the new results into the original response
-            response["Count"] += next_response["Count"]
-            response["Items"] += next_response["Items"]
-            response["LastEvaluatedKey"] = next_response["LastEvaluatedKey"]
+            # Return Items and Next Position
+            # A segment without a last evaluated key is finished
+            return items, last_key or False
 
-        # Check if we went over the limit
-        if limit and response["Count"] > limit:
-            # Truncate the response
-            response["Count"] = limit
-            response["Items"] = response["Items"][:limit]
-            response["LastEvaluatedKey"] = {self.pk: response["Items"][-1][self.pk]}
-
-        # Extract Data
-        count = response["Count"]
-        items = response["Items"]
-        next_cursor = response.get("LastEvaluatedKey", {}).get(self.pk)
+        # Scan the Segments in Parallel
+        results = list(aws.REGISTRY.executor().map(scan_segment, range(segments)))
+
+        # Merge Results
+        items = [item for (segment_items, _) in results for item in segment_items]
+        positions = [position for (_, position) in results]
+
+        # Parse Models from Raw Items
+        models = [self.load(obj) for obj in items]
+
+        # Construct Paginated Result
+        # There is no next cursor once every segment is finished
+        page = pagination.PaginatedResult(
+            count=len(models),
+            cursor=encode_segments_cursor(positions) if any(p is not False for p in positions) else None,
+            results=models,
+        )
+
+        # Return
+        return page
+
+    def query(
+        self,
+        db_session: boto3.Session,
+        *,
+        key: str,
+        value: Any,
+        filter: Optional[boto3.dynamodb.conditions.ConditionBase] = None,  # noqa: A002
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        budget: Optional[budgets.ReadBudget] = None,
+    ) -> pagination.PaginatedResult[ModelType]:
+        """Queries for items in the database using a secondary index.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            key (str): Indexed attribute to query on.
+            value (Any): Value that the indexed attribute must equal.
+            filter (Optional[boto3.dynamodb.conditions.ConditionBase]): Optional
+                filters to use.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+            budget (Optional[budgets.ReadBudget]): Optional read budget.
+
+        Raises:
+            ValueError: Raised if the attribute is not backed by an index, or
+                if the cursor is invalid.
+
+        Returns:
+            pagination.PaginatedResult[ModelType]: Page of retrieved items.
+        """
+        # Check Index
+        if key not in self.indexes:
+            # Error
+            raise ValueError(f"Attribute '{key}' is not backed by a secondary index")
+
+        # Retrieve Table
+        table = self.get_table(db_session)
+
+        # Construct Keyword Args for Query
+        filters = {"FilterExpression": filter} if filter else {}
+        # The exclusive start key for a secondary index contains both the table
+        # primary key *and* the index key, which must match the queried value.
+        start_key = decode_start_key(cursor, [self.pk, key], key, value) if cursor else None
+
+        # Query the Database
+        items, last_key = self.paginate(
+            table.query,
+            keys=[self.pk, key],
+            limit=limit,
+            start_key=start_key,
+            budget=budget,
+            IndexName=self.indexes[key],
+            KeyConditionExpression=boto3.dynamodb.conditions.Key(key).eq(value),
+            **filters,
+            **self.projection(),
+        )
+
+        # Parse Models from Raw Items
+        models = [self.load(obj) for obj in items]
+
+        # Construct Paginated Result
+        page = pagination.PaginatedResult(
+            count=len(models),
+            cursor=cursors.encode(last_key) if last_key else None,
+            results=models,
+        )
+
+        # Return
+        return page
+
+    def query_ordered(
+        self,
+        db_session: boto3.Session,
+        *,
+        filter: Optional[boto3.dynamodb.conditions.ConditionBase] = None,  # noqa: A002
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        budget: Optional[budgets.ReadBudget] = None,
+    ) -> pagination.PaginatedResult[ModelType]:
+        """Queries for items in the database newest first.
+
+        Every item of an ordered CRUD is written with the same partition key in
+        the created index, which has `created_at` as its sort key. Reading the
+        index backwards returns the most recent items first with a single
+        bounded `query`, instead of scanning and sorting the entire table.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            filter (Optional[boto3.dynamodb.conditions.ConditionBase]): Optional
+                filters to use.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+            budget (Optional[budgets.ReadBudget]): Optional read budget.
+
+        Raises:
+            ValueError: Raised if the CRUD is not ordered, or if the cursor is
+                invalid.
+
+        Returns:
+            pagination.PaginatedResult[ModelType]: Page of retrieved items.
+        """
+        # Check Ordered
+        if not self.ordered:
+            # Error
+            raise ValueError(f"Table '{self.table}' does not support ordered listing")
+
+        # Retrieve Table
+        table = self.get_table(db_session)
+
+        # Construct Keyword Args for Query
+        keys = [self.pk, ORDER_PARTITION_KEY, ORDER_SORT_KEY]
+        filters = {"FilterExpression": filter} if filter else {}
+        start_key = decode_start_key(cursor, keys, ORDER_PARTITION_KEY, ORDER_PARTITION) if cursor else None
+
+        # Query the Database
+        items, last_key = self.paginate(
+            table.query,
+            keys=keys,
+            limit=limit,
+            start_key=start_key,
+            budget=budget,
+            IndexName=ORDER_INDEX,
+            KeyConditionExpression=boto3.dynamodb.conditions.Key(ORDER_PARTITION_KEY).eq(ORDER_PARTITION),
+            ScanIndexForward=False,
+            **filters,
+            **self.projection(),
+        )
 
         # Parse Models from Raw Items
-        models = [self.model.parse_obj(obj) for obj in items]
+        models = [self.load(obj) for obj in items]
 
         # Construct Paginated Result
         page = pagination.PaginatedResult(
-            count=count,
-            cursor=next_cursor,  # type: ignore[arg-type]
+            count=len(models),
+            cursor=cursors.encode(last_key) if last_key else None,
             results=models,
         )
 
         # Return
         return page
 
+    def get_resource(self, db_session: boto3.Session) -> Any:
+        """Retrieves the DynamoDB resource to use.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            Any: DynamoDB resource, using the low-level client if applicable.
+        """
+        # Check for Low-Level Client
+        if self.client:
+            # Wrap Shared Client and Return
+            return codec.Resource(aws.REGISTRY.client("dynamodb", db_session))
+
+        # Retrieve and Return Resource
+        return aws.REGISTRY.resource("dynamodb", db_session)
+
+    def get_table(self, db_session: boto3.Session) -> Any:
+        """Retrieves the DynamoDB table to use.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            Any: DynamoDB table, using the low-level client if applicable.
+        """
+        # Check for Low-Level Client
+        if self.client:
+            # Wrap Shared Client and Return
+            return codec.Table(aws.REGISTRY.client("dynamodb", db_session), self.table)
+
+        # Retrieve and Return Table
+        return aws.REGISTRY.table(self.table, db_session)
+
+    def load(self, item: dict[str, Any]) -> ModelType:
+        """Loads a model from a raw item retrieved from the database.
+
+        Items in the database were validated before they were written, so if
+        trusted loads are enabled the model is constructed without re-running
+        its validators (see `trusted.construct`). A random fraction of items
+        are still fully validated, so that any drift between the models and
+        the items in the database is still caught.
+
+        Args:
+            item (dict[str, Any]): Raw item retrieved from the database.
+
+        Returns:
+            ModelType: Loaded model.
+        """
+        # Check for Trusted Loads
+        verify = settings.SETTINGS.AWS_DYNAMODB_TRUSTED_LOADS_VERIFY
+        if not settings.SETTINGS.AWS_DYNAMODB_TRUSTED_LOADS or random.random() < verify:
+            # Fully validate the item
+            return self.model.parse_obj(item)
+
+        # Construct without validation and Return
+        return trusted.construct(self.model, item)
+
+    def projection(self) -> dict[str, Any]:
+        """Constructs the projection keyword arguments for a read operation.
+
+        A new dictionary is constructed for every request, as `boto3` merges
+        the attribute names generated for any conditions into it in place.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for `GetItem`, `BatchGetItem`,
+                `Scan` or `Query` if the CRUD is projected, else empty.
+        """
+        # Check for Projection
+        if not self.attributes:
+            return {}
+
+        # Construct Attribute Name Placeholders
+        # Placeholders are required, as many attribute names (e.g., `name`)
+        # are DynamoDB reserved words.
+        names = {f"#p{i}": a for (i, a) in enumerate(dict.fromkeys(self.attributes))}
+
+        # Construct and Return Projection
+        return {
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+        }
+
+    def paginate(
+        self,
+        operation: Callable[..., Any],
+        *,
+        keys: Sequence[str],
+        limit: Optional[int] = None,
+        start_key: Optional[dict[str, Any]] = None,
+        budget: Optional[budgets.ReadBudget] = None,
+        **kwargs: Any,
+    ) -> tuple[list[dict[str, Any]], Optional[dict[str, Any]]]:
+        """Performs a paginated `scan` or `query` operation on a table.
+
+        DynamoDB applies filters *after* reading each page of items, so a page
+        may contain fewer than `limit` matches. This method keeps reading pages
+        until either the limit is reached, there are no more items or the read
+        budget is exhausted. In the last case, the items read so far are
+        returned along with the key to continue from.
+
+        Args:
+            operation (Callable[..., Any]): Table `scan` or `query` method.
+            keys (Sequence[str]): Key attributes of the table or index that is
+                read, which make up the `LastEvaluatedKey`.
+            limit (Optional[int]): Number of items to limit to.
+            start_key (Optional[dict[str, Any]]): Exclusive start key.
+            budget (Optional[budgets.ReadBudget]): Optional read budget.
+            kwargs (Any): Extra keyword arguments for the operation.
+
+        Returns:
+            tuple[list[dict[str, Any]], Optional[dict[str, Any]]]: Raw items
+                and the last evaluated key to continue from if applicable.
+        """
+        # Construct Keyword Args for Budget
+        budgeted = budget.request() if budget else {}
+
+        # Perform Operation
+        # The first page is always read, so that every call makes progress
+        start = {"ExclusiveStartKey": start_key} if start_key else {}
+        response = operation(**kwargs, **start, **budgeted)
+        items = response["Items"]
+        last_key = response.get("LastEvaluatedKey")
+
+        # Charge Budget
+        if budget:
+            budget.charge(response)
+
+        # Check if we need to keep reading
+        while limit and len(items) < limit and last_key and not (budget and budget.exhausted):
+            # We need to keep reading!
+            response = operation(**kwargs, ExclusiveStartKey=last_key, **budgeted)
+            items += response["Items"]
+            last_key = response.get("LastEvaluatedKey")
+
+            # Charge Budget
+            if budget:
+                budget.charge(response)
+
+        # Check if we went over the limit
+        if limit and len(items) > limit:
+            # Truncate the items, and continue from the last returned item
+            items = items[:limit]
+            last_key = {k: items[-1][k] for k in keys}
+
+        # Return
+        return items, last_key
+
+    def split_key_condition(
+        self,
+        condition: Optional[boto3.dynamodb.conditions.ConditionBase],
+    ) -> tuple[Optional[str], Any, Optional[boto3.dynamodb.conditions.ConditionBase]]:
+        """Splits an indexed key condition out of the supplied filter.
+
+        The filter is treated as a logical AND of individual conditions, such
+        as those generated by the `build_filter` methods. If any of these are
+        an equality check on an attribute that is backed by a secondary index,
+        then it is extracted so the filter can be served by that index.
+
+        Args:
+            condition (Optional[boto3.dynamodb.conditions.ConditionBase]): The
+                filter to split.
+
+        Returns:
+            tuple[Optional[str], Any, Optional[ConditionBase]]: The indexed
+                attribute, its value and the remaining filter if applicable.
+        """
+        # Flatten into Individual Conditions
+        conditions = conjuncts(condition)
+
+        # Loop through Conditions
+        for c in conditions:
+            # Check for an equality check on an indexed attribute
+            if isinstance(c, boto3.dynamodb.conditions.Equals):
+                (attr, value) = c.get_expression()["values"]
+                if isinstance(attr, boto3.dynamodb.conditions.Attr) and attr.name in self.indexes:
+                    # Recombine the remaining conditions
+                    remaining = [r for r in conditions if r is not c]
+                    combined = functools.reduce(operator.and_, remaining) if remaining else None
+                    return attr.name, value, combined
+
+        # No indexed condition
+        return None, None, condition
+
     def create(
         self,
         db_session: boto3.Session,
@@ -178,14 +921,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
         db_obj = self.model.parse_obj(obj_in_data)
 
         # Encode Database Model
-        db_encoded = fastapi.encoders.jsonable_encoder(db_obj)
+        # The low-level client encodes the values directly (see `codec`)
+        db_encoded = codec.fields(db_obj) if self.client else fastapi.encoders.jsonable_encoder(db_obj)
+
+        # Check for Ordered Listing
+        if self.ordered:
+            # Every item shares a partition in the created index
+            db_encoded[ORDER_PARTITION_KEY] = ORDER_PARTITION
 
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
+        # Check for Revisions
+        if self.revisions:
+            db_encoded[REVISION_ATTRIBUTE] = revision(db_obj)
+
+        # Retrieve Table
+        table = self.get_table(db_session)
 
         # Create Item in Database
         table.put_item(Item=db_encoded)
+        self.invalidate(getattr(db_obj, self.pk))
 
         # Return
         return db_obj
@@ -198,7 +951,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
         obj_in: UpdateSchemaType,
         **kwargs: Any,
     ) -> ModelType:
-        """Creates an item in the database.
+        """Updates an item in the database.
+
+        Rather than re-writing the entire item, only the top-level attributes
+        that have changed are written with a single `UpdateItem` request.
 
         Args:
             db_session (boto3.Session): Database session to use.
@@ -213,15 +969,32 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
         updated_data = db_obj.dict() | obj_in.dict(exclude_unset=True) | kwargs  # Merge dictionaries
         updated_db_obj = self.model.parse_obj(updated_data)  # Re-parse to re-run any validation
 
-        # Encode Updated Database Model
-        db_encoded = fastapi.encoders.jsonable_encoder(updated_db_obj)
-
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
-
-        # Create Item in Database
-        table.put_item(Item=db_encoded)
+        # Construct Update Expression from Changes
+        expression = build_update_expression(db_obj, updated_db_obj)
+
+        # Check for Changes
+        if not expression:
+            # Nothing to write
+            return updated_db_obj
+
+        # Check for Revisions
+        if self.revisions:
+            # Set the revision of the updated item alongside the changes
+            expression["UpdateExpression"] += f", #{REVISION_ATTRIBUTE} = :{REVISION_ATTRIBUTE}"
+            expression["ExpressionAttributeNames"][f"#{REVISION_ATTRIBUTE}"] = REVISION_ATTRIBUTE
+            expression["ExpressionAttributeValues"][f":{REVISION_ATTRIBUTE}"] = revision(updated_db_obj)
+
+        # Retrieve Table
+        table = self.get_table(db_session)
+
+        # Update Item in Database
+        # The condition ensures that we never create a partial item
+        table.update_item(
+            Key={self.pk: str(getattr(db_obj, self.pk))},
+            ConditionExpression=boto3.dynamodb.conditions.Attr(self.pk).exists(),
+            **expression,
+        )
+        self.invalidate(getattr(db_obj, self.pk))
 
         # Return
         return updated_db_obj
@@ -242,18 +1015,18 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
             Optional[ModelType]: Deleted item if it exists, else None.
         """
         # Retrieve Item
-        item = self.get(db_session, pk=pk)
+        item = self.get(db_session, pk=pk, cached=False)
 
         # Check if Item Exists
         if not item:
             return None
 
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
+        # Retrieve Table
+        table = self.get_table(db_session)
 
         # Delete Item
         table.delete_item(Key={self.pk: str(pk)})
+        self.invalidate(pk)
 
         # Return
         return item
@@ -273,28 +1046,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
         Returns:
             ModelType: Deactivated item if it exists, else None.
         """
-        # Retrieve Item
-        item = self.get(db_session, pk=pk)
-
-        # Check if Item Exists
-        if not item:
-            return None
-
-        # Deactivate
-        item.active = False
-
-        # Encode Database Model
-        db_encoded = fastapi.encoders.jsonable_encoder(item)
-
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
-
-        # Create Item in Database
-        table.put_item(Item=db_encoded)
-
-        # Return
-        return item
+        # Deactivate and Return
+        return self.set_active(db_session, pk=pk, active=False)
 
     def reactivate(
         self,
@@ -311,25 +1064,303 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType, PrimaryKey
         Returns:
             ModelType: Reactivated item if it exists, else None.
         """
-        # Retrieve Item
-        item = self.get(db_session, pk=pk)
+        # Reactivate and Return
+        return self.set_active(db_session, pk=pk, active=True)
 
-        # Check if Item Exists
-        if not item:
+    def set_active(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: PrimaryKeyType,
+        active: bool,
+    ) -> Optional[ModelType]:
+        """Sets the `active` attribute of an item in the database.
+
+        This is performed with a single `UpdateItem` request, without reading
+        the item first.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (PrimaryKeyType): Primary key for item to update.
+            active (bool): Value for the `active` attribute.
+
+        Returns:
+            Optional[ModelType]: Updated item if it exists, else None.
+        """
+        # Retrieve Table
+        table = self.get_table(db_session)
+
+        # Handle Missing Items
+        try:
+            # Update Item in Database
+            # The condition ensures that we never create a partial item
+            response = table.update_item(
+                Key={self.pk: str(pk)},
+                UpdateExpression="SET #active = :active",
+                ConditionExpression=boto3.dynamodb.conditions.Attr(self.pk).exists(),
+                ExpressionAttributeNames={"#active": "active"},
+                ExpressionAttributeValues={":active": active},
+                ReturnValues="ALL_NEW",
+            )
+
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            # Item does not exist
             return None
 
-        # Reactivate
-        item.active = True
+        # Invalidate Cached Item
+        self.invalidate(pk)
 
-        # Encode Database Model
-        db_encoded = fastapi.encoders.jsonable_encoder(item)
+        # Parse from Raw Item and Return
+        return self.load(response["Attributes"])
 
-        # Create Resource and Table
-        resource = db_session.resource("dynamodb")
-        table = resource.Table(self.table)
+    def invalidate(self, pk: Any) -> None:
+        """Removes an item from the caches of its table after a write.
 
-        # Create Item in Database
-        table.put_item(Item=db_encoded)
+        Every cache of the table is invalidated, rather than only the cache of
+        this CRUD, as other CRUDs may read the same items as different models.
 
-        # Return
-        return item
+        Args:
+            pk (Any): Primary key of the written item.
+        """
+        # Invalidate
+        cache.invalidate(self.table, str(pk))
+
+    def backfill_ordered(
+        self,
+        db_session: boto3.Session,
+    ) -> int:
+        """Writes the created index partition key for all items.
+
+        This only needs to be run once, to add the items that were created
+        before the created index existed to it.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            int: Number of items added to the created index.
+        """
+        # Retrieve Table
+        table = self.get_table(db_session)
+
+        # Loop through all items without the partition key
+        count = 0
+        start_key = None
+        while True:
+            # Scan a page of keys
+            items, start_key = self.paginate(
+                table.scan,
+                keys=[self.pk],
+                start_key=start_key,
+                FilterExpression=boto3.dynamodb.conditions.Attr(ORDER_PARTITION_KEY).not_exists(),
+                ProjectionExpression="#pk",
+                ExpressionAttributeNames={"#pk": self.pk},
+            )
+
+            # Write Partition Keys
+            # The condition ensures that we never create a partial item
+            for item in items:
+                table.update_item(
+                    Key={self.pk: item[self.pk]},
+                    UpdateExpression="SET #listing = :listing",
+                    ConditionExpression=boto3.dynamodb.conditions.Attr(self.pk).exists(),
+                    ExpressionAttributeNames={"#listing": ORDER_PARTITION_KEY},
+                    ExpressionAttributeValues={":listing": ORDER_PARTITION},
+                )
+            count += len(items)
+
+            # Check for next page
+            if not start_key:
+                return count
+
+
+def revision(db_obj: pydantic.BaseModel) -> str:
+    """Calculates the revision of an item.
+
+    The revision is a hash of the content of the item, excluding its `active`
+    attribute, which is set without reading the item (see `set_active`), and
+    so must be checked separately.
+
+    Args:
+        db_obj (pydantic.BaseModel): Item to calculate the revision of.
+
+    Returns:
+        str: Revision of the item.
+    """
+    # Serialise Item
+    encoded = json.dumps(
+        fastapi.encoders.jsonable_encoder(db_obj, exclude={"active"}),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+    # Hash and Return
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def conjuncts(
+    condition: Optional[boto3.dynamodb.conditions.ConditionBase],
+) -> list[boto3.dynamodb.conditions.ConditionBase]:
+    """Flattens a condition into the individual conditions of a logical AND.
+
+    Args:
+        condition (Optional[boto3.dynamodb.conditions.ConditionBase]): The
+            condition to flatten.
+
+    Returns:
+        list[boto3.dynamodb.conditions.ConditionBase]: Individual conditions.
+    """
+    # Check for Condition
+    if condition is None:
+        return []
+
+    # Check for Logical AND
+    if isinstance(condition, boto3.dynamodb.conditions.And):
+        # Recursively flatten both sides
+        return [c for v in condition.get_expression()["values"] for c in conjuncts(v)]
+
+    # Single Condition
+    return [condition]
+
+
+def condition_attributes(
+    condition: boto3.dynamodb.conditions.ConditionBase,
+) -> set[str]:
+    """Retrieves the names of the attributes that a condition refers to.
+
+    Args:
+        condition (boto3.dynamodb.conditions.ConditionBase): The condition.
+
+    Returns:
+        set[str]: Names of the attributes (or attribute path components).
+    """
+    # Build Expression and Return its Attribute Names
+    builder = boto3.dynamodb.conditions.ConditionExpressionBuilder()
+    return set(builder.build_expression(condition).attribute_name_placeholders.values())
+
+
+def encode_segments_cursor(positions: list[SegmentPosition]) -> str:
+    """Encodes the positions of the segments of a parallel scan as a cursor.
+
+    Args:
+        positions (list[SegmentPosition]): Position of each segment.
+
+    Returns:
+        str: Opaque signed URL-safe cursor.
+    """
+    # Encode and Return
+    return cursors.encode(positions)
+
+
+def decode_segments_cursor(cursor: str, segments: int, keys: Sequence[str]) -> list[SegmentPosition]:
+    """Decodes the positions of the segments of a parallel scan from a cursor.
+
+    Args:
+        cursor (str): Opaque signed URL-safe cursor.
+        segments (int): Expected number of segments.
+        keys (Sequence[str]): Expected key attributes of each position.
+
+    Raises:
+        ValueError: Raised if the cursor is invalid.
+
+    Returns:
+        list[SegmentPosition]: Position of each segment.
+    """
+    # Decode
+    positions = cursors.decode(cursor)
+
+    # Check Positions
+    if (
+        not isinstance(positions, list)
+        or len(positions) != segments
+        or not all(p is None or p is False or cursors.is_key(p, keys) for p in positions)
+    ):
+        # Error
+        raise ValueError("Invalid cursor")
+
+    # Return
+    return positions
+
+
+def decode_start_key(cursor: str, keys: Sequence[str], partition_key: str, partition: Any) -> dict[str, Any]:
+    """Decodes the exclusive start key for a `query` from a cursor.
+
+    Args:
+        cursor (str): Opaque signed URL-safe cursor.
+        keys (Sequence[str]): Expected key attributes.
+        partition_key (str): Partition key attribute of the queried index.
+        partition (Any): Value of the queried partition.
+
+    Raises:
+        ValueError: Raised if the cursor is invalid, or is for another
+            partition.
+
+    Returns:
+        dict[str, Any]: Exclusive start key.
+    """
+    # Decode
+    start_key = cursors.decode_key(cursor, keys)
+
+    # Check Partition
+    # A cursor must not be able to continue a query of another partition
+    if str(start_key[partition_key]) != str(partition):
+        # Error
+        raise ValueError("Invalid cursor")
+
+    # Return
+    return start_key
+
+
+def build_update_expression(
+    old: pydantic.BaseModel,
+    new: pydantic.BaseModel,
+) -> Optional[dict[str, Any]]:
+    """Builds the `UpdateItem` expression to update one model to another.
+
+    The fields of the models are compared, and only the changed fields are
+    included in the expression. Each changed field is set as a whole, so the
+    written attributes always hold values from the validated model.
+
+    Args:
+        old (pydantic.BaseModel): Model as it currently is in the database.
+        new (pydantic.BaseModel): Model as it should be in the database.
+
+    Returns:
+        Optional[dict[str, Any]]: Keyword arguments for `UpdateItem` with the
+            update expression, names and values if there are any changes.
+    """
+    # Expression Components
+    clauses: list[str] = []
+    names: dict[str, str] = {}
+    values: dict[str, Any] = {}
+
+    # Loop through Fields
+    for (index, field) in enumerate(new.__fields__):
+        # Retrieve Values
+        a = getattr(old, field, None)
+        b = getattr(new, field, None)
+
+        # Check for Change
+        if a == b:
+            continue
+
+        # Set the whole attribute
+        # Elements of list attributes are never written individually, as the
+        # item in the database may no longer match the model it was diffed
+        # against (e.g., after a concurrent update), and writing an element by
+        # its index or appending to the list could then produce an item that
+        # was never validated.
+        names[f"#f{index}"] = field
+        values[f":f{index}"] = fastapi.encoders.jsonable_encoder(b)
+        clauses.append(f"#f{index} = :f{index}")
+
+    # Check for Changes
+    if not clauses:
+        return None
+
+    # Construct and Return Expression
+    return {
+        "UpdateExpression": f"SET {', '.join(clauses)}",
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values,
+    }
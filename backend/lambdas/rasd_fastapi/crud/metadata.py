@@ -3,24 +3,57 @@
 
 # Standard
 import functools
+import itertools
 import operator
+import os
+import re
+import tempfile
+import threading
+import time
 import uuid
 
 # Third-Party
 import boto3
 import boto3.dynamodb.conditions as con
+import numpy as np
 
 # Local
+from rasd_fastapi.core import aws
 from rasd_fastapi.core import settings
 from rasd_fastapi.crud import base
+from rasd_fastapi.db import budgets
+from rasd_fastapi.db import cursors
 from rasd_fastapi.models import organisations as org_models
 from rasd_fastapi.models import metadata as metadata_models
 from rasd_fastapi.models.metadata_vocabs import keywords
 from rasd_fastapi.models.metadata_vocabs import locations
 from rasd_fastapi.schemas import metadata as metadata_schemas
+from rasd_fastapi.schemas import pagination
+from rasd_fastapi.search import heatmap
+from rasd_fastapi.search import ranking
+from rasd_fastapi.search import rebuilds
+from rasd_fastapi.search import results as result_cache
+from rasd_fastapi.search import similarity
+from rasd_fastapi.search import snapshot
+from rasd_fastapi.search import spatial
+from rasd_fastapi.search import temporal
+from rasd_fastapi.search import tokens
+from rasd_fastapi.search import typeahead
 
 # Typing
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
+
+
+# Constants
+RANKING_WEIGHTS = {  # Fields in the ranked index, and their relative importance
+    "title": 3.0,
+    "keywords": 2.0,
+    "taxa_covered": 2.0,
+    "custodian": 1.5,
+    "abstract": 1.0,
+}
+SUGGEST_SEPARATORS = re.compile(r"[,;]")  # Separators of the taxa in `taxa_covered`
+VERSION_KEY = {"id": "version"}  # Catalogue version item in the catalogue table
 
 
 class RASDMetadataCRUD(
@@ -31,7 +64,72 @@ class RASDMetadataCRUD(
         uuid.UUID,
     ],
 ):
-    """Metadata CRUD Abstraction."""
+    """Metadata CRUD Abstraction.
+
+    Relevance-ranked search is served by an in-memory BM25 index of the active
+    Metadata Summaries (see `search.ranking`), which is built from a scan of the
+    table when first used, cached by the warm container and then updated
+    incrementally by the writes made through this CRUD. As other containers may
+    also write to the table, the index is rebuilt once it expires. The rebuild
+    runs in the background (see `search.rebuilds`), and searches are served
+    from the expired index until it completes, for at most
+    `SEARCH_REBUILD_GRACE_SECONDS`, after which they wait for it. Ranked
+    searches are therefore never served from an index that was built more
+    than `SEARCH_RANKED_INDEX_TTL` plus the grace period ago.
+
+    Searches for active Metadata are served from a memory-mapped snapshot of
+    the Metadata Summaries (see `search.snapshot`). Every write increments the
+    catalogue version, which is stored in the catalogue table, and each container
+    rebuilds its snapshot when it sees that the version has changed. The
+    version is checked at most every `SEARCH_SNAPSHOT_CHECK_SECONDS`, and the
+    snapshot is rebuilt in the background, so searches are served from the
+    previous snapshot until the rebuild completes. Once the snapshot hasn't
+    been confirmed current for longer than the check interval plus
+    `SEARCH_REBUILD_GRACE_SECONDS`, searches wait for the rebuild, which
+    bounds how stale a snapshot can be (typeahead is the exception, as it
+    never waits). The typeahead, similarity and coverage heatmap indexes are
+    built from the snapshot in the same rebuild, and replaced with it.
+
+    The ordered IDs of ranked searches are cached under a normalised key of
+    the search (see `search.results`), so that later pages are served by
+    slicing the cached list and retrieving only the summaries on the page. The
+    cache is cleared by every write made through this CRUD, and
+    its entries expire after `SEARCH_RESULT_CACHE_TTL` to bound how stale they
+    can be after writes made by other containers.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        catalogue_table: str,
+        **kwargs: Any,
+    ) -> None:
+        """Instantiates the Metadata CRUD abstraction.
+
+        Args:
+            args (Any): Positional arguments for the CRUD abstraction.
+            catalogue_table (str): Table that the catalogue version is in.
+            kwargs (Any): Keyword arguments for the CRUD abstraction.
+        """
+        # Instantiate Super Class
+        super().__init__(*args, **kwargs)
+
+        # Instance Variables
+        self.catalogue_table = catalogue_table
+        self.ranking = ranking.RankedIndex(RANKING_WEIGHTS)
+        self.ranking_rebuild = rebuilds.Rebuild("ranking")
+        self.snapshot: Optional[snapshot.Snapshot] = None
+        self.snapshot_checked: Optional[float] = None
+        self.snapshot_confirmed: Optional[float] = None
+        self.snapshot_lock = threading.Lock()
+        self.snapshot_rebuild = rebuilds.Rebuild("snapshot")
+        self.suggestions: Optional[typeahead.SuggestIndex] = None
+        self.similarities: Optional[similarity.SimilarityIndex] = None
+        self.heatmap: Optional[heatmap.Heatmap] = None
+        self.results = result_cache.ResultCache(
+            size=settings.SETTINGS.SEARCH_RESULT_CACHE_SIZE,
+            ttl=settings.SETTINGS.SEARCH_RESULT_CACHE_TTL,
+        )
 
     def create_with_org(
         self,
@@ -51,13 +149,894 @@ class RASDMetadataCRUD(
             metadata_models.RASDMetadata: Created Metadata in the database.
         """
         # Allow super class to handle the Creation
-        return super().create(
+        db_obj = super().create(
             db_session,
             obj_in=obj_in,
             organisation_id=org.id,  # Extract Organisation ID
             custodian=org.name,      # Extract Organisation Name
         )
 
+        # Update Indexes
+        self.index_ranked(db_obj)
+        self.bump_version(db_session)
+
+        # Return
+        return db_obj
+
+    def update(
+        self,
+        db_session: boto3.Session,
+        *,
+        db_obj: metadata_models.RASDMetadata,
+        obj_in: metadata_schemas.RASDMetadataUpdate,
+        **kwargs: Any,
+    ) -> metadata_models.RASDMetadata:
+        """Updates a Metadata in the database.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            db_obj (metadata_models.RASDMetadata): Metadata to update.
+            obj_in (metadata_schemas.RASDMetadataUpdate): Data to update item with.
+            kwargs (Any): Extra data required for the update.
+
+        Returns:
+            metadata_models.RASDMetadata: Updated Metadata in the database.
+        """
+        # Allow super class to handle the Update
+        updated = super().update(db_session, db_obj=db_obj, obj_in=obj_in, **kwargs)
+
+        # Update Indexes
+        self.index_ranked(updated)
+        self.bump_version(db_session)
+
+        # Return
+        return updated
+
+    def delete(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: uuid.UUID,
+    ) -> Optional[metadata_models.RASDMetadata]:
+        """Deletes a Metadata in the database.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (uuid.UUID): Primary key for item to delete.
+
+        Returns:
+            Optional[metadata_models.RASDMetadata]: Deleted item if it exists,
+                else None.
+        """
+        # Delete and Update Indexes
+        if item := super().delete(db_session, pk=pk):
+            self.ranking.remove(str(pk))
+            self.bump_version(db_session)
+
+        # Return
+        return item
+
+    def set_active(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: uuid.UUID,
+        active: bool,
+    ) -> Optional[metadata_models.RASDMetadata]:
+        """Sets the `active` attribute of a Metadata in the database.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (uuid.UUID): Primary key for item to update.
+            active (bool): Value for the `active` attribute.
+
+        Returns:
+            Optional[metadata_models.RASDMetadata]: Updated item if it exists,
+                else None.
+        """
+        # Update and Re-Index
+        if item := super().set_active(db_session, pk=pk, active=active):
+            self.index_ranked(item)
+            self.bump_version(db_session)
+
+        # Return
+        return item
+
+    def search(
+        self,
+        db_session: boto3.Session,
+        *,
+        query: Optional[str] = None,
+        active_only: bool = True,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        keywords: Optional[set[keywords.Keyword]] = None,
+        locations: Optional[set[locations.Location]] = None,
+        organisation_id: Optional[uuid.UUID] = None,
+        bbox: Optional[spatial.BoundingBox] = None,
+        coverage: Optional[temporal.Interval] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        budget: Optional[budgets.ReadBudget] = None,
+    ) -> pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+        """Searches for Metadata Summaries.
+
+        If the free text `query` contains any tokens, then the active Metadata
+        that contain *any* of them are ranked by relevance using the ranked
+        index, and the other filters are applied to them (see `search_ranked`).
+
+        Otherwise, if only `active` Metadata are searched for, then the search
+        is served from the catalogue snapshot (see `search_snapshot`).
+
+        Otherwise, the search falls back to a filtered (parallel) scan of the
+        Metadata table (see `build_filter`), which is charged to the read
+        budget.
+
+        The free text query is only served by the ranked index, and the
+        spatial and temporal filters by the catalogue snapshot, so they can
+        only be used to search for `active` Metadata, and never require a scan.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            query (Optional[str]): Free text to rank results by relevance to.
+            active_only (bool): Filter for `active` only metadata.
+            title (Optional[str]): Filter results based on `title`.
+            abstract (Optional[str]): Filter results based on `abstract`.
+            keywords (Optional[set[keywords.Keyword]]): Filter results based on `keywords`.
+            locations (Optional[set[locations.Location]]): Filter results based on `locations`.
+            organisation_id (Optional[uuid.UUID]): Filter results based on `organisation_id`.
+            bbox (Optional[spatial.BoundingBox]): Filter results that overlap a bounding box.
+            coverage (Optional[temporal.Interval]): Filter results whose
+                temporal coverage overlaps an interval.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+            budget (Optional[budgets.ReadBudget]): Optional read budget.
+
+        Raises:
+            ValueError: Raised if the cursor is invalid, or if the free text
+                query or the spatial or temporal filters are used to search for
+                inactive Metadata.
+
+        Returns:
+            pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+                Page of retrieved Metadata Summaries.
+        """
+        # Check Spatial and Temporal Filters
+        if (bbox or coverage) and not active_only:
+            # Error
+            raise ValueError("Spatial and temporal filters can only be used to search active metadata")
+
+        # Check Free Text Query
+        if query and tokens.tokenise(query) and not active_only:
+            # Error
+            raise ValueError("Free text queries can only be used to search active metadata")
+
+        # Check for Query
+        if query and tokens.tokenise(query):
+            # Restrict to Spatial and Temporal Matches
+            allowed = None
+            if bbox or coverage:
+                current = self.current_snapshot(db_session)
+                allowed = current.identifiers(current.mask(bbox=bbox, coverage=coverage))
+
+            # Construct Normalised Key of the Search
+            key = result_cache.key(
+                query=set(tokens.tokenise(query)),
+                active_only=active_only,
+                keywords=keywords,
+                locations=locations,
+                organisation_id=organisation_id,
+                bbox=bbox,
+                coverage=coverage,
+                title=title.lower() if title else None,
+                abstract=abstract.lower() if abstract else None,
+            )
+
+            # Rank Metadata Summaries and Return
+            matches = self.build_predicate(active_only, title, abstract, keywords, locations, organisation_id, allowed)
+            return self.search_ranked(db_session, query=query, key=key, predicate=matches, limit=limit, cursor=cursor)
+
+        # Check for Public Search
+        if active_only:
+            # Search Catalogue Snapshot and Return
+            return self.search_snapshot(
+                db_session,
+                title=title,
+                abstract=abstract,
+                keywords=keywords,
+                locations=locations,
+                organisation_id=organisation_id,
+                bbox=bbox,
+                coverage=coverage,
+                limit=limit,
+                cursor=cursor,
+            )
+
+        # Scan Metadata Summaries and Return
+        # Scans that can't be served by an index are performed in parallel
+        return metadata_summary.scan(
+            db_session,
+            filter=self.build_filter(active_only, title, abstract, keywords, locations, organisation_id),
+            limit=limit,
+            cursor=cursor,
+            segments=settings.SETTINGS.AWS_DYNAMODB_SCAN_SEGMENTS,
+            budget=budget,
+        )
+
+    def search_snapshot(
+        self,
+        db_session: boto3.Session,
+        *,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        keywords: Optional[set[keywords.Keyword]] = None,
+        locations: Optional[set[locations.Location]] = None,
+        organisation_id: Optional[uuid.UUID] = None,
+        bbox: Optional[spatial.BoundingBox] = None,
+        coverage: Optional[temporal.Interval] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+        """Searches the catalogue snapshot for active Metadata Summaries.
+
+        The results are ordered by ID, and the cursor is the (signed) ID of the
+        last result.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            title (Optional[str]): Filter results based on `title`.
+            abstract (Optional[str]): Filter results based on `abstract`.
+            keywords (Optional[set[keywords.Keyword]]): Filter results based on `keywords`.
+            locations (Optional[set[locations.Location]]): Filter results based on `locations`.
+            organisation_id (Optional[uuid.UUID]): Filter results based on `organisation_id`.
+            bbox (Optional[spatial.BoundingBox]): Filter results that overlap a bounding box.
+            coverage (Optional[temporal.Interval]): Filter results whose
+                temporal coverage overlaps an interval.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+
+        Raises:
+            ValueError: Raised if the cursor is invalid.
+
+        Returns:
+            pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+                Page of retrieved Metadata Summaries.
+        """
+        # Retrieve Snapshot
+        current = self.current_snapshot(db_session)
+
+        # Decode Cursor
+        after = uuid_from_cursor(cursor, self.pk) if cursor else None
+
+        # Filter Rows
+        # One extra row is read, to check whether there is another page
+        rows = current.search(
+            start=current.start(after),
+            title=title,
+            abstract=abstract,
+            keywords=keywords,
+            locations=locations,
+            organisation_id=organisation_id,
+            bbox=bbox,
+            coverage=coverage,
+        )
+        selected = list(itertools.islice(rows, limit + 1)) if limit else list(rows)
+
+        # Check if we went over the limit
+        more = bool(limit) and len(selected) > limit  # type: ignore[operator]
+        selected = selected[:limit]
+
+        # Decode Metadata Summaries
+        results = [current.summary(row) for row in selected]
+
+        # Construct Paginated Result
+        page = pagination.PaginatedResult(
+            count=len(results),
+            cursor=cursors.encode({self.pk: str(results[-1].id)}) if more else None,
+            results=results,
+        )
+
+        # Return
+        return page
+
+    def facets(
+        self,
+        db_session: boto3.Session,
+        *,
+        query: Optional[str] = None,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        keywords: Optional[set[keywords.Keyword]] = None,
+        locations: Optional[set[locations.Location]] = None,
+        organisation_id: Optional[uuid.UUID] = None,
+        bbox: Optional[spatial.BoundingBox] = None,
+        coverage: Optional[temporal.Interval] = None,
+    ) -> metadata_schemas.RASDMetadataFacets:
+        """Counts the active Metadata that match a search for each facet value.
+
+        The counts are served from the bitsets of the catalogue snapshot, so
+        they don't require another scan. If there is a free text `query`, then
+        the counts are restricted to the Metadata that match it in the ranked
+        index.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            query (Optional[str]): Free text query.
+            title (Optional[str]): Filter results based on `title`.
+            abstract (Optional[str]): Filter results based on `abstract`.
+            keywords (Optional[set[keywords.Keyword]]): Filter results based on `keywords`.
+            locations (Optional[set[locations.Location]]): Filter results based on `locations`.
+            organisation_id (Optional[uuid.UUID]): Filter results based on `organisation_id`.
+            bbox (Optional[spatial.BoundingBox]): Filter results that overlap a bounding box.
+            coverage (Optional[temporal.Interval]): Filter results whose
+                temporal coverage overlaps an interval.
+
+        Returns:
+            metadata_schemas.RASDMetadataFacets: Count of each facet value.
+        """
+        # Retrieve Snapshot
+        current = self.current_snapshot(db_session)
+
+        # Restrict to Free Text Matches
+        restrict = None
+        if query and tokens.tokenise(query):
+            matches = self.ranked_index(db_session).matches(query)
+            restrict = current.rows(uuid.UUID(pk) for pk in matches)
+
+        # Count Facets
+        counts = current.facets(
+            restrict=restrict,
+            title=title,
+            abstract=abstract,
+            keywords=keywords,
+            locations=locations,
+            organisation_id=organisation_id,
+            bbox=bbox,
+            coverage=coverage,
+        )
+
+        # Construct and Return
+        # The counts are keyed by the vocabulary members, so are not validated
+        return metadata_schemas.RASDMetadataFacets.construct(
+            keywords=counts["keywords"],
+            locations=counts["locations"],
+            formats=counts["formats"],
+            access_rights=counts["access_rights"],
+        )
+
+    def suggest(
+        self,
+        db_session: boto3.Session,
+        *,
+        prefix: str,
+        limit: int,
+    ) -> list[metadata_schemas.RASDMetadataSuggestion]:
+        """Suggests completions of a prefix for the search box.
+
+        The completions are titles, taxa and custodians of active Metadata,
+        matched at the start of any of their words. Typeahead never waits for
+        a scan, so there are no completions until the container has built its
+        first catalogue snapshot.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            prefix (str): Text typed so far.
+            limit (int): Number of completions to return.
+
+        Returns:
+            list[metadata_schemas.RASDMetadataSuggestion]: Top completions.
+        """
+        # Retrieve Index
+        index = self.suggest_index(db_session)
+        if not index:
+            return []
+
+        # Suggest
+        suggestions = index.suggest(prefix, limit)
+
+        # Construct and Return
+        return [
+            metadata_schemas.RASDMetadataSuggestion(field=field, text=text, count=count)
+            for (field, text, count) in suggestions
+        ]
+
+    def suggest_index(
+        self,
+        db_session: boto3.Session,
+    ) -> Optional[typeahead.SuggestIndex]:
+        """Retrieves the suggestion index of the catalogue snapshot.
+
+        The index is built alongside the snapshot (see `refresh_snapshot`), so
+        retrieving it never waits for a build.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            Optional[typeahead.SuggestIndex]: Suggestion index of the catalogue
+                snapshot, or None if the first snapshot is still being built.
+        """
+        # Check Snapshot
+        # The first snapshot is not waited for
+        self.available_snapshot(db_session)
+
+        # Return
+        return self.suggestions
+
+    def similar(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: uuid.UUID,
+        limit: int,
+    ) -> Optional[list[metadata_schemas.RASDMetadataSummary]]:
+        """Retrieves the active Metadata most similar to an active Metadata.
+
+        The nearest neighbours of every active Metadata are precomputed when
+        the similarity index is built alongside the snapshot (see
+        `refresh_snapshot`), so this is a lookup.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (uuid.UUID): Primary key of the Metadata.
+            limit (int): Number of similar Metadata to return.
+
+        Returns:
+            Optional[list[metadata_schemas.RASDMetadataSummary]]: Summaries of
+                the most similar Metadata, or None if the Metadata is not in
+                the catalogue.
+        """
+        # Retrieve Snapshot and Similarity Index
+        # Both are replaced together by each rebuild, and are read together,
+        # as the rows of the index are the rows of the snapshot it was built from
+        self.current_snapshot(db_session)
+        with self.snapshot_lock:
+            (current, index) = (self.snapshot, self.similarities)
+        if not current or not index:
+            return None
+
+        # Retrieve Neighbours
+        neighbours = index.similar(pk.bytes, limit)
+        if neighbours is None:
+            return None
+
+        # Decode Summaries and Return
+        return [current.summary(row) for (row, _) in neighbours]
+
+    def coverage(
+        self,
+        db_session: boto3.Session,
+        *,
+        zoom: int,
+    ) -> metadata_schemas.RASDMetadataHeatmap:
+        """Counts the active Metadata whose bounding boxes intersect each grid cell.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            zoom (int): Zoom level (see `heatmap.ZOOM_LEVELS`).
+
+        Returns:
+            metadata_schemas.RASDMetadataHeatmap: Counts of each grid cell.
+        """
+        # Retrieve Snapshot and Heatmap
+        # The heatmap is built from the snapshot in the same rebuild (see
+        # `refresh_snapshot`), and replaced with it, so it is only missing if
+        # the snapshot was never built by this CRUD
+        current = self.current_snapshot(db_session)
+        with self.snapshot_lock:
+            grid = self.heatmap or coverage_heatmap(current)
+
+        # Retrieve Counts
+        counts = grid.counts(zoom)
+
+        # Construct and Return
+        # The counts are constructed without validation, as there is one per cell
+        return metadata_schemas.RASDMetadataHeatmap.construct(
+            zoom=zoom,
+            cell_size=heatmap.ZOOM_LEVELS[zoom],
+            rows=180 // heatmap.ZOOM_LEVELS[zoom],
+            columns=360 // heatmap.ZOOM_LEVELS[zoom],
+            version=grid.version,
+            counts=counts.ravel().tolist(),
+        )
+
+    def current_snapshot(
+        self,
+        db_session: boto3.Session,
+    ) -> snapshot.Snapshot:
+        """Retrieves the catalogue snapshot, rebuilding it if it is stale.
+
+        A stale snapshot is served until the rebuild completes (see
+        `available_snapshot`). The rebuild is waited for if there is no
+        snapshot to serve yet, or if the snapshot is overdue (see
+        `snapshot_overdue`).
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            snapshot.Snapshot: Catalogue snapshot.
+        """
+        # Check for Snapshot
+        current = self.available_snapshot(db_session)
+        if current and not self.snapshot_overdue():
+            return current
+
+        # Wait for the Rebuild and Retry
+        self.snapshot_rebuild.start(functools.partial(self.refresh_snapshot, db_session)).result()
+        return self.current_snapshot(db_session)
+
+    def snapshot_overdue(self) -> bool:
+        """Checks whether the snapshot is overdue for a version check.
+
+        The version is checked in the background, which on Lambda only makes
+        progress while a request is being handled. A snapshot that hasn't been
+        confirmed current for longer than `SEARCH_SNAPSHOT_CHECK_SECONDS` plus
+        `SEARCH_REBUILD_GRACE_SECONDS` is overdue.
+
+        Returns:
+            bool: Whether the snapshot is overdue.
+        """
+        # Check and Return
+        limit = settings.SETTINGS.SEARCH_SNAPSHOT_CHECK_SECONDS + settings.SETTINGS.SEARCH_REBUILD_GRACE_SECONDS
+        confirmed = self.snapshot_confirmed
+        return confirmed is None or time.monotonic() - confirmed > limit
+
+    def available_snapshot(
+        self,
+        db_session: boto3.Session,
+    ) -> Optional[snapshot.Snapshot]:
+        """Retrieves the catalogue snapshot without waiting for it to be built.
+
+        The catalogue version is checked in the background at most every
+        `SEARCH_SNAPSHOT_CHECK_SECONDS`, and the snapshot is rebuilt if it has
+        changed.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            Optional[snapshot.Snapshot]: Catalogue snapshot, or None if the
+                first snapshot is still being built.
+        """
+        # Lock
+        with self.snapshot_lock:
+            # Check whether the version was checked recently
+            now = time.monotonic()
+            interval = settings.SETTINGS.SEARCH_SNAPSHOT_CHECK_SECONDS
+            current = self.snapshot
+            if current and self.snapshot_checked is not None and now - self.snapshot_checked < interval:
+                return current
+
+            # Mark Version as Checked
+            self.snapshot_checked = now
+
+        # Start Rebuild
+        # The rebuild is started outside of the lock, so that searches are
+        # never blocked by the scan
+        self.snapshot_rebuild.start(functools.partial(self.refresh_snapshot, db_session))
+
+        # Return
+        return current
+
+    def refresh_snapshot(
+        self,
+        db_session: boto3.Session,
+    ) -> None:
+        """Rebuilds the catalogue snapshot if the catalogue version has changed.
+
+        The indexes that are derived from the snapshot (i.e., the typeahead
+        suggestions, the similarity index and the coverage heatmap) are built in the same rebuild,
+        and replaced with it.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+        """
+        # Check Catalogue Version
+        # The version is read before the scan, so that any writes made during
+        # the scan cause the snapshot to be rebuilt again
+        checked = time.monotonic()
+        version = self.catalogue_version(db_session)
+        if self.snapshot and self.snapshot.version == version:
+            self.snapshot_confirmed = checked
+            return
+
+        # Build Snapshot
+        current = self.build_snapshot(db_session, version=version)
+
+        # Build Indexes of the Snapshot
+        # The indexes are built before the snapshot is replaced, so that no
+        # request waits for them, and the previous ones are served meanwhile
+        suggestions = typeahead.SuggestIndex(suggestion_values(current), version=current.version)
+        similarities = similarity.SimilarityIndex(
+            similarity_documents(current),
+            width=len(current.keywords.members) + len(current.locations.members),
+            version=current.version,
+        )
+        coverage = coverage_heatmap(current)
+
+        # Lock and Replace Snapshot and Indexes
+        # The snapshot was current when the version was read
+        with self.snapshot_lock:
+            (previous, self.snapshot) = (self.snapshot, current)
+            self.suggestions = suggestions
+            self.similarities = similarities
+            self.heatmap = coverage
+            self.snapshot_confirmed = checked
+
+        # Remove Previous Snapshot
+        # The previous snapshot remains mapped until it is no longer referenced
+        if previous and previous.path != current.path:
+            os.remove(previous.path)
+
+    def build_snapshot(
+        self,
+        db_session: boto3.Session,
+        *,
+        version: int,
+    ) -> snapshot.Snapshot:
+        """Writes and opens a snapshot of all active Metadata.
+
+        The Metadata are scanned with strongly consistent reads, so that the
+        snapshot includes every write made before the catalogue version was
+        read, including the write that produced that version.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            version (int): Catalogue version that the snapshot is of.
+
+        Returns:
+            snapshot.Snapshot: Catalogue snapshot.
+        """
+        # Scan Active Metadata
+        db_objs = self.scan_all(
+            db_session,
+            filter=self.ActiveOnly,
+            segments=settings.SETTINGS.AWS_DYNAMODB_SCAN_SEGMENTS,
+            consistent=True,
+        )
+
+        # Write and Open Snapshot
+        directory = settings.SETTINGS.SEARCH_SNAPSHOT_DIRECTORY or tempfile.gettempdir()
+        current = snapshot.Snapshot(snapshot.write(directory, version, db_objs))
+
+        # Return
+        return current
+
+    def catalogue_version(
+        self,
+        db_session: boto3.Session,
+    ) -> int:
+        """Retrieves the catalogue version.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            int: Catalogue version.
+        """
+        # Retrieve Version Item
+        table = aws.REGISTRY.table(self.catalogue_table, db_session)
+        item = table.get_item(Key=VERSION_KEY, ConsistentRead=True).get("Item")
+
+        # Return
+        return int(item["version"]) if item else 0
+
+    def bump_version(
+        self,
+        db_session: boto3.Session,
+    ) -> int:
+        """Increments the catalogue version after a write.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            int: Catalogue version after the write.
+        """
+        # Increment Version Atomically
+        table = aws.REGISTRY.table(self.catalogue_table, db_session)
+        response = table.update_item(
+            Key=VERSION_KEY,
+            UpdateExpression="ADD #version :one",
+            ExpressionAttributeNames={"#version": "version"},
+            ExpressionAttributeValues={":one": 1},
+            ReturnValues="UPDATED_NEW",
+        )
+
+        # Check the Version on the Next Search
+        self.snapshot_checked = None
+
+        # Clear Cached Result Sets
+        self.results.clear()
+
+        # Return
+        return int(response["Attributes"]["version"])
+
+    def search_ranked(
+        self,
+        db_session: boto3.Session,
+        *,
+        query: str,
+        key: str,
+        predicate: Callable[[metadata_schemas.RASDMetadataSummary], bool],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+        """Ranks the Metadata Summaries by relevance to a free text query.
+
+        Every match is ranked once, and the ordered IDs are cached under the
+        key of the search, so each later page is a slice of the cached list.
+        The summaries on the page are retrieved from the ranked index. The
+        cursor is the (signed) offset of the next page.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            query (str): Free text to rank results by relevance to.
+            key (str): Normalised key of the search, including its filters.
+            predicate (Callable[[metadata_schemas.RASDMetadataSummary], bool]):
+                Filter that results must satisfy.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+
+        Raises:
+            ValueError: Raised if the cursor is invalid.
+
+        Returns:
+            pagination.PaginatedResult[metadata_schemas.RASDMetadataSummary]:
+                Page of retrieved Metadata Summaries.
+        """
+        # Decode Cursor
+        position = cursors.decode(cursor) if cursor else {"offset": 0}
+        offset = position.get("offset") if isinstance(position, dict) else None
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            # Error
+            raise ValueError("Invalid cursor")
+
+        # Rank Metadata Summaries
+        index = self.ranked_index(db_session)
+        ranked = self.results.fetch(key, lambda: [str(s.id) for (_, s) in index.search(query, predicate=predicate)])
+
+        # Slice Page
+        # One extra result is selected, to check whether there is another page
+        selected = ranked[offset:offset + limit + 1] if limit else ranked[offset:]
+
+        # Check if we went over the limit
+        next_offset = None
+        if limit and len(selected) > limit:
+            # Truncate the results, and continue from the next result
+            selected = selected[:limit]
+            next_offset = offset + limit
+
+        # Retrieve Summaries
+        # Summaries that have been removed since the results were cached are
+        # skipped
+        results = [s for s in index.get_many(selected) if s is not None]
+
+        # Construct Paginated Result
+        page = pagination.PaginatedResult(
+            count=len(results),
+            cursor=cursors.encode({"offset": next_offset}) if next_offset else None,
+            results=results,
+        )
+
+        # Return
+        return page
+
+    def ranked_index(
+        self,
+        db_session: boto3.Session,
+    ) -> ranking.RankedIndex:
+        """Retrieves the ranked index, rebuilding it if it has expired.
+
+        An expired index is rebuilt in the background, and is served until the
+        rebuild completes. The rebuild is waited for if there is no index to
+        serve yet, or if the index expired more than the grace period ago
+        (e.g., as the rebuild was frozen between Lambda invocations).
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            ranking.RankedIndex: Ranked index of the active Metadata Summaries.
+        """
+        # Check Index
+        if self.ranking.stale(settings.SETTINGS.SEARCH_RANKED_INDEX_TTL):
+            # Start Rebuild
+            rebuild = self.ranking_rebuild.start(functools.partial(self.build_ranked, db_session))
+
+            # Wait for the First Build, or an Overdue Rebuild
+            grace = settings.SETTINGS.SEARCH_REBUILD_GRACE_SECONDS
+            if self.ranking.stale(settings.SETTINGS.SEARCH_RANKED_INDEX_TTL + grace):
+                rebuild.result()
+
+        # Return
+        return self.ranking
+
+    def build_ranked(
+        self,
+        db_session: boto3.Session,
+    ) -> None:
+        """Rebuilds the ranked index from a scan of the active Metadata.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+        """
+        # Scan Active Metadata
+        db_objs = self.scan_all(
+            db_session,
+            filter=self.ActiveOnly,
+            segments=settings.SETTINGS.AWS_DYNAMODB_SCAN_SEGMENTS,
+        )
+
+        # Rebuild Index
+        self.ranking.rebuild(ranked_entry(db_obj) for db_obj in db_objs)
+
+    def index_ranked(
+        self,
+        db_obj: metadata_models.RASDMetadata,
+    ) -> None:
+        """Updates a Metadata in the ranked index.
+
+        The index is only updated once it has been built, as otherwise it will
+        be built (including this Metadata) when it is next used. Inactive
+        Metadata are removed from the index.
+
+        Args:
+            db_obj (metadata_models.RASDMetadata): Metadata to index.
+        """
+        # Check Index
+        if self.ranking.built_at is None:
+            return
+
+        # Update Index
+        if db_obj.active:
+            self.ranking.add(*ranked_entry(db_obj))
+        else:
+            self.ranking.remove(str(db_obj.id))
+
+    def build_predicate(
+        self,
+        active_only: bool,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        keywords: Optional[set[keywords.Keyword]] = None,
+        locations: Optional[set[locations.Location]] = None,
+        organisation_id: Optional[uuid.UUID] = None,
+        allowed: Optional[set[uuid.UUID]] = None,
+    ) -> Callable[[metadata_schemas.RASDMetadataSummary], bool]:
+        """Builds the search filter for retrieved Metadata Summaries.
+
+        Args:
+            active_only (bool): Filter for `active` only metadata.
+            title (Optional[str]): Filter results based on `title`.
+            abstract (Optional[str]): Filter results based on `abstract`.
+            keywords (Optional[set[keywords.Keyword]]): Filter results based on `keywords`.
+            locations (Optional[set[locations.Location]]): Filter results based on `locations`.
+            organisation_id (Optional[uuid.UUID]): Filter results based on `organisation_id`.
+            allowed (Optional[set[uuid.UUID]]): Optional IDs that results must
+                be in, for filters that are evaluated elsewhere.
+
+        Returns:
+            Callable[[metadata_schemas.RASDMetadataSummary], bool]: Filter for
+                Metadata Summaries.
+        """
+        # Construct Filter
+        def matches(summary: metadata_schemas.RASDMetadataSummary) -> bool:
+            # The text is matched as a substring, like the table filter
+            return (
+                (summary.active or not active_only)
+                and (not title or title.lower() in summary.title.lower())
+                and (not abstract or abstract.lower() in (summary.abstract or "").lower())
+                and (not keywords or not keywords.isdisjoint(summary.keywords))
+                and (not locations or not locations.isdisjoint(summary.locations))
+                and (not organisation_id or summary.organisation_id == organisation_id)
+                and (allowed is None or summary.id in allowed)
+            )
+
+        # Return
+        return matches
+
     def build_filter(
         self,
         active_only: bool = True,
@@ -121,9 +1100,128 @@ class RASDMetadataCRUD(
         return combined_filter
 
 
+def suggestion_values(current: snapshot.Snapshot) -> Iterator[tuple[str, str]]:
+    """Yields the values to suggest from a catalogue snapshot.
+
+    Args:
+        current (snapshot.Snapshot): Catalogue snapshot.
+
+    Yields:
+        tuple[str, str]: Field and text of each value.
+    """
+    # Loop through Rows
+    for row in range(current.count):
+        # Yield Values
+        # Lists of taxa are split, so that each taxon can be suggested
+        yield ("title", current.titles[row] or "")
+        yield ("custodian", current.custodians[row] or "")
+        for taxon in SUGGEST_SEPARATORS.split(current.taxa[row] or ""):
+            if taxon.strip():
+                yield ("taxa_covered", taxon.strip())
+
+
+def similarity_documents(current: snapshot.Snapshot) -> Iterator[tuple[bytes, str, int]]:
+    """Yields the documents to compare from a catalogue snapshot.
+
+    Args:
+        current (snapshot.Snapshot): Catalogue snapshot.
+
+    Yields:
+        tuple[bytes, str, int]: ID, text and category flags of each row, where
+            the categories are the keywords followed by the locations.
+    """
+    # Loop through Rows
+    width = len(current.keywords.members)
+    for row in range(current.count):
+        # Yield Document
+        text = " ".join(filter(None, (current.titles[row], current.abstracts[row], current.taxa[row])))
+        yield (current.ids[row], text, current.keywords[row] | current.locations[row] << width)
+
+
+def coverage_heatmap(current: snapshot.Snapshot) -> heatmap.Heatmap:
+    """Builds the coverage heatmap of a catalogue snapshot.
+
+    Args:
+        current (snapshot.Snapshot): Catalogue snapshot.
+
+    Returns:
+        heatmap.Heatmap: Coverage heatmap of the snapshot.
+    """
+    # Build and Return
+    coordinates = {name: np.asarray(column.values) for (name, column) in current.coordinates.items()}
+    return heatmap.Heatmap(coordinates, version=current.version)
+
+
+def uuid_from_cursor(cursor: str, pk: str) -> uuid.UUID:
+    """Decodes the ID of the last result from a cursor.
+
+    Args:
+        cursor (str): Opaque cursor for pagination.
+        pk (str): Primary key attribute.
+
+    Raises:
+        ValueError: Raised if the cursor is invalid.
+
+    Returns:
+        uuid.UUID: ID of the last result.
+    """
+    # Decode Cursor
+    key = cursors.decode_key(cursor, [pk])
+
+    # Handle Invalid IDs
+    try:
+        # Parse and Return
+        return uuid.UUID(str(key[pk]))
+
+    except ValueError as exc:
+        # Error
+        raise ValueError("Invalid cursor") from exc
+
+
+def ranked_entry(
+    db_obj: metadata_models.RASDMetadata,
+) -> tuple[str, dict[str, Any], metadata_schemas.RASDMetadataSummary]:
+    """Constructs the entry for a Metadata in the ranked index.
+
+    Args:
+        db_obj (metadata_models.RASDMetadata): Metadata to construct entry for.
+
+    Returns:
+        tuple[str, dict[str, Any], metadata_schemas.RASDMetadataSummary]: ID,
+            fields to index and Metadata Summary to store.
+    """
+    # Construct Metadata Summary
+    # The Metadata has already been validated, so the summary is not validated again
+    fields = {name: getattr(db_obj, name) for name in metadata_schemas.RASDMetadataSummary.__fields__}
+    summary = metadata_schemas.RASDMetadataSummary.construct(**fields)
+
+    # Construct and Return
+    return (str(db_obj.id), {name: getattr(db_obj, name) for name in RANKING_WEIGHTS}, summary)
+
+
 # Instantiate Metadata CRUD Singleton
 metadata = RASDMetadataCRUD(
     model=metadata_models.RASDMetadata,
     table=settings.SETTINGS.AWS_DYNAMODB_TABLE_METADATA,
     pk="id",
+    indexes={"organisation_id": "OrganisationIndex"},
+    catalogue_table=settings.SETTINGS.AWS_DYNAMODB_TABLE_CATALOGUE,
+    cache_ttl=settings.SETTINGS.CACHE_METADATA_TTL,
+    cache_size=settings.SETTINGS.CACHE_METADATA_SIZE,
+    revisions=True,
+)
+
+# Instantiate Metadata Summary CRUD Singleton
+# This read-only CRUD only reads the attributes required for the summary
+metadata_summary = base.CRUDBase[
+    metadata_schemas.RASDMetadataSummary,
+    metadata_schemas.RASDMetadataCreate,
+    metadata_schemas.RASDMetadataUpdate,
+    uuid.UUID,
+](
+    model=metadata_schemas.RASDMetadataSummary,
+    table=settings.SETTINGS.AWS_DYNAMODB_TABLE_METADATA,
+    pk="id",
+    indexes={"organisation_id": "OrganisationIndex"},
+    projected=True,
 )
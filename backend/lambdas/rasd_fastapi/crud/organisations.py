@@ -98,4 +98,7 @@ organisation = OrganisationCRUD(
     model=org_models.Organisation,
     table=settings.SETTINGS.AWS_DYNAMODB_TABLE_ORGANISATIONS,
     pk="id",
+    cache_ttl=settings.SETTINGS.CACHE_ORGANISATIONS_TTL,
+    cache_size=settings.SETTINGS.CACHE_ORGANISATIONS_SIZE,
+    revisions=True,
 )
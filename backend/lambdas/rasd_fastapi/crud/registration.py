@@ -69,7 +69,7 @@ class RegistrationCRUD(
         if isinstance(obj_in.organisation, uuid.UUID):
             # User has supplied an existing Organisation ID
             # Check whether Organisation exists
-            if not org_crud.organisation.get(db_session, pk=obj_in.organisation):
+            if not org_crud.organisation.get(db_session, pk=obj_in.organisation, cached=False):
                 # Registration must be performed with an Organisation that exists
                 raise ValueError(f"Organisation with ID '{obj_in.organisation}' does not exist")
 
@@ -148,7 +148,7 @@ class RegistrationCRUD(
         # Here we must create the Organisation if it does not already exist
         if isinstance(org, uuid.UUID):
             # Check whether Organisation exists
-            if not org_crud.organisation.get(db_session, pk=org):
+            if not org_crud.organisation.get(db_session, pk=org, cached=False):
                 # Registration must be performed with an Organisation that exists
                 raise ValueError(f"Organisation with ID '{org}' does not exist")
 
@@ -293,4 +293,5 @@ registration = RegistrationCRUD(
     model=reg_models.Registration,
     table=settings.SETTINGS.AWS_DYNAMODB_TABLE_REGISTRATIONS,
     pk="id",
+    ordered=True,
 )
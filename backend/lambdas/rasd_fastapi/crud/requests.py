@@ -14,20 +14,28 @@ import pydantic
 # Local
 from rasd_fastapi import types
 from rasd_fastapi import utils
+from rasd_fastapi.core import aws
 from rasd_fastapi.core import settings
 from rasd_fastapi.crud import base
 from rasd_fastapi.crud import metadata as metadata_crud
 from rasd_fastapi.crud import organisations as org_crud
+from rasd_fastapi.db import budgets
+from rasd_fastapi.db import cursors
 from rasd_fastapi.emails import email
 from rasd_fastapi.models import requests as req_models
 from rasd_fastapi.schemas import audit as audit_schemas
 from rasd_fastapi.schemas import auth as auth_schemas
+from rasd_fastapi.schemas import pagination
 from rasd_fastapi.schemas import requests as req_schemas
 
 # Typing
 from typing import Any, Optional
 
 
+# Constants
+LINK_ATTRIBUTES = {"active"}  # Attributes duplicated onto the custodian link items
+
+
 class DataAccessRequestCRUD(
     base.CRUDBase[
         req_models.DataAccessRequest,
@@ -36,7 +44,34 @@ class DataAccessRequestCRUD(
         types.rasd.RASDIdentifier,
     ],
 ):
-    """Data Access Request CRUD Abstraction."""
+    """Data Access Request CRUD Abstraction.
+
+    A Data Access Request can involve multiple Custodians, whose IDs are stored
+    in the `custodian_ids` list. DynamoDB cannot index the elements of a list,
+    so each Custodian ID is duplicated into a separate custodian link table,
+    with one link item for each Custodian of each Data Access Request. This
+    lets us list the Data Access Requests for a Custodian with a `query`
+    rather than a filtered scan of the entire table.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        custodian_table: str,
+        **kwargs: Any,
+    ) -> None:
+        """Instantiates the Data Access Request CRUD abstraction.
+
+        Args:
+            args (Any): Positional arguments for the CRUD abstraction.
+            custodian_table (str): Table that the custodian links are in.
+            kwargs (Any): Keyword arguments for the CRUD abstraction.
+        """
+        # Instantiate Super Class
+        super().__init__(*args, **kwargs)
+
+        # Instance Variables
+        self.custodian_table = custodian_table
 
     def create_with_user(
         self,
@@ -56,28 +91,35 @@ class DataAccessRequestCRUD(
             req_models.DataAccessRequest: Created DataAccessRequest in the database.
         """
         # Retrieve Metadata for Data Access Request
-        # Duplicates are removed by casting the list of IDs to a set
+        # Duplicates are removed while preserving the order of the IDs, and the
+        # request is based on the items in the database, not cached copies
         metadata = [
-            utils.unwrap_or_404(
-                value=metadata_crud.metadata.get(db_session, pk=metadata_id),
-            ) for metadata_id in set(obj_in.metadata_ids)
+            utils.unwrap_or_404(value=m)
+            for m in metadata_crud.metadata.get_many(
+                db_session,
+                pks=list(dict.fromkeys(obj_in.metadata_ids)),
+                cached=False,
+            )
         ]
 
         # Extract Custodian IDs from Metadata
         # Duplicates are removed via set comprehension, then casting to a list
         custodian_ids = list({m.organisation_id for m in metadata})
 
-        # Retrieve Custodian Organisations for Metadata
+        # Retrieve Custodian Organisations for Metadata and User Organisation
+        # These are all retrieved together in a single batch
+        *orgs, user_org = org_crud.organisation.get_many(
+            db_session,
+            pks=[*custodian_ids, user.organisation_id],
+            cached=False,
+        )
+
+        # Map Custodian Organisations for Metadata
         # Dictionary is a mapping of Organisation IDs to Organisation Objects
         custodian_orgs = {
-            custodian_id: utils.unwrap_or_404(
-                value=org_crud.organisation.get(db_session, pk=custodian_id),
-            ) for custodian_id in custodian_ids
+            custodian_id: utils.unwrap_or_404(value=org) for (custodian_id, org) in zip(custodian_ids, orgs)
         }
 
-        # Retrieve User Organisation
-        user_org = org_crud.organisation.get(db_session, pk=user.organisation_id)
-
         # Check Organisation
         if not user_org:
             # Error
@@ -126,6 +168,9 @@ class DataAccessRequestCRUD(
             requestor_organisation_email=user_org.email,
         )
 
+        # Create Custodian Links
+        self.sync_custodian_links(db_session, db_obj=req)
+
         # Send Created Emails
         email.access_request_created.send(
             to_addresses=[req.requestor_email, req.requestor_organisation_email],
@@ -230,15 +275,21 @@ class DataAccessRequestCRUD(
         updated_dataset_request = req_models.DatasetRequest.parse_obj(updated_data)  # Re-parse to re-run any validation
 
         # Replace Dataset Request Object within Data Access Request
-        db_obj.dataset_requests = [
-            updated_dataset_request if d.id == updated_dataset_request.id else d
-            for d in db_obj.dataset_requests
-        ]
+        # The Data Access Request is updated via a copy, so that the database
+        # update only writes the changes against the original.
+        updated_db_obj = db_obj.copy(
+            update={
+                "dataset_requests": [
+                    updated_dataset_request if d.id == updated_dataset_request.id else d
+                    for d in db_obj.dataset_requests
+                ],
+            },
+        )
 
         # Check if the Data Access Request is now Done
-        if self.is_done(db_obj) and not db_obj.completed_at:
+        if self.is_done(updated_db_obj) and not updated_db_obj.completed_at:
             # Set the `completed_at` Timestamp
-            db_obj.completed_at = utils.utcnow()
+            updated_db_obj.completed_at = utils.utcnow()
 
             # Send Completed Email
             email.access_request_completed.send(
@@ -256,12 +307,18 @@ class DataAccessRequestCRUD(
             )
 
         # Update Data Access Request in Database
-        self.update(
+        updated_db_obj = self.update(
             db_session,
             db_obj=db_obj,
             obj_in=req_schemas.DataAccessRequestUpdate(),  # Dummy object - required for update
+            dataset_requests=updated_db_obj.dataset_requests,
+            completed_at=updated_db_obj.completed_at,
         )
 
+        # Update the Supplied Data Access Request in Place
+        db_obj.dataset_requests = updated_db_obj.dataset_requests
+        db_obj.completed_at = updated_db_obj.completed_at
+
         # Return
         return updated_dataset_request
 
@@ -541,6 +598,312 @@ class DataAccessRequestCRUD(
         # Return
         return dataset_request
 
+    def scan(
+        self,
+        db_session: boto3.Session,
+        *,
+        filter: Optional[con.ConditionBase] = None,  # noqa: A002
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        segments: Optional[int] = None,
+        budget: Optional[budgets.ReadBudget] = None,
+        newest_first: bool = False,
+        consistent: bool = False,
+    ) -> pagination.PaginatedResult[req_models.DataAccessRequest]:
+        """Scans for Data Access Requests matching the supplied filters.
+
+        If the supplied filter restricts the results to a Custodian, and it
+        cannot already be served by a secondary index (or an ordered listing,
+        or a consistent scan), then the custodian link table is queried
+        instead. The remaining filter
+        is applied to the link items, so it may only refer to the `active`
+        attribute (`LINK_ATTRIBUTES`).
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            filter (Optional[con.ConditionBase]): Optional filters to use.
+            limit (Optional[int]): Number of items to limit to.
+            cursor (Optional[str]): Opaque cursor for pagination.
+            segments (Optional[int]): Optional number of parallel segments.
+            budget (Optional[budgets.ReadBudget]): Optional read budget.
+            newest_first (bool): Whether to list the items newest first.
+            consistent (bool): Whether to scan with strongly consistent reads.
+
+        Raises:
+            ValueError: Raised if the cursor is invalid, or if the remaining
+                filter refers to attributes that the custodian links lack.
+
+        Returns:
+            pagination.PaginatedResult[req_models.DataAccessRequest]: Page of
+                retrieved Data Access Requests.
+        """
+        # Split Filter
+        key, _, _ = self.split_key_condition(filter)
+        custodian_id, remaining = self.split_custodian_condition(filter)
+
+        # Check whether the custodian link table should be used
+        if newest_first or consistent or key or not custodian_id:
+            # Allow super class to handle the Scan
+            return super().scan(
+                db_session,
+                filter=filter,
+                limit=limit,
+                cursor=cursor,
+                segments=segments,
+                budget=budget,
+                newest_first=newest_first,
+                consistent=consistent,
+            )
+
+        # Check the Remaining Filter
+        # The link items only carry the `active` attribute, so a filter on any
+        # other attribute would silently match nothing
+        if remaining and (names := base.condition_attributes(remaining) - LINK_ATTRIBUTES):
+            raise ValueError(f"Cannot filter custodian links on: {', '.join(sorted(names))}")
+
+        # Retrieve Table
+        table = aws.REGISTRY.table(self.custodian_table, db_session)
+
+        # Construct Keyword Args for Query
+        keys = ["custodian_id", self.pk]
+        filters = {"FilterExpression": remaining} if remaining else {}
+        start_key = base.decode_start_key(cursor, keys, "custodian_id", custodian_id) if cursor else None
+
+        # Query the Custodian Links
+        links, last_key = self.paginate(
+            table.query,
+            keys=keys,
+            limit=limit,
+            start_key=start_key,
+            budget=budget,
+            KeyConditionExpression=con.Key("custodian_id").eq(custodian_id),
+            **filters,
+        )
+
+        # Retrieve the Linked Data Access Requests in Batches
+        # The batches are charged to the read budget, and if it is exhausted
+        # then a partial page is returned that continues from the last link
+        models: list[req_models.DataAccessRequest] = []
+        for i in range(0, len(links), base.BATCH_GET_SIZE):
+            # Retrieve Batch
+            batch = links[i:i + base.BATCH_GET_SIZE]
+            models += [m for m in self.get_many(db_session, pks=[link[self.pk] for link in batch], budget=budget) if m]
+
+            # Check if we need to keep reading
+            if budget and budget.exhausted and i + base.BATCH_GET_SIZE < len(links):
+                last_key = {k: batch[-1][k] for k in keys}
+                break
+
+        # Construct and Return Paginated Result
+        return pagination.PaginatedResult(
+            count=len(models),
+            cursor=cursors.encode(last_key) if last_key else None,
+            results=models,
+        )
+
+    def split_custodian_condition(
+        self,
+        condition: Optional[con.ConditionBase],
+    ) -> tuple[Optional[str], Optional[con.ConditionBase]]:
+        """Splits a Custodian condition out of the supplied filter.
+
+        Args:
+            condition (Optional[con.ConditionBase]): The filter to split.
+
+        Returns:
+            tuple[Optional[str], Optional[con.ConditionBase]]: The Custodian ID
+                and the remaining filter if applicable.
+        """
+        # Flatten into Individual Conditions
+        conditions = base.conjuncts(condition)
+
+        # Loop through Conditions
+        for c in conditions:
+            # Check for a `custodian_ids` contains condition
+            if isinstance(c, con.Contains):
+                (attr, value) = c.get_expression()["values"]
+                if isinstance(attr, con.Attr) and attr.name == "custodian_ids":
+                    # Recombine the remaining conditions
+                    remaining = [r for r in conditions if r is not c]
+                    combined = functools.reduce(operator.and_, remaining) if remaining else None
+                    return value, combined
+
+        # No Custodian condition
+        return None, condition
+
+    def sync_custodian_links(
+        self,
+        db_session: boto3.Session,
+        *,
+        db_obj: req_models.DataAccessRequest,
+        previous: Optional[req_models.DataAccessRequest] = None,
+    ) -> None:
+        """Writes the custodian link items for a Data Access Request.
+
+        If the previous state of the Data Access Request is provided, then the
+        links for the Custodians that are no longer involved are deleted.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            db_obj (req_models.DataAccessRequest): Data Access Request to link.
+            previous (Optional[req_models.DataAccessRequest]): Optional
+                previous state of the Data Access Request.
+        """
+        # Retrieve Table
+        table = aws.REGISTRY.table(self.custodian_table, db_session)
+
+        # Determine Stale Custodians
+        stale = set(previous.custodian_ids) - set(db_obj.custodian_ids) if previous else set()
+
+        # Write Link Items
+        # Only the attributes required for filtering are duplicated
+        with table.batch_writer() as batch:
+            for custodian_id in stale:
+                batch.delete_item(Key={"custodian_id": str(custodian_id), self.pk: str(db_obj.id)})
+            for custodian_id in db_obj.custodian_ids:
+                batch.put_item(
+                    Item={
+                        "custodian_id": str(custodian_id),
+                        self.pk: str(db_obj.id),
+                        "active": db_obj.active,
+                    }
+                )
+
+    def backfill_custodian_links(
+        self,
+        db_session: boto3.Session,
+    ) -> int:
+        """Writes the custodian link items for all Data Access Requests.
+
+        This only needs to be run once, to link the Data Access Requests that
+        were created before the custodian link table existed.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+
+        Returns:
+            int: Number of Data Access Requests linked.
+        """
+        # Loop through all Data Access Requests
+        count = 0
+        cursor = None
+        while True:
+            # Scan a page of Data Access Requests
+            page = super().scan(db_session, cursor=cursor)
+
+            # Link Data Access Requests
+            for db_obj in page.results:
+                self.sync_custodian_links(db_session, db_obj=db_obj)
+            count += page.count
+
+            # Check for next page
+            if not (cursor := page.cursor):
+                return count
+
+    def update(
+        self,
+        db_session: boto3.Session,
+        *,
+        db_obj: req_models.DataAccessRequest,
+        obj_in: req_schemas.DataAccessRequestUpdate,
+        **kwargs: Any,
+    ) -> req_models.DataAccessRequest:
+        """Updates a Data Access Request and, if required, its custodian links.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            db_obj (req_models.DataAccessRequest): Item to update.
+            obj_in (req_schemas.DataAccessRequestUpdate): Data to update item with.
+            kwargs (Any): Extra data required for update.
+
+        Returns:
+            req_models.DataAccessRequest: Updated item in the database.
+        """
+        # Update Item
+        item = super().update(db_session, db_obj=db_obj, obj_in=obj_in, **kwargs)
+
+        # Check whether the Linked Attributes have Changed
+        if item.custodian_ids != db_obj.custodian_ids or item.active != db_obj.active:
+            self.sync_custodian_links(db_session, db_obj=item, previous=db_obj)
+
+        # Return
+        return item
+
+    def delete(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: types.rasd.RASDIdentifier,
+    ) -> Optional[req_models.DataAccessRequest]:
+        """Deletes a Data Access Request and its custodian links.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (types.rasd.RASDIdentifier): Primary key for item to delete.
+
+        Returns:
+            Optional[req_models.DataAccessRequest]: Deleted item if it exists,
+                else None.
+        """
+        # Delete Item
+        if item := super().delete(db_session, pk=pk):
+            # Retrieve Table
+            table = aws.REGISTRY.table(self.custodian_table, db_session)
+
+            # Delete Link Items
+            with table.batch_writer() as batch:
+                for custodian_id in item.custodian_ids:
+                    batch.delete_item(Key={"custodian_id": str(custodian_id), self.pk: str(item.id)})
+
+        # Return
+        return item
+
+    def deactivate(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: types.rasd.RASDIdentifier,
+    ) -> Optional[req_models.DataAccessRequest]:
+        """Deactivates a Data Access Request and its custodian links.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (types.rasd.RASDIdentifier): Primary key for item to deactivate.
+
+        Returns:
+            Optional[req_models.DataAccessRequest]: Deactivated item if it
+                exists, else None.
+        """
+        # Deactivate and Sync Custodian Links
+        if item := super().deactivate(db_session, pk=pk):
+            self.sync_custodian_links(db_session, db_obj=item)
+
+        # Return
+        return item
+
+    def reactivate(
+        self,
+        db_session: boto3.Session,
+        *,
+        pk: types.rasd.RASDIdentifier,
+    ) -> Optional[req_models.DataAccessRequest]:
+        """Reactivates a Data Access Request and its custodian links.
+
+        Args:
+            db_session (boto3.Session): Database session to use.
+            pk (types.rasd.RASDIdentifier): Primary key for item to reactivate.
+
+        Returns:
+            Optional[req_models.DataAccessRequest]: Reactivated item if it
+                exists, else None.
+        """
+        # Reactivate and Sync Custodian Links
+        if item := super().reactivate(db_session, pk=pk):
+            self.sync_custodian_links(db_session, db_obj=item)
+
+        # Return
+        return item
+
     def build_filter(
         self,
         active_only: bool = True,
@@ -598,4 +961,24 @@ data_access_request = DataAccessRequestCRUD(
     model=req_models.DataAccessRequest,
     table=settings.SETTINGS.AWS_DYNAMODB_TABLE_ACCESS_REQUESTS,
     pk="id",
+    indexes={"requestor_id": "RequestorIndex"},
+    client=True,
+    ordered=True,
+    custodian_table=settings.SETTINGS.AWS_DYNAMODB_TABLE_ACCESS_REQUEST_CUSTODIANS,
+    revisions=True,
+)
+
+# Instantiate Data Access Request Summary CRUD Singleton
+# This read-only CRUD only reads the attributes required for the summary
+data_access_request_summary = base.CRUDBase[
+    req_schemas.DataAccessRequestSummary,
+    req_schemas.DataAccessRequestCreate,
+    req_schemas.DataAccessRequestUpdate,
+    types.rasd.RASDIdentifier,
+](
+    model=req_schemas.DataAccessRequestSummary,
+    table=settings.SETTINGS.AWS_DYNAMODB_TABLE_ACCESS_REQUESTS,
+    pk="id",
+    projected=True,
+    client=True,
 )
@@ -0,0 +1,126 @@
+"""RASD FastAPI Database Read Budgets."""
+
+
+# Standard
+import threading
+import time
+
+# Third-Party
+import fastapi
+
+# Local
+from rasd_fastapi.core import settings
+
+# Typing
+from typing import Any, Optional
+
+
+class ReadBudget:
+    """Budget for the database reads performed while handling a request.
+
+    A paginated `Scan` or `Query` with a selective filter may have to read many
+    pages to find enough matching items. The budget limits the number of items
+    evaluated, the read capacity consumed and the wall-clock time spent, so that
+    a partial page (with a valid cursor) can be returned before the request
+    times out.
+
+    The budget may be shared between the threads of a parallel scan.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_evaluated: Optional[int] = None,
+        max_capacity: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Instantiates the read budget.
+
+        Args:
+            max_evaluated (Optional[int]): Maximum number of items to evaluate.
+            max_capacity (Optional[float]): Maximum read capacity units to
+                consume.
+            deadline (Optional[float]): Time (from `time.monotonic`) to stop
+                reading at.
+        """
+        # Instance Variables
+        self.max_evaluated = max_evaluated
+        self.max_capacity = max_capacity
+        self.deadline = deadline
+        self.evaluated = 0
+        self.capacity = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the budget has been exhausted.
+
+        Returns:
+            bool: True if any part of the budget has been exhausted.
+        """
+        # Check and Return
+        return (
+            (self.max_evaluated is not None and self.evaluated >= self.max_evaluated)
+            or (self.max_capacity is not None and self.capacity >= self.max_capacity)
+            or (self.deadline is not None and time.monotonic() >= self.deadline)
+        )
+
+    def request(self) -> dict[str, Any]:
+        """Constructs the extra keyword arguments for a read request.
+
+        Returns:
+            dict[str, Any]: Keyword arguments to return the consumed capacity if
+                it is budgeted, else empty.
+        """
+        # Construct and Return
+        return {"ReturnConsumedCapacity": "TOTAL"} if self.max_capacity is not None else {}
+
+    def charge(self, response: dict[str, Any]) -> None:
+        """Charges the budget for the reads performed by a request.
+
+        Args:
+            response (dict[str, Any]): Response from the `Scan`, `Query` or
+                `BatchGetItem`.
+        """
+        # Retrieve Usage
+        # `BatchGetItem` returns the items and consumed capacity of each table
+        returned = sum(map(len, response.get("Responses", {}).values())) + len(response.get("Items", []))
+        evaluated = response.get("ScannedCount", returned)
+        consumed = response.get("ConsumedCapacity", {})
+        consumed = consumed if isinstance(consumed, list) else [consumed]
+        capacity = sum(float(c.get("CapacityUnits", 0)) for c in consumed)
+
+        # Lock and Charge
+        with self.lock:
+            self.evaluated += evaluated
+            self.capacity += float(capacity)
+
+
+def read_budget(request: fastapi.Request) -> ReadBudget:
+    """Constructs the read budget for a request.
+
+    The deadline is the configured maximum read time, or the remaining time of
+    the AWS Lambda invocation (less a margin to return the response) if that is
+    sooner.
+
+    Args:
+        request (fastapi.Request): Request to construct the read budget for.
+
+    Returns:
+        ReadBudget: Read budget for the request.
+    """
+    # Calculate Available Time
+    seconds = settings.SETTINGS.AWS_DYNAMODB_READ_BUDGET_SECONDS
+
+    # Check for AWS Lambda Context
+    # The `mangum` adapter injects the AWS Lambda context into the request scope
+    if context := request.scope.get("aws.context"):
+        remaining = context.get_remaining_time_in_millis() / 1000
+        seconds = min(seconds, remaining - settings.SETTINGS.AWS_DYNAMODB_READ_BUDGET_MARGIN)
+
+    # Construct and Return Read Budget
+    return ReadBudget(
+        max_evaluated=settings.SETTINGS.AWS_DYNAMODB_READ_BUDGET_ITEMS,
+        max_capacity=settings.SETTINGS.AWS_DYNAMODB_READ_BUDGET_CAPACITY,
+        deadline=time.monotonic() + seconds,
+    )
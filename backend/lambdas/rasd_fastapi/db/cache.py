@@ -0,0 +1,206 @@
+"""RASD FastAPI Database Read-Through Cache.
+
+Items that are read by their primary key on most requests (such as the
+Organisations of the current user) can be cached in memory, so that a warm
+container doesn't read them from the database again until their entries
+expire.
+
+Each cache holds at most `size` items of a single model, evicting the least
+recently used items first, and each item expires `ttl` seconds after it was
+read. The caches are registered by table, and writes through a CRUD
+invalidate the entries of the written item in every cache of its table. Other
+caches whose entries depend on a table (such as cached API responses, see
+`api.caching`) can be registered in the same way. Writes from other containers
+are not seen until the entries expire, so the `ttl` bounds how stale a cached
+item can be.
+
+Cached items are copied on the way in and out, so that callers are free to
+modify the items that they retrieve.
+"""
+
+
+# Standard
+import collections
+import threading
+import time
+
+# Third-Party
+import pydantic
+
+# Typing
+from typing import Generic, Optional, Protocol, TypeVar
+
+
+# TypeVars
+ModelType = TypeVar("ModelType", bound=pydantic.BaseModel)
+CacheType = TypeVar("CacheType", bound="Cache")
+
+
+class Cache(Protocol):
+    """Cache that can be registered to be invalidated by writes to a table."""
+    name: str
+
+    def invalidate(self, key: str) -> None:
+        """Invalidates the cache after a write.
+
+        Args:
+            key (str): Primary key of the written item.
+        """
+
+    def stats(self) -> dict[str, int]:
+        """Retrieves the statistics of the cache.
+
+        Returns:
+            dict[str, int]: Statistics of the cache.
+        """
+
+
+class ReadCache(Generic[ModelType]):
+    """LRU cache of items read by their primary key."""
+
+    def __init__(self, name: str, ttl: float, size: int) -> None:
+        """Instantiates the read cache.
+
+        Args:
+            name (str): Name of the cache, used when reporting its statistics.
+            ttl (float): Seconds that a cached item is valid for.
+            size (int): Maximum number of items to hold.
+        """
+        # Instance Variables
+        self.name = name
+        self.ttl = ttl
+        self.size = size
+        self.lock = threading.Lock()
+        self.entries: collections.OrderedDict[str, tuple[float, ModelType]] = collections.OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[ModelType]:
+        """Retrieves a copy of a cached item.
+
+        Args:
+            key (str): Primary key of the item.
+
+        Returns:
+            Optional[ModelType]: Copy of the item, or None if it is not cached
+                or has expired.
+        """
+        # Lock
+        with self.lock:
+            # Check Entry
+            entry = self.entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                # Miss
+                self.entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            # Mark as Recently Used
+            self.entries.move_to_end(key)
+            self.hits += 1
+            item = entry[1]
+
+        # Copy and Return
+        return item.copy(deep=True)
+
+    def put(self, key: str, item: ModelType, generation: int) -> None:
+        """Caches a copy of an item.
+
+        Args:
+            key (str): Primary key of the item.
+            item (ModelType): Item to cache.
+            generation (int): Generation of the cache when the item started
+                being read.
+        """
+        # Copy Item
+        item = item.copy(deep=True)
+
+        # Lock
+        with self.lock:
+            # Check Generation
+            # Items read before a write to the same table aren't cached after it
+            if generation != self.generation:
+                return
+
+            # Add Entry
+            self.entries.pop(key, None)
+            self.entries[key] = (time.monotonic(), item)
+
+            # Evict Least Recently Used Entries
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Removes an item from the cache after a write.
+
+        Args:
+            key (str): Primary key of the item.
+        """
+        # Lock
+        with self.lock:
+            # Remove Entry
+            self.entries.pop(key, None)
+            self.generation += 1
+
+    def clear(self) -> None:
+        """Clears the cache and its statistics."""
+        # Lock
+        with self.lock:
+            # Clear Entries and Counters
+            self.entries.clear()
+            self.generation += 1
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Retrieves the statistics of the cache.
+
+        Returns:
+            dict[str, int]: Number of hits, misses and cached items.
+        """
+        # Lock
+        with self.lock:
+            # Return
+            return {"hits": self.hits, "misses": self.misses, "items": len(self.entries)}
+
+
+# Registry of Caches by Table
+CACHES: dict[str, list[Cache]] = {}
+
+
+def register(table: str, cache: CacheType) -> CacheType:
+    """Registers a cache of the items in a table.
+
+    Args:
+        table (str): Table that the items are in.
+        cache (CacheType): Cache to register.
+
+    Returns:
+        CacheType: The registered cache.
+    """
+    # Register and Return
+    CACHES.setdefault(table, []).append(cache)
+    return cache
+
+
+def invalidate(table: str, key: str) -> None:
+    """Removes an item from every cache of its table after a write.
+
+    Args:
+        table (str): Table that the item is in.
+        key (str): Primary key of the item.
+    """
+    # Loop through Caches
+    for cache in CACHES.get(table, []):
+        cache.invalidate(key)
+
+
+def stats() -> dict[str, dict[str, int]]:
+    """Retrieves the statistics of every registered cache.
+
+    Returns:
+        dict[str, dict[str, int]]: Statistics of each cache by name.
+    """
+    # Collect and Return
+    return {cache.name: cache.stats() for caches in CACHES.values() for cache in caches}
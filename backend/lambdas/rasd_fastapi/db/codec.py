@@ -0,0 +1,428 @@
+"""RASD FastAPI DynamoDB Codec.
+
+The `boto3` resource API serialises every item with `TypeSerializer` and
+`TypeDeserializer`, after the models have already been encoded to JSON-able
+dictionaries with `fastapi.encoders.jsonable_encoder`. This module converts
+models and values to and from the DynamoDB wire format (i.e., `AttributeValue`
+dictionaries) directly, so that the low-level client can be used instead.
+
+The `Table` and `Resource` classes wrap the low-level client with the subset of
+the resource API used by the CRUD layer, so they can be used interchangeably.
+"""
+
+
+# Standard
+import datetime
+import decimal
+import enum
+import uuid
+
+# Third-Party
+import boto3.dynamodb.conditions
+import pydantic
+
+# Typing
+from typing import Any
+
+
+# Shortcuts
+AttributeValue = dict[str, Any]
+Item = dict[str, AttributeValue]
+
+
+def encode(value: Any) -> AttributeValue:
+    """Encodes a value as a DynamoDB attribute value.
+
+    Args:
+        value (Any): Value to encode.
+
+    Raises:
+        TypeError: Raised if the value can't be encoded.
+
+    Returns:
+        AttributeValue: Encoded attribute value.
+    """
+    # Check Type
+    # The order matters, as `bool` is an `int` and enums may be `str`s
+    if value is None:
+        return {"NULL": True}
+
+    if isinstance(value, bool):
+        return {"BOOL": value}
+
+    if isinstance(value, enum.Enum):
+        return encode(value.value)
+
+    if isinstance(value, str):
+        return {"S": str(value)}
+
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return {"N": str(value)}
+
+    if isinstance(value, (uuid.UUID, datetime.date)):
+        # Dates and datetimes are both `date`s
+        return {"S": str(value) if isinstance(value, uuid.UUID) else value.isoformat()}
+
+    if isinstance(value, pydantic.BaseModel):
+        return {"M": encode_item(value)}
+
+    if isinstance(value, dict):
+        return {"M": {str(k): encode(v) for (k, v) in value.items()}}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        # Sets are encoded as lists, the same as `jsonable_encoder`
+        return {"L": [encode(v) for v in value]}
+
+    if isinstance(value, bytes):
+        return {"B": value}
+
+    # Error
+    raise TypeError(f"Unable to encode value of type '{type(value).__name__}'")
+
+
+def encode_item(item: Any) -> Item:
+    """Encodes a model or dictionary as a DynamoDB item.
+
+    Args:
+        item (Any): Model or dictionary to encode.
+
+    Returns:
+        Item: Encoded item.
+    """
+    # Check for Model
+    if isinstance(item, pydantic.BaseModel):
+        # Retrieve Fields
+        item = fields(item)
+
+    # Encode and Return
+    return {str(k): encode(v) for (k, v) in item.items()}
+
+
+def fields(model: pydantic.BaseModel) -> dict[str, Any]:
+    """Retrieves the fields of a model by their aliases, without encoding.
+
+    This is a shallow equivalent of `jsonable_encoder`, so that attributes can
+    be added to an item before it is encoded.
+
+    Args:
+        model (pydantic.BaseModel): Model to retrieve the fields of.
+
+    Returns:
+        dict[str, Any]: Values of the fields of the model by their aliases.
+    """
+    # Retrieve and Return
+    return {f.alias: getattr(model, name) for (name, f) in model.__fields__.items()}
+
+
+def decode(value: AttributeValue) -> Any:
+    """Decodes a DynamoDB attribute value.
+
+    Numbers are decoded as `int`s where possible, otherwise as `Decimal`s.
+
+    Args:
+        value (AttributeValue): Attribute value to decode.
+
+    Raises:
+        TypeError: Raised if the attribute value can't be decoded.
+
+    Returns:
+        Any: Decoded value.
+    """
+    # Unpack Attribute Value
+    ((kind, v),) = value.items()
+
+    # Check Type
+    if kind == "S":
+        return v
+
+    if kind == "N":
+        return decode_number(v)
+
+    if kind == "BOOL":
+        return v
+
+    if kind == "NULL":
+        return None
+
+    if kind == "M":
+        return decode_item(v)
+
+    if kind == "L":
+        return [decode(x) for x in v]
+
+    if kind == "SS" or kind == "BS":
+        return set(v)
+
+    if kind == "NS":
+        return {decode_number(x) for x in v}
+
+    if kind == "B":
+        return v
+
+    # Error
+    raise TypeError(f"Unable to decode attribute value of type '{kind}'")
+
+
+def decode_item(item: Item) -> dict[str, Any]:
+    """Decodes a DynamoDB item.
+
+    Args:
+        item (Item): Item to decode.
+
+    Returns:
+        dict[str, Any]: Decoded item.
+    """
+    # Decode and Return
+    return {k: decode(v) for (k, v) in item.items()}
+
+
+def decode_number(value: str) -> Any:
+    """Decodes a DynamoDB number.
+
+    Args:
+        value (str): Number to decode.
+
+    Returns:
+        Any: Decoded number as an `int` if possible, else a `Decimal`.
+    """
+    # Decode and Return
+    return int(value) if value.lstrip("-").isdigit() else decimal.Decimal(value)
+
+
+class Table:
+    """DynamoDB Table using the Low-Level Client.
+
+    Provides the subset of the `boto3` resource `Table` API used by the CRUD
+    layer. Keys, items and expression attribute values are encoded with this
+    codec, and `boto3` conditions are built into expressions.
+    """
+
+    def __init__(self, client: Any, name: str) -> None:
+        """Instantiates the table.
+
+        Args:
+            client (Any): Low-level DynamoDB client.
+            name (str): Name of the table.
+        """
+        # Instance Variables
+        self.client = client
+        self.name = name
+        self.meta = self  # Mirrors `table.meta.client` on resource tables
+
+    def get_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Performs a `GetItem` request.
+
+        Args:
+            kwargs (Any): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Perform Request and Return
+        return self.request(self.client.get_item, kwargs)
+
+    def put_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Performs a `PutItem` request.
+
+        Args:
+            kwargs (Any): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Perform Request and Return
+        return self.request(self.client.put_item, kwargs)
+
+    def update_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Performs an `UpdateItem` request.
+
+        Args:
+            kwargs (Any): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Perform Request and Return
+        return self.request(self.client.update_item, kwargs)
+
+    def delete_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Performs a `DeleteItem` request.
+
+        Args:
+            kwargs (Any): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Perform Request and Return
+        return self.request(self.client.delete_item, kwargs)
+
+    def scan(self, **kwargs: Any) -> dict[str, Any]:
+        """Performs a `Scan` request.
+
+        Args:
+            kwargs (Any): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Perform Request and Return
+        return self.request(self.client.scan, kwargs)
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:
+        """Performs a `Query` request.
+
+        Args:
+            kwargs (Any): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Perform Request and Return
+        return self.request(self.client.query, kwargs)
+
+    def request(self, operation: Any, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Encodes a request, performs it and decodes the response.
+
+        Args:
+            operation (Any): Low-level client method to call.
+            kwargs (dict[str, Any]): Keyword arguments for the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Encode Request and Perform
+        response = operation(TableName=self.name, **encode_request(kwargs))
+
+        # Decode and Return Response
+        return decode_response(response)
+
+
+class Resource:
+    """DynamoDB Resource using the Low-Level Client.
+
+    Provides the subset of the `boto3` resource API used by the CRUD layer.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """Instantiates the resource.
+
+        Args:
+            client (Any): Low-level DynamoDB client.
+        """
+        # Instance Variables
+        self.client = client
+
+    def Table(self, name: str) -> Table:
+        """Constructs a table.
+
+        Args:
+            name (str): Name of the table.
+
+        Returns:
+            Table: Table using the low-level client.
+        """
+        # Construct and Return
+        return Table(self.client, name)
+
+    def batch_get_item(self, *, RequestItems: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        """Performs a `BatchGetItem` request.
+
+        Args:
+            RequestItems (dict[str, Any]): Keys to retrieve for each table.
+            kwargs (Any): Extra keyword arguments for the request, such as
+                `ReturnConsumedCapacity`.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        # Encode Request
+        request = {name: encode_request(table) for (name, table) in RequestItems.items()}
+
+        # Perform Request
+        response = self.client.batch_get_item(RequestItems=request, **kwargs)
+
+        # Decode and Return Response
+        return {
+            "Responses": {name: [decode_item(i) for i in items] for (name, items) in response["Responses"].items()},
+            "UnprocessedKeys": {
+                name: decode_response(table) for (name, table) in response.get("UnprocessedKeys", {}).items()
+            },
+            **({"ConsumedCapacity": response["ConsumedCapacity"]} if "ConsumedCapacity" in response else {}),
+        }
+
+
+def encode_request(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Encodes the keyword arguments of a request for the low-level client.
+
+    Args:
+        kwargs (dict[str, Any]): Keyword arguments in the resource API format.
+
+    Returns:
+        dict[str, Any]: Keyword arguments in the low-level client format.
+    """
+    # Copy Request
+    request = dict(kwargs)
+    names: dict[str, str] = dict(request.pop("ExpressionAttributeNames", {}))
+    values: dict[str, Any] = dict(request.pop("ExpressionAttributeValues", {}))
+
+    # Build Conditions into Expressions
+    # A single builder is used, so the placeholders are unique in the request
+    builder = boto3.dynamodb.conditions.ConditionExpressionBuilder()
+    for (argument, is_key_condition) in [
+        ("KeyConditionExpression", True),
+        ("FilterExpression", False),
+        ("ConditionExpression", False),
+    ]:
+        # Check for Condition
+        condition = request.get(argument)
+        if isinstance(condition, boto3.dynamodb.conditions.ConditionBase):
+            # Build Expression
+            built = builder.build_expression(condition, is_key_condition=is_key_condition)
+            request[argument] = built.condition_expression
+            names |= built.attribute_name_placeholders
+            values |= built.attribute_value_placeholders
+
+    # Encode Keys and Items
+    for argument in ("Key", "Item", "ExclusiveStartKey"):
+        if argument in request:
+            request[argument] = encode_item(request[argument])
+
+    if "Keys" in request:
+        request["Keys"] = [encode_item(k) for k in request["Keys"]]
+
+    # Encode Expression Attributes
+    if names:
+        request["ExpressionAttributeNames"] = names
+
+    if values:
+        request["ExpressionAttributeValues"] = {k: encode(v) for (k, v) in values.items()}
+
+    # Return
+    return request
+
+
+def decode_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Decodes a response from the low-level client.
+
+    Args:
+        response (dict[str, Any]): Response in the low-level client format.
+
+    Returns:
+        dict[str, Any]: Response in the resource API format.
+    """
+    # Copy Response
+    decoded = dict(response)
+
+    # Decode Items and Keys
+    for key in ("Item", "Attributes", "LastEvaluatedKey"):
+        if key in decoded:
+            decoded[key] = decode_item(decoded[key])
+
+    for key in ("Items", "Keys"):
+        if key in decoded:
+            decoded[key] = [decode_item(i) for i in decoded[key]]
+
+    # Return
+    return decoded
+
@@ -0,0 +1,191 @@
+"""RASD FastAPI Signed Pagination Cursors.
+
+A DynamoDB `LastEvaluatedKey` contains every key attribute of the table or
+index that was read, so it can't be reconstructed from the primary key alone.
+Cursors carry the full key as URL-safe base64 encoded JSON, signed with an HMAC
+so that clients can't craft arbitrary exclusive start keys. The cursors are
+opaque to clients, and should be passed back unchanged.
+"""
+
+
+# Standard
+import base64
+import binascii
+import functools
+import hashlib
+import hmac
+import json
+
+# Local
+from rasd_fastapi.core import settings
+
+# Typing
+from typing import Any, Sequence
+
+
+# Constants
+SIGNATURE_SIZE = 16  # Bytes of the HMAC-SHA256 digest to keep
+
+
+def encode(value: Any) -> str:
+    """Encodes and signs a JSON-able value as a cursor.
+
+    Args:
+        value (Any): Value to encode.
+
+    Returns:
+        str: Opaque URL-safe cursor.
+    """
+    # Encode Payload
+    payload = b64encode(json.dumps(value, separators=(",", ":")).encode())
+
+    # Sign and Return
+    return f"{payload}.{sign(payload)}"
+
+
+def decode(cursor: str) -> Any:
+    """Verifies and decodes a value from a cursor.
+
+    Args:
+        cursor (str): Opaque URL-safe cursor.
+
+    Raises:
+        ValueError: Raised if the cursor is invalid or has been tampered with.
+
+    Returns:
+        Any: Decoded value.
+    """
+    # Split Cursor
+    payload, _, signature = cursor.partition(".")
+
+    # Verify Signature
+    # The signatures are compared as bytes, as `compare_digest` only accepts
+    # ASCII strings.
+    if not hmac.compare_digest(signature.encode(), sign(payload).encode()):
+        # Error
+        raise ValueError("Invalid cursor")
+
+    # Handle Decoding Errors
+    try:
+        # Decode and Return
+        return json.loads(b64decode(payload))
+
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        # Error
+        raise ValueError("Invalid cursor") from exc
+
+
+def decode_key(cursor: str, attributes: Sequence[str]) -> dict[str, Any]:
+    """Verifies and decodes an `ExclusiveStartKey` from a cursor.
+
+    Args:
+        cursor (str): Opaque URL-safe cursor.
+        attributes (Sequence[str]): Expected key attributes.
+
+    Raises:
+        ValueError: Raised if the cursor is invalid, or is for another table
+            or index.
+
+    Returns:
+        dict[str, Any]: Decoded key.
+    """
+    # Decode
+    key = decode(cursor)
+
+    # Check Key
+    if not is_key(key, attributes):
+        # Error
+        raise ValueError("Invalid cursor")
+
+    # Return
+    return key  # type: ignore[no-any-return]
+
+
+def is_key(value: Any, attributes: Sequence[str]) -> bool:
+    """Checks whether a decoded value is a key with the expected attributes.
+
+    Args:
+        value (Any): Decoded value to check.
+        attributes (Sequence[str]): Expected key attributes.
+
+    Returns:
+        bool: Whether the value is a valid key.
+    """
+    # Check and Return
+    return (
+        isinstance(value, dict)
+        and set(value) == set(attributes)
+        and all(isinstance(v, (str, int)) and not isinstance(v, bool) for v in value.values())
+    )
+
+
+def sign(payload: str) -> str:
+    """Signs a cursor payload.
+
+    Args:
+        payload (str): Encoded payload to sign.
+
+    Returns:
+        str: URL-safe signature.
+    """
+    # Sign and Return
+    digest = hmac.new(signing_key(), payload.encode(), hashlib.sha256).digest()
+    return b64encode(digest[:SIGNATURE_SIZE])
+
+
+def signing_key() -> bytes:
+    """Retrieves the key to sign cursors with.
+
+    Cursors must be verifiable by every instance of the AWS Lambda, so if a
+    dedicated secret is not configured then the key is derived from the AWS
+    Cognito client secret.
+
+    Returns:
+        bytes: Signing key.
+    """
+    # Retrieve Secret and Derive Key
+    secret = settings.SETTINGS.CURSOR_SECRET_KEY or settings.SETTINGS.AWS_COGNITO_CLIENT_SECRET_KEY
+    return derive_key(secret)
+
+
+@functools.lru_cache(maxsize=None)
+def derive_key(secret: str) -> bytes:
+    """Derives the cursor signing key from a secret.
+
+    Args:
+        secret (str): Secret to derive the key from.
+
+    Returns:
+        bytes: Derived signing key.
+    """
+    # Derive and Return
+    return hmac.new(secret.encode(), b"rasd-pagination-cursor", hashlib.sha256).digest()
+
+
+def b64encode(data: bytes) -> str:
+    """Encodes bytes as unpadded URL-safe base64.
+
+    Args:
+        data (bytes): Data to encode.
+
+    Returns:
+        str: Encoded data.
+    """
+    # Encode and Return
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def b64decode(data: str) -> bytes:
+    """Decodes unpadded URL-safe base64.
+
+    Args:
+        data (str): Data to decode.
+
+    Raises:
+        binascii.Error: Raised if the data is not valid base64.
+
+    Returns:
+        bytes: Decoded data.
+    """
+    # Decode and Return
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
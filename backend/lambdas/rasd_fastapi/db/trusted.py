@@ -0,0 +1,237 @@
+"""RASD FastAPI Trusted Database Loads.
+
+Items read from the database were validated by their models before they were
+written, so re-running every validator when they are read back is redundant.
+This module constructs models from stored items with only the type conversions
+required to turn the stored representation back into Python objects (e.g.,
+strings into `UUID`s, `datetime`s and enums), without running any validators.
+
+Any field with a type that can't be converted cheaply (e.g., URLs and unions)
+falls back to the normal pydantic validation for that field only.
+"""
+
+
+# Standard
+import datetime
+import enum
+import functools
+import uuid
+
+# Third-Party
+import pydantic
+import pydantic.fields
+
+# Typing
+from typing import Any, Callable, Optional, TypeVar
+
+
+# Type Variables
+ModelT = TypeVar("ModelT", bound=pydantic.BaseModel)
+
+# Shortcuts
+Converter = Callable[[Any], Any]
+
+
+def construct(model: type[ModelT], data: dict[str, Any]) -> ModelT:
+    """Constructs a model from a stored item without validation.
+
+    Args:
+        model (type[ModelT]): Model to construct.
+        data (dict[str, Any]): Stored item to construct the model from.
+
+    Raises:
+        pydantic.ValidationError: Raised if a field that falls back to
+            validation is invalid, or if a required field is missing.
+
+    Returns:
+        ModelT: Constructed model.
+    """
+    # Construct Values
+    values: dict[str, Any] = {}
+    fields_set: set[str] = set()
+    for (field, converter) in plan(model):
+        # Check for Value
+        if field.alias not in data:
+            # Check if Required
+            if field.required:
+                # Fully validate to raise the appropriate error
+                return model.parse_obj(data)
+
+            # Use Default
+            values[field.name] = field.get_default()
+            continue
+
+        # Convert Value
+        value = data[field.alias]
+        fields_set.add(field.name)
+        try:
+            values[field.name] = None if value is None else converter(value)
+
+        except (TypeError, ValueError):
+            # Fall back to validating the field
+            values[field.name] = validate(model, field, value)
+
+    # Construct and Return Model
+    return model.construct(_fields_set=fields_set, **values)
+
+
+@functools.lru_cache(maxsize=None)
+def plan(model: type[pydantic.BaseModel]) -> list[tuple[pydantic.fields.ModelField, Converter]]:
+    """Plans the conversion for each of the fields of a model.
+
+    Args:
+        model (type[pydantic.BaseModel]): Model to plan the conversion for.
+
+    Returns:
+        list[tuple[pydantic.fields.ModelField, Converter]]: Each field of the
+            model and the function to convert its stored value.
+    """
+    # Plan and Return
+    return [(field, plan_field(model, field)) for field in model.__fields__.values()]
+
+
+def plan_field(model: type[pydantic.BaseModel], field: pydantic.fields.ModelField) -> Converter:
+    """Plans the conversion for a single field of a model.
+
+    Args:
+        model (type[pydantic.BaseModel]): Model that the field belongs to.
+        field (pydantic.fields.ModelField): Field to plan the conversion for.
+
+    Returns:
+        Converter: Function to convert the stored value of the field.
+    """
+    # Plan Conversion for the Type of the Field
+    converter = plan_type(field.type_)
+
+    # Check Shape of the Field
+    # Unions are singletons with sub-fields, and fall back to validation
+    if converter and field.shape == pydantic.fields.SHAPE_SINGLETON and not field.sub_fields:
+        return converter
+
+    if converter and field.shape == pydantic.fields.SHAPE_LIST:
+        return functools.partial(convert_list, converter)
+
+    # Fall back to validating the field
+    return functools.partial(validate, model, field)
+
+
+def plan_type(type_: Any) -> Optional[Converter]:
+    """Plans the conversion for a single type.
+
+    Args:
+        type_ (Any): Type to plan the conversion for.
+
+    Returns:
+        Optional[Converter]: Function to convert a stored value to the type if
+            it can be converted cheaply, else None.
+    """
+    # Check Type
+    if not isinstance(type_, type):
+        # Not a class (e.g., `Any` or `Literal`)
+        return None
+
+    if issubclass(type_, pydantic.BaseModel):
+        # Nested model
+        return functools.partial(construct, type_)
+
+    if issubclass(type_, enum.Enum):
+        # Enums are constructed from their values
+        return type_
+
+    if issubclass(type_, uuid.UUID):
+        # UUIDs are stored as strings
+        return convert_uuid
+
+    if issubclass(type_, bool):
+        # Booleans are stored natively
+        return bool
+
+    if issubclass(type_, datetime.datetime):
+        # Datetimes are stored as ISO8601 strings
+        return datetime.datetime.fromisoformat
+
+    if issubclass(type_, datetime.date):
+        # Dates (e.g., `ISO8601Date`) are stored as ISO8601 strings
+        return type_.fromisoformat
+
+    if issubclass(type_, pydantic.AnyUrl):
+        # URLs must be parsed into their components
+        return None
+
+    if issubclass(type_, (pydantic.ConstrainedStr, pydantic.EmailStr)) or type_ is str:
+        # Validation of these types returns a plain string
+        return str
+
+    if issubclass(type_, str):
+        # Custom string types (e.g., `DOI` and `RASDIdentifier`)
+        return type_
+
+    if issubclass(type_, int):
+        # Numbers are stored as `Decimal`s
+        return int
+
+    if issubclass(type_, float):
+        # Numbers are stored as `Decimal`s
+        return float
+
+    # Unsupported
+    return None
+
+
+def convert_list(converter: Converter, value: Any) -> list[Any]:
+    """Converts a stored list, element by element.
+
+    Args:
+        converter (Converter): Function to convert each element.
+        value (Any): Stored list to convert.
+
+    Raises:
+        TypeError: Raised if the stored value is not a list.
+
+    Returns:
+        list[Any]: Converted list.
+    """
+    # Check Value
+    if not isinstance(value, list):
+        raise TypeError("Stored value is not a list")
+
+    # Convert and Return
+    return [converter(v) for v in value]
+
+
+def convert_uuid(value: Any) -> uuid.UUID:
+    """Converts a stored UUID.
+
+    Args:
+        value (Any): Stored UUID to convert.
+
+    Returns:
+        uuid.UUID: Converted UUID.
+    """
+    # Convert and Return
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
+def validate(model: type[pydantic.BaseModel], field: pydantic.fields.ModelField, value: Any) -> Any:
+    """Validates a single field of a model.
+
+    Args:
+        model (type[pydantic.BaseModel]): Model that the field belongs to.
+        field (pydantic.fields.ModelField): Field to validate.
+        value (Any): Stored value to validate.
+
+    Raises:
+        pydantic.ValidationError: Raised if the value is invalid.
+
+    Returns:
+        Any: Validated value.
+    """
+    # Validate
+    validated, errors = field.validate(value, {}, loc=field.alias, cls=model)
+
+    # Check for Errors
+    if errors:
+        raise pydantic.ValidationError([errors], model)
+
+    # Return
+    return validated
@@ -1,11 +1,8 @@
 """RASD FastAPI SES Functionality."""
 
 
-# Third-Party
-import boto3
-
 # Local
-from rasd_fastapi.core import settings
+from rasd_fastapi.core import aws
 
 # Typing
 from typing import TYPE_CHECKING
@@ -16,16 +13,10 @@ if TYPE_CHECKING:
 
 
 def ses_client() -> "SESV2Client":
-    """Constructs a configured and authenticated SESv2 client.
+    """Retrieves the shared configured and authenticated SESv2 client.
 
     Returns:
         SESV2Client: Configured and authenticated client.
     """
-    # Instantiate and Return AWS Client
-    return boto3.client(
-        "sesv2",
-        region_name=settings.SETTINGS.AWS_DEFAULT_REGION,
-        aws_access_key_id=settings.SETTINGS.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.SETTINGS.AWS_SECRET_ACCESS_KEY,
-        aws_session_token=settings.SETTINGS.AWS_SESSION_TOKEN,
-    )
+    # Retrieve and Return AWS Client
+    return aws.REGISTRY.client("sesv2")  # type: ignore[no-any-return]
@@ -2,6 +2,7 @@
 
 
 # Third-Party
+import botocore.exceptions
 import fastapi
 import starlette.middleware.cors
 
@@ -9,6 +10,7 @@ import starlette.middleware.cors
 from rasd_fastapi import utils
 from rasd_fastapi.api import middleware
 from rasd_fastapi.api.v1 import api
+from rasd_fastapi.core import aws
 from rasd_fastapi.core import settings
 
 
@@ -40,3 +42,30 @@ app.include_router(api.router, prefix=settings.SETTINGS.API_PREFIX)
 utils.add_redirect(app, "/", app.docs_url)
 utils.add_redirect(app, "/api", app.docs_url)
 utils.add_redirect(app, "/api/v1", app.docs_url)
+
+
+@app.exception_handler(botocore.exceptions.ClientError)
+async def handle_client_error(
+    request: fastapi.Request,
+    exc: botocore.exceptions.ClientError,
+) -> fastapi.Response:
+    """Handles errors returned by AWS.
+
+    If the credentials have expired or been rotated, then the AWS registry is
+    reset, so that later requests use the reloaded credentials.
+
+    Args:
+        request (fastapi.Request): Request that raised the error.
+        exc (botocore.exceptions.ClientError): Error returned by AWS.
+
+    Raises:
+        botocore.exceptions.ClientError: The error is always re-raised, so it
+            is still handled (and logged) as an internal server error.
+    """
+    # Check for Credential Errors
+    if exc.response.get("Error", {}).get("Code") in aws.CREDENTIAL_ERRORS:
+        # Reset Registry
+        aws.REGISTRY.reset()
+
+    # Re-Raise
+    raise exc
@@ -86,3 +86,43 @@ class RASDMetadataSummary(base.BaseSchema):
     locations: list[metadata_vocabs.locations.Location]
     organisation_id: uuid.UUID
     custodian: str
+
+
+class RASDMetadataFacets(base.BaseSchema):
+    """RASDMetadata Facet Counts Schema."""
+    keywords: dict[metadata_vocabs.keywords.Keyword, int]
+    locations: dict[metadata_vocabs.locations.Location, int]
+    formats: dict[metadata_vocabs.formats.Format, int]
+    access_rights: dict[metadata_vocabs.access_rights.AccessRights, int]
+
+
+class RASDMetadataSearchResult(base.BaseSchema):
+    """RASDMetadata Search Result Schema.
+
+    This is a paginated result of Metadata Summaries, with optional facets.
+    """
+    count: int
+    cursor: Optional[str]
+    results: list[RASDMetadataSummary]
+    facets: Optional[RASDMetadataFacets]
+
+
+class RASDMetadataSuggestion(base.BaseSchema):
+    """RASDMetadata Typeahead Suggestion Schema."""
+    field: str  # One of `title`, `taxa_covered` or `custodian`
+    text: str
+    count: int  # Number of active metadata with this value
+
+
+class RASDMetadataHeatmap(base.BaseSchema):
+    """RASDMetadata Coverage Heatmap Schema.
+
+    The counts are the number of active metadata whose bounding boxes intersect
+    each grid cell, in row-major order starting from the south-west cell.
+    """
+    zoom: int
+    cell_size: int  # Size of each cell in degrees
+    rows: int
+    columns: int
+    version: int  # Catalogue version that the counts are of
+    counts: list[int]
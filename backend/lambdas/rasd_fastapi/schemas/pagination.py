@@ -2,18 +2,15 @@
 
 
 # Third-Party
+import pydantic
 import pydantic.generics
 
-# Local
-from rasd_fastapi.models import base as base_models
-from rasd_fastapi.schemas import base as base_schemas
-
 # Typing
-from typing import Generic, Optional, TypeVar, Union
+from typing import Generic, Optional, TypeVar
 
 
 # Constants
-ModelT = TypeVar("ModelT", bound=Union[base_models.BaseModel, base_schemas.BaseSchema])
+ModelT = TypeVar("ModelT", bound=pydantic.BaseModel)
 
 
 class PaginatedResult(pydantic.generics.GenericModel, Generic[ModelT]):
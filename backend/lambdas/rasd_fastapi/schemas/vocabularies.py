@@ -0,0 +1,34 @@
+"""RASD FastAPI Restricted Vocabularies REST API Schemas."""
+
+
+# Local
+from rasd_fastapi.models import metadata_vocabs
+from rasd_fastapi.models import requests_vocabs
+from rasd_fastapi.schemas import base
+
+
+class MetadataVocabularies(base.BaseSchema):
+    """Metadata Restricted Vocabularies Schema."""
+    access_rights: list[metadata_vocabs.access_rights.AccessRights]
+    collection_methods: list[metadata_vocabs.collection_methods.CollectionMethod]
+    formats: list[metadata_vocabs.formats.Format]
+    keywords: list[metadata_vocabs.keywords.Keyword]
+    locations: list[metadata_vocabs.locations.Location]
+    security_classifications: list[metadata_vocabs.security_classifications.SecurityClassification]
+
+
+class AccessRequestVocabularies(base.BaseSchema):
+    """Data Access Request Restricted Vocabularies Schema."""
+    accesses: list[requests_vocabs.access.Access]
+    areas: list[requests_vocabs.area.Area]
+    frequencies: list[requests_vocabs.frequency.Frequency]
+    industry_classifications: list[requests_vocabs.anzsic.IndustryClassification]
+    purposes: list[requests_vocabs.purposes.Purpose]
+    research_classifications: list[requests_vocabs.anzsrc.ResearchClassification]
+
+
+class Vocabularies(base.BaseSchema):
+    """Restricted Vocabularies Bundle Schema."""
+    version: str
+    metadata: MetadataVocabularies
+    access_requests: AccessRequestVocabularies
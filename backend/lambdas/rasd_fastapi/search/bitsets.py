@@ -0,0 +1,62 @@
+"""RASD FastAPI Search Bitsets.
+
+Sets of rows are represented as Python integers, where bit `i` is set if row
+`i` is in the set. This makes intersections and unions of large sets single
+(C level) operations.
+"""
+
+
+# Typing
+from typing import Iterable, Iterator
+
+
+def from_rows(rows: Iterable[int], count: int) -> int:
+    """Constructs a bitset of rows.
+
+    The bits are set in a byte array, rather than by combining integers, so
+    that the cost grows linearly with the number of rows.
+
+    Args:
+        rows (Iterable[int]): Rows to set.
+        count (int): Number of rows that could be set.
+
+    Returns:
+        int: Bitset of the rows.
+    """
+    # Set Bits
+    bits = bytearray(-(-count // 8))
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+
+    # Convert and Return
+    return int.from_bytes(bits, "little")
+
+
+def rows(bitset: int) -> Iterator[int]:
+    """Yields the rows of a bitset.
+
+    Args:
+        bitset (int): Bitset of rows.
+
+    Yields:
+        int: Rows in ascending order.
+    """
+    # Yield Rows from the Lowest Set Bit
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+def count(bitset: int) -> int:
+    """Counts the rows of a bitset.
+
+    Args:
+        bitset (int): Bitset of rows.
+
+    Returns:
+        int: Number of rows.
+    """
+    # Count and Return
+    # `int.bit_count` is only available from Python 3.10
+    return bin(bitset).count("1")
@@ -0,0 +1,112 @@
+"""RASD FastAPI Coverage Heatmap.
+
+The heatmap counts the Metadata whose bounding boxes intersect each cell of a
+grid, at a few zoom levels. The grids are built from the coordinate columns of
+the catalogue snapshot with vectorised accumulation, by adding each box to the
+corners of a 2D difference array and then taking its cumulative sums.
+
+The cells are ordered from the south-west, row by row, and the boxes are
+assigned to cells in the same way as the spatial index (see `search.spatial`).
+"""
+
+
+# Third-Party
+import numpy as np
+
+
+# Constants
+ZOOM_LEVELS = (10, 5, 1)  # Size of the grid cells at each zoom level, in degrees
+
+
+class Heatmap:
+    """Counts of bounding boxes in grid cells at each zoom level."""
+
+    def __init__(
+        self,
+        coordinates: dict[str, np.ndarray],
+        version: int,
+    ) -> None:
+        """Builds the heatmap.
+
+        Args:
+            coordinates (dict[str, np.ndarray]): The `north`, `south`, `east`
+                and `west` coordinates of each row.
+            version (int): Catalogue version that the heatmap is of.
+        """
+        # Instance Variables
+        self.version = version
+        self.grids = [accumulate(size, **coordinates) for size in ZOOM_LEVELS]
+
+    def counts(self, zoom: int) -> np.ndarray:
+        """Retrieves the counts of a zoom level.
+
+        Args:
+            zoom (int): Zoom level.
+
+        Returns:
+            np.ndarray: Copy of the grid of counts, of shape (rows, columns).
+        """
+        # Copy and Return
+        return self.grids[zoom].copy()
+
+
+def accumulate(
+    size: int,
+    north: np.ndarray,
+    south: np.ndarray,
+    east: np.ndarray,
+    west: np.ndarray,
+) -> np.ndarray:
+    """Counts the bounding boxes that intersect each cell of a grid.
+
+    Args:
+        size (int): Size of the grid cells, in degrees.
+        north (np.ndarray): Northern latitude of each box.
+        south (np.ndarray): Southern latitude of each box.
+        east (np.ndarray): Eastern longitude of each box.
+        west (np.ndarray): Western longitude of each box.
+
+    Returns:
+        np.ndarray: Grid of counts, of shape (rows, columns).
+    """
+    # Calculate Cell Ranges
+    # Boxes that cross the antimeridian are split into two ranges of columns,
+    # unless their ends are in the same column, in which case they cover every
+    # column
+    (first, last) = (cell(np.minimum(south, north), size, 180), cell(np.maximum(south, north), size, 180))
+    (start, end) = (cell(west, size, 360), cell(east, size, 360))
+    crosses = west > east
+    split = crosses & (start > end)
+    rows = (np.concatenate([first, first[split]]), np.concatenate([last, last[split]]))
+    columns = (
+        np.concatenate([np.where(crosses & ~split, 0, start), np.zeros(np.count_nonzero(split), dtype=np.int64)]),
+        np.concatenate([np.where(crosses, 360 // size - 1, end), end[split]]),
+    )
+
+    # Add Boxes to the Corners of a Difference Array
+    difference = np.zeros((180 // size + 1, 360 // size + 1), dtype=np.int32)
+    np.add.at(difference, (rows[0], columns[0]), 1)
+    np.add.at(difference, (rows[0], columns[1] + 1), -1)
+    np.add.at(difference, (rows[1] + 1, columns[0]), -1)
+    np.add.at(difference, (rows[1] + 1, columns[1] + 1), 1)
+
+    # Sum and Return
+    grid: np.ndarray = difference.cumsum(axis=0).cumsum(axis=1)[:-1, :-1]
+    return grid
+
+
+def cell(degrees: np.ndarray, size: int, extent: int) -> np.ndarray:
+    """Calculates the grid cell indexes of latitudes or longitudes.
+
+    Args:
+        degrees (np.ndarray): Latitudes or longitudes, in degrees.
+        size (int): Size of the grid cells, in degrees.
+        extent (int): Extent of the axis, in degrees (180 for latitudes and
+            360 for longitudes).
+
+    Returns:
+        np.ndarray: Cell index of each value.
+    """
+    # Calculate and Return
+    indexes: np.ndarray = np.clip((np.asarray(degrees) + extent // 2) // size, 0, extent // size - 1).astype(np.int64)
+    return indexes
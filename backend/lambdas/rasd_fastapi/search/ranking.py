@@ -0,0 +1,251 @@
+"""RASD FastAPI Ranked Search.
+
+Documents are ranked with BM25, where the term frequencies and lengths of the
+fields of each document are weighted and summed before scoring (i.e., a simple
+form of BM25F). This lets a match in the `title` count for more than a match
+in the `abstract`.
+
+The index is held in memory, so that it can be cached by a warm container and
+updated incrementally as documents change.
+"""
+
+
+# Standard
+import collections
+import enum
+import heapq
+import math
+import threading
+import time
+
+# Local
+from rasd_fastapi.search import tokens
+
+# Typing
+from typing import Any, Callable, Iterable, Optional
+
+
+# Constants
+K1 = 1.2  # Term frequency saturation
+B = 0.75  # Document length normalisation
+
+
+class RankedIndex:
+    """In-memory BM25 index of documents.
+
+    Each document is stored alongside its postings, so that searches can return
+    the documents themselves without reading them from the database again.
+    """
+
+    def __init__(self, weights: dict[str, float]) -> None:
+        """Instantiates the ranked index.
+
+        Args:
+            weights (dict[str, float]): Weight of each field to index.
+        """
+        # Instance Variables
+        self.weights = weights
+        self.lock = threading.RLock()
+        self.documents: dict[str, Any] = {}
+        self.lengths: dict[str, float] = {}
+        self.terms: dict[str, list[str]] = {}
+        self.postings: dict[str, dict[str, float]] = collections.defaultdict(dict)
+        self.total_length = 0.0
+        self.built_at: Optional[float] = None
+
+    def stale(self, ttl: float) -> bool:
+        """Checks whether the index needs to be rebuilt.
+
+        Args:
+            ttl (float): Seconds that a built index is valid for.
+
+        Returns:
+            bool: Whether the index has not been built, or has expired.
+        """
+        # Check and Return
+        return self.built_at is None or time.monotonic() - self.built_at > ttl
+
+    def rebuild(self, entries: Iterable[tuple[str, dict[str, Any], Any]]) -> None:
+        """Rebuilds the index from scratch.
+
+        The new index is built alongside the current one, which is only
+        replaced once it is complete, so searches are never served from a
+        partial index.
+
+        Args:
+            entries (Iterable[tuple[str, dict[str, Any], Any]]): ID, fields and
+                stored document of every document to index.
+        """
+        # Build New Index
+        index = RankedIndex(self.weights)
+        for (doc_id, fields, document) in entries:
+            index.add(doc_id, fields, document)
+
+        # Lock and Replace Index
+        with self.lock:
+            self.documents = index.documents
+            self.lengths = index.lengths
+            self.terms = index.terms
+            self.postings = index.postings
+            self.total_length = index.total_length
+            self.built_at = time.monotonic()
+
+    def add(self, doc_id: str, fields: dict[str, Any], document: Any) -> None:
+        """Adds or replaces a document in the index.
+
+        Args:
+            doc_id (str): ID of the document.
+            fields (dict[str, Any]): Values of the fields to index.
+            document (Any): Document to store and return from searches.
+        """
+        # Count Weighted Term Frequencies
+        frequencies: dict[str, float] = collections.defaultdict(float)
+        for (field, weight) in self.weights.items():
+            for term in tokens.tokenise(field_text(fields.get(field))):
+                frequencies[term] += weight
+
+        # Lock
+        with self.lock:
+            # Remove Existing Document
+            self.remove(doc_id)
+
+            # Add Document
+            self.documents[doc_id] = document
+            self.lengths[doc_id] = sum(frequencies.values())
+            self.terms[doc_id] = list(frequencies)
+            self.total_length += self.lengths[doc_id]
+            for (term, frequency) in frequencies.items():
+                self.postings[term][doc_id] = frequency
+
+    def remove(self, doc_id: str) -> None:
+        """Removes a document from the index if it exists.
+
+        Args:
+            doc_id (str): ID of the document.
+        """
+        # Lock
+        with self.lock:
+            # Check for Document
+            if doc_id not in self.documents:
+                return
+
+            # Remove Postings
+            # Only the postings of the terms in the document are visited
+            for term in self.terms.pop(doc_id):
+                del self.postings[term][doc_id]
+                if not self.postings[term]:
+                    del self.postings[term]
+
+            # Remove Document
+            del self.documents[doc_id]
+            self.total_length -= self.lengths.pop(doc_id)
+
+    def get_many(self, doc_ids: Iterable[str]) -> list[Optional[Any]]:
+        """Retrieves stored documents.
+
+        Args:
+            doc_ids (Iterable[str]): IDs of the documents.
+
+        Returns:
+            list[Optional[Any]]: Stored documents in the same order as the
+                supplied IDs, with None for documents that aren't indexed.
+        """
+        # Lock
+        with self.lock:
+            # Retrieve and Return
+            return [self.documents.get(doc_id) for doc_id in doc_ids]
+
+    def matches(self, query: str) -> set[str]:
+        """Finds the documents that contain any of the query terms.
+
+        Args:
+            query (str): Free text query.
+
+        Returns:
+            set[str]: IDs of the matching documents.
+        """
+        # Lock
+        with self.lock:
+            # Union Postings and Return
+            return set().union(*(self.postings.get(t, {}) for t in set(tokens.tokenise(query))))
+
+    def search(
+        self,
+        query: str,
+        k: Optional[int] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> list[tuple[float, Any]]:
+        """Searches the index for the documents most relevant to a query.
+
+        Only the documents that contain at least one of the query terms are
+        scored, and the top `k` are selected with a heap rather than sorting
+        every match.
+
+        Args:
+            query (str): Free text query.
+            k (Optional[int]): Number of documents to return, or all matching
+                documents if not supplied.
+            predicate (Optional[Callable[[Any], bool]]): Optional filter that
+                stored documents must satisfy to be returned.
+
+        Returns:
+            list[tuple[float, Any]]: Score and stored document of the most
+                relevant documents, in descending order of relevance.
+        """
+        # Lock
+        with self.lock:
+            # Calculate Collection Statistics
+            count = len(self.documents)
+            average_length = self.total_length / count if count else 0.0
+
+            # Accumulate Scores Term at a Time
+            scores: dict[str, float] = collections.defaultdict(float)
+            for term in set(tokens.tokenise(query)):
+                # Retrieve Postings
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+
+                # Score Documents
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for (doc_id, frequency) in postings.items():
+                    norm = K1 * (1 - B + B * self.lengths[doc_id] / average_length)
+                    scores[doc_id] += idf * frequency * (K1 + 1) / (frequency + norm)
+
+            # Filter Matches
+            # Ties are broken by ID, so that the order is stable across pages
+            matches = (
+                (score, doc_id) for (doc_id, score) in scores.items()
+                if predicate is None or predicate(self.documents[doc_id])
+            )
+
+            # Select Top Matches
+            top = heapq.nlargest(k, matches) if k is not None else sorted(matches, reverse=True)
+
+            # Return
+            return [(score, self.documents[doc_id]) for (score, doc_id) in top]
+
+
+def field_text(value: Any) -> str:
+    """Converts the value of a field to text for indexing.
+
+    Args:
+        value (Any): Value of the field, such as a string or list of enums.
+
+    Returns:
+        str: Text of the field.
+    """
+    # Check Type
+    if value is None:
+        return ""
+
+    if isinstance(value, (list, tuple, set)):
+        # Join the text of each element
+        return " ".join(field_text(v) for v in value)
+
+    if isinstance(value, enum.Enum):
+        # Enums are indexed by their values
+        return str(value.value)
+
+    # Return
+    return str(value)
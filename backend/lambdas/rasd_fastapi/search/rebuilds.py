@@ -0,0 +1,86 @@
+"""RASD FastAPI Background Index Rebuilds.
+
+Indexes that are built from a scan of a table are rebuilt on a background
+thread, so that searches keep being served from the current index while the
+scan runs, rather than waiting for it. Only one rebuild of each index runs at a
+time, however many searches find the index stale.
+
+The rebuild runs on its own thread rather than on the shared thread pool (see
+`aws.Registry.executor`), as the scan submits its segments to that pool.
+
+On AWS Lambda the process is frozen between invocations, so a background
+rebuild only makes progress while a request is being handled, and could
+otherwise leave a stale index in service indefinitely. Callers bound the
+staleness by waiting for the rebuild once an index has been due for one for
+longer than `SEARCH_REBUILD_GRACE_SECONDS`.
+"""
+
+
+# Standard
+import concurrent.futures
+import threading
+
+# Typing
+from typing import Callable, Optional
+
+
+class Rebuild:
+    """Single-flight background rebuild of an index."""
+
+    def __init__(self, name: str) -> None:
+        """Instantiates the rebuild.
+
+        Args:
+            name (str): Name of the rebuild thread.
+        """
+        # Instance Variables
+        self.name = name
+        self.lock = threading.Lock()
+        self.future: Optional[concurrent.futures.Future[None]] = None
+
+    def start(self, build: Callable[[], None]) -> concurrent.futures.Future[None]:
+        """Starts a rebuild, unless one is already running.
+
+        Args:
+            build (Callable[[], None]): Function that rebuilds the index.
+
+        Returns:
+            concurrent.futures.Future[None]: Future of the running rebuild,
+                which can be waited on when there is no index to serve yet.
+        """
+        # Lock
+        with self.lock:
+            # Check for Running Rebuild
+            # A failed rebuild is done, so it is retried by the next search
+            if self.future is None or self.future.done():
+                # Start Rebuild
+                self.future = concurrent.futures.Future()
+                thread = threading.Thread(target=run, args=(build, self.future), name=self.name, daemon=True)
+                thread.start()
+
+            # Return
+            return self.future
+
+
+def run(build: Callable[[], None], future: concurrent.futures.Future[None]) -> None:
+    """Runs a rebuild, and sets its outcome on its future.
+
+    Args:
+        build (Callable[[], None]): Function that rebuilds the index.
+        future (concurrent.futures.Future[None]): Future of the rebuild.
+    """
+    # Mark Future as Running
+    future.set_running_or_notify_cancel()
+
+    # Handle Errors
+    try:
+        # Rebuild
+        build()
+
+    except BaseException as exc:
+        # Set Error
+        future.set_exception(exc)
+
+    else:
+        # Set Result
+        future.set_result(None)
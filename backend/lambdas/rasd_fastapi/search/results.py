@@ -0,0 +1,180 @@
+"""RASD FastAPI Search Result Cache.
+
+The ordered IDs of the results of a search are cached under a normalised key of
+the search, so that later pages of the same search are served by slicing the
+cached list, rather than ranking or querying the index again.
+
+The cache holds at most `size` IDs across all of its result sets, evicting the
+least recently used result sets first, and each result set expires `ttl`
+seconds after it was built. Writes clear the cache, and each clear increments
+its generation, so that a result set built from data read before a write is
+never cached after it.
+"""
+
+
+# Standard
+import collections
+import datetime
+import hashlib
+import json
+import threading
+import time
+
+# Typing
+from typing import Any, Callable, Optional
+
+
+class ResultCache:
+    """LRU cache of the ordered result IDs of searches."""
+
+    def __init__(self, size: int, ttl: float) -> None:
+        """Instantiates the result cache.
+
+        Args:
+            size (int): Maximum number of IDs to hold across all result sets.
+            ttl (float): Seconds that a cached result set is valid for.
+        """
+        # Instance Variables
+        self.size = size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: collections.OrderedDict[str, tuple[float, list[str]]] = collections.OrderedDict()
+        self.total = 0
+        self.generation = 0
+
+    def get(self, key: str) -> Optional[list[str]]:
+        """Retrieves a cached result set.
+
+        Args:
+            key (str): Normalised key of the search.
+
+        Returns:
+            Optional[list[str]]: Ordered result IDs, or None if they are not
+                cached or have expired.
+        """
+        # Lock
+        with self.lock:
+            # Check Entry
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            # Check Expiry
+            (built_at, ids) = entry
+            if time.monotonic() - built_at > self.ttl:
+                self.discard(key)
+                return None
+
+            # Mark as Recently Used and Return
+            self.entries.move_to_end(key)
+            return ids
+
+    def put(self, key: str, ids: list[str], generation: int) -> None:
+        """Caches a result set.
+
+        Args:
+            key (str): Normalised key of the search.
+            ids (list[str]): Ordered result IDs.
+            generation (int): Generation of the cache when the result set
+                started being built.
+        """
+        # Lock
+        with self.lock:
+            # Check Generation and Size
+            # Result sets that are larger than the whole cache aren't cached
+            if generation != self.generation or len(ids) > self.size:
+                return
+
+            # Add Entry
+            self.discard(key)
+            self.entries[key] = (time.monotonic(), ids)
+            self.total += len(ids)
+
+            # Evict Least Recently Used Entries
+            while self.total > self.size:
+                self.discard(next(iter(self.entries)))
+
+    def fetch(self, key: str, build: Callable[[], list[str]]) -> list[str]:
+        """Retrieves a cached result set, building and caching it if required.
+
+        Args:
+            key (str): Normalised key of the search.
+            build (Callable[[], list[str]]): Builds the ordered result IDs.
+
+        Returns:
+            list[str]: Ordered result IDs.
+        """
+        # Check Cache
+        ids = self.get(key)
+        if ids is None:
+            # Build and Cache Result Set
+            # The result set is built outside of the lock, so that other
+            # searches aren't blocked while it is built
+            generation = self.generation
+            ids = build()
+            self.put(key, ids, generation)
+
+        # Return
+        return ids
+
+    def clear(self) -> None:
+        """Clears the cache after a write."""
+        # Lock
+        with self.lock:
+            # Clear Entries
+            self.entries.clear()
+            self.total = 0
+            self.generation += 1
+
+    def discard(self, key: str) -> None:
+        """Removes a result set if it is cached.
+
+        The lock must be held by the caller.
+
+        Args:
+            key (str): Normalised key of the search.
+        """
+        # Remove Entry
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total -= len(entry[1])
+
+
+def key(**params: Any) -> str:
+    """Constructs the normalised key of a search.
+
+    Sets are sorted, so that searches that only differ in the order of their
+    parameters share a key.
+
+    Args:
+        params (Any): Normalised parameters of the search.
+
+    Returns:
+        str: Key of the search.
+    """
+    # Serialise Parameters
+    encoded = json.dumps(params, sort_keys=True, separators=(",", ":"), default=normalise)
+
+    # Hash and Return
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def normalise(value: Any) -> Any:
+    """Converts a search parameter to a JSON-able value.
+
+    Args:
+        value (Any): Value of the parameter.
+
+    Returns:
+        Any: JSON-able value.
+    """
+    # Convert Sets
+    if isinstance(value, (set, frozenset)):
+        return sorted(normalise(v) for v in value)
+
+    # Convert Dates
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+
+    # Convert Everything Else
+    return str(value)
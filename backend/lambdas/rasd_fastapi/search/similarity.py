@@ -0,0 +1,188 @@
+"""RASD FastAPI Similar Metadata.
+
+Each Metadata is represented by a vector of the TF-IDF weights of the terms in
+its text, concatenated with a one-hot encoding of its categories (i.e., its
+keywords and locations). The vectors are normalised, so that the dot product of
+two vectors is their cosine similarity.
+
+The nearest neighbours of every row are computed when the index is built, by
+multiplying the matrix of vectors by its transpose in blocks of rows to bound
+the memory used. Retrieving the neighbours of a row is then a lookup.
+"""
+
+
+# Standard
+import collections
+import math
+
+# Third-Party
+import numpy as np
+
+# Local
+from rasd_fastapi.search import tokens
+
+# Typing
+from typing import Iterable, Optional
+
+
+# Constants
+NEIGHBOURS = 20  # Number of neighbours stored for each row
+MAX_TERMS = 1024  # Maximum size of the TF-IDF vocabulary, which bounds the cost of the products
+BLOCK_SIZE = 256  # Rows multiplied at a time when computing the neighbours
+TEXT_WEIGHT = 1.0  # Weight of the text in the similarity
+CATEGORY_WEIGHT = 0.5  # Weight of the categories in the similarity
+
+
+class SimilarityIndex:
+    """Precomputed nearest neighbours of documents."""
+
+    def __init__(
+        self,
+        documents: Iterable[tuple[bytes, str, int]],
+        width: int,
+        version: int,
+    ) -> None:
+        """Builds the similarity index.
+
+        Args:
+            documents (Iterable[tuple[bytes, str, int]]): ID, text and category
+                flags of each row, where bit `i` of the flags is set if the row
+                has the `i`th category.
+            width (int): Number of categories.
+            version (int): Catalogue version that the index is of.
+        """
+        # Collect Documents
+        rows = list(documents)
+        matrix = vectors((text for (_, text, _) in rows), (flags for (_, _, flags) in rows), width)
+
+        # Instance Variables
+        self.version = version
+        self.rows = {doc_id: row for (row, (doc_id, _, _)) in enumerate(rows)}
+        (self.neighbours, self.scores) = neighbours(matrix, NEIGHBOURS)
+
+    def similar(self, doc_id: bytes, limit: int) -> Optional[list[tuple[int, float]]]:
+        """Retrieves the nearest neighbours of a document.
+
+        Args:
+            doc_id (bytes): ID of the document.
+            limit (int): Number of neighbours to return.
+
+        Returns:
+            Optional[list[tuple[int, float]]]: Row and cosine similarity of the
+                nearest neighbours, in descending order of similarity, or None
+                if the document isn't indexed.
+        """
+        # Retrieve Row
+        row = self.rows.get(doc_id)
+        if row is None:
+            return None
+
+        # Return
+        # Rows without any similarity to the document are padded with -1
+        return [
+            (int(r), float(s))
+            for (r, s) in zip(self.neighbours[row, :limit], self.scores[row, :limit])
+            if r >= 0
+        ]
+
+
+def vectors(texts: Iterable[str], categories: Iterable[int], width: int) -> np.ndarray:
+    """Constructs the normalised vectors of documents.
+
+    The vocabulary is limited to the `MAX_TERMS` terms that are in the most
+    documents, ignoring terms that are only in one document, as they can't
+    contribute to the similarity of any pair of documents.
+
+    Args:
+        texts (Iterable[str]): Text of each document.
+        categories (Iterable[int]): Category flags of each document.
+        width (int): Number of categories.
+
+    Returns:
+        np.ndarray: Matrix with the normalised vector of each document.
+    """
+    # Count Terms
+    counts = [collections.Counter(tokens.tokenise(text)) for text in texts]
+    frequencies = collections.Counter(term for count in counts for term in count)
+    terms = [term for (term, frequency) in frequencies.most_common(MAX_TERMS) if frequency > 1]
+    vocabulary = {term: column for (column, term) in enumerate(terms)}
+
+    # Construct TF-IDF Vectors
+    # Term frequencies are sub-linear, and the inverse document frequencies
+    # are smoothed
+    text = np.zeros((len(counts), len(terms)), dtype=np.float32)
+    for (row, count) in enumerate(counts):
+        for (term, frequency) in count.items():
+            if (column := vocabulary.get(term)) is not None:
+                text[row, column] = 1 + math.log(frequency)
+    document_frequencies = np.array([frequencies[term] for term in terms], dtype=np.float32)
+    text *= np.log((1 + len(counts)) / (1 + document_frequencies)) + 1
+
+    # Construct One-Hot Category Vectors
+    category = np.zeros((len(counts), width), dtype=np.float32)
+    for (row, flags) in enumerate(categories):
+        category[row] = [(flags >> i) & 1 for i in range(width)]
+
+    # Combine and Return
+    return normalise(np.hstack([normalise(text) * TEXT_WEIGHT, normalise(category) * CATEGORY_WEIGHT]))
+
+
+def neighbours(matrix: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Computes the nearest neighbours of each row by cosine similarity.
+
+    Args:
+        matrix (np.ndarray): Matrix with the normalised vector of each row.
+        k (int): Number of neighbours to compute.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Rows and similarities of the nearest
+            neighbours of each row, in descending order of similarity. Rows
+            without any similarity are -1.
+    """
+    # Allocate Neighbours
+    count = len(matrix)
+    k = min(k, count - 1)
+    rows = np.full((count, max(k, 0)), -1, dtype=np.int32)
+    scores = np.zeros((count, max(k, 0)), dtype=np.float32)
+    if k <= 0:
+        return (rows, scores)
+
+    # Loop through Blocks of Rows
+    for start in range(0, count, BLOCK_SIZE):
+        # Compute Similarities of the Block
+        # Each row is excluded from its own neighbours
+        similarities = matrix[start:start + BLOCK_SIZE] @ matrix.T
+        block = np.arange(len(similarities))
+        similarities[block, block + start] = -np.inf
+
+        # Select Top Neighbours and Sort
+        top = np.argpartition(similarities, -k, axis=1)[:, -k:]
+        top_scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        rows[start:start + BLOCK_SIZE] = np.take_along_axis(top, order, axis=1)
+        scores[start:start + BLOCK_SIZE] = np.take_along_axis(top_scores, order, axis=1)
+
+    # Remove Neighbours without any Similarity
+    rows[scores <= 0] = -1
+
+    # Return
+    return (rows, scores)
+
+
+def normalise(matrix: np.ndarray) -> np.ndarray:
+    """Normalises the rows of a matrix to unit length.
+
+    Rows of zeros are left as zeros.
+
+    Args:
+        matrix (np.ndarray): Matrix to normalise.
+
+    Returns:
+        np.ndarray: Normalised matrix.
+    """
+    # Calculate Norms
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    # Normalise and Return
+    normalised: np.ndarray = matrix / np.maximum(norms, np.finfo(np.float32).tiny)
+    return normalised
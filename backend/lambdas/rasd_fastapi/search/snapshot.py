@@ -0,0 +1,771 @@
+"""RASD FastAPI Metadata Catalogue Snapshot.
+
+A snapshot is a compact, versioned and read-only binary file of the searchable
+fields of every active Metadata. The fields are stored column by column and the
+file is memory-mapped, so only the pages that are touched are read from disk.
+Summaries are only decoded for the rows that are returned.
+
+Searches and facet counts are answered with bitsets of the rows that have each
+facet value, which are built from the columns when first used and cached with
+the snapshot. Text filters match substrings of the lowercased `title` and
+`abstract`, like the `title_lower` and `abstract_lower` filters of a table
+scan, and are answered by scanning a lowercased copy of each text column.
+
+The file is laid out as follows (little-endian):
+
+    Header:     magic (8s), format (H), version (Q), built_at (d), count (I),
+                number of columns (H)
+    Directory:  for each column - name (16s), offset (Q), length (Q)
+    Columns:    each aligned to 8 bytes
+
+The columns are encoded as:
+
+    UUID:       `count` * 16 bytes, so the rows can be binary searched by ID.
+    Text:       validity bitmap, offset table of `count + 1` * uint32 and then
+                the UTF-8 encoded values.
+    Integer:    `count` fixed width integers, such as the int16 coordinates and
+                the int32 date ordinals.
+    Flags:      `count` * `width` bytes, where bit `i` is set if the row
+                contains the `i`th member of the enumeration.
+"""
+
+
+# Standard
+import bisect
+import collections
+import enum
+import functools
+import itertools
+import mmap
+import os
+import struct
+import tempfile
+import time
+import uuid
+
+# Local
+from rasd_fastapi.models.metadata_vocabs import access_rights
+from rasd_fastapi.models.metadata_vocabs import formats
+from rasd_fastapi.models.metadata_vocabs import keywords
+from rasd_fastapi.models.metadata_vocabs import locations
+from rasd_fastapi.models import metadata as metadata_models
+from rasd_fastapi.schemas import metadata as metadata_schemas
+from rasd_fastapi.search import bitsets
+from rasd_fastapi.search import spatial
+from rasd_fastapi.search import temporal
+
+# Typing
+from typing import Any, Generic, Iterable, Iterator, Optional, Sequence, Type, TypeVar
+
+
+# Constants
+MAGIC = b"RASDSNAP"
+FORMAT = 5  # Incremented whenever the layout or columns change
+HEADER = struct.Struct("<8sHQdIH")
+DIRECTORY_ENTRY = struct.Struct("<16sQQ")
+ALIGNMENT = 8
+UUID_SIZE = 16
+OFFSET = struct.Struct("<I")
+FACETS = ("keywords", "locations", "formats", "access_rights")
+BITSETS = (*FACETS, "organisation_id")
+COORDINATES = ("north", "south", "east", "west")
+DATES = ("temporal_from", "temporal_to")
+
+# Types
+EnumType = TypeVar("EnumType", bound=enum.Enum)
+
+
+class UUIDColumn(Sequence[bytes]):
+    """Column of UUIDs, as their 16 byte big-endian representations."""
+
+    def __init__(self, view: memoryview) -> None:
+        """Instantiates the column.
+
+        Args:
+            view (memoryview): Encoded column.
+        """
+        # Instance Variables
+        self.view = view
+
+    def __len__(self) -> int:
+        """Number of rows in the column."""
+        # Return
+        return len(self.view) // UUID_SIZE
+
+    def __getitem__(self, row: int) -> bytes:  # type: ignore[override]
+        """Retrieves the UUID bytes of a row.
+
+        Args:
+            row (int): Row to retrieve.
+
+        Raises:
+            IndexError: Raised if the row is out of range, which also ends
+                iteration over the column.
+
+        Returns:
+            bytes: UUID bytes of the row.
+        """
+        # Check Row
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+
+        # Return
+        return bytes(self.view[row * UUID_SIZE:(row + 1) * UUID_SIZE])
+
+    @staticmethod
+    def encode(values: Sequence[uuid.UUID]) -> bytes:
+        """Encodes a column of UUIDs.
+
+        Args:
+            values (Sequence[uuid.UUID]): Values to encode.
+
+        Returns:
+            bytes: Encoded column.
+        """
+        # Encode and Return
+        return b"".join(v.bytes for v in values)
+
+
+class IntColumn(Sequence[int]):
+    """Column of fixed width integers.
+
+    The column is cast to the native byte order without copying it, which is
+    little-endian on both AWS Lambda architectures.
+    """
+
+    def __init__(self, view: memoryview, typecode: str) -> None:
+        """Instantiates the column.
+
+        Args:
+            view (memoryview): Encoded column.
+            typecode (str): `struct` format character of the integers.
+        """
+        # Instance Variables
+        self.values = view.cast(typecode)
+
+    def __len__(self) -> int:
+        """Number of rows in the column."""
+        # Return
+        return len(self.values)
+
+    def __getitem__(self, row: int) -> int:  # type: ignore[override]
+        """Retrieves the integer of a row.
+
+        Args:
+            row (int): Row to retrieve.
+
+        Returns:
+            int: Integer of the row.
+        """
+        # Return
+        return self.values[row]
+
+    @staticmethod
+    def encode(values: Sequence[int], typecode: str) -> bytes:
+        """Encodes a column of fixed width integers.
+
+        Args:
+            values (Sequence[int]): Values to encode.
+            typecode (str): `struct` format character of the integers.
+
+        Returns:
+            bytes: Encoded column.
+        """
+        # Encode and Return
+        return struct.pack(f"<{len(values)}{typecode}", *values)
+
+
+class TextColumn(Sequence[Optional[str]]):
+    """Column of optional strings."""
+
+    def __init__(self, view: memoryview, count: int) -> None:
+        """Instantiates the column.
+
+        Args:
+            view (memoryview): Encoded column.
+            count (int): Number of rows in the column.
+        """
+        # Split Column
+        validity = bitmap_size(count)
+        self.size = count
+        self.validity = view[:validity]
+        self.offsets = view[validity:validity + (count + 1) * OFFSET.size].cast("I")
+        self.data = view[validity + (count + 1) * OFFSET.size:]
+
+    def __len__(self) -> int:
+        """Number of rows in the column."""
+        # Return
+        return self.size
+
+    def __getitem__(self, row: int) -> Optional[str]:  # type: ignore[override]
+        """Decodes the string of a row.
+
+        Args:
+            row (int): Row to decode.
+
+        Returns:
+            Optional[str]: String of the row, or None if it is null.
+        """
+        # Check Validity
+        if not self.validity[row // 8] & (1 << row % 8):
+            return None
+
+        # Decode and Return
+        return str(self.data[self.offsets[row]:self.offsets[row + 1]], "utf-8")
+
+    @staticmethod
+    def encode(values: Sequence[Optional[str]]) -> bytes:
+        """Encodes a column of optional strings.
+
+        Args:
+            values (Sequence[Optional[str]]): Values to encode.
+
+        Returns:
+            bytes: Encoded column.
+        """
+        # Encode Values
+        validity = bytearray(bitmap_size(len(values)))
+        offsets = [0]
+        data = bytearray()
+        for (row, value) in enumerate(values):
+            if value is not None:
+                validity[row // 8] |= 1 << row % 8
+                data += value.encode()
+            offsets.append(len(data))
+
+        # Join and Return
+        return bytes(validity) + struct.pack(f"<{len(offsets)}I", *offsets) + bytes(data)
+
+
+class FlagsColumn(Sequence[int], Generic[EnumType]):
+    """Column of sets of enumeration members, as bit flags."""
+
+    def __init__(self, view: memoryview, members: Type[EnumType]) -> None:
+        """Instantiates the column.
+
+        Args:
+            view (memoryview): Encoded column.
+            members (Type[EnumType]): Enumeration of the sets.
+        """
+        # Instance Variables
+        self.view = view
+        self.members: list[EnumType] = list(members)
+        self.width = flags_width(members)
+
+    def __len__(self) -> int:
+        """Number of rows in the column."""
+        # Return
+        return len(self.view) // self.width
+
+    def __getitem__(self, row: int) -> int:  # type: ignore[override]
+        """Retrieves the flags of a row.
+
+        Args:
+            row (int): Row to retrieve.
+
+        Returns:
+            int: Flags of the row.
+        """
+        # Return
+        return int.from_bytes(self.view[row * self.width:(row + 1) * self.width], "little")
+
+    def decode(self, row: int) -> list[EnumType]:
+        """Decodes the enumeration members of a row.
+
+        Args:
+            row (int): Row to decode.
+
+        Returns:
+            list[EnumType]: Enumeration members of the row, in declaration
+                order.
+        """
+        # Decode and Return
+        flags = self[row]
+        return [m for (i, m) in enumerate(self.members) if flags & (1 << i)]
+
+    @staticmethod
+    def encode(values: Sequence[Iterable[EnumType]], members: Type[EnumType]) -> bytes:
+        """Encodes a column of sets of enumeration members.
+
+        Args:
+            values (Sequence[Iterable[EnumType]]): Values to encode.
+            members (Type[EnumType]): Enumeration of the sets.
+
+        Returns:
+            bytes: Encoded column.
+        """
+        # Encode and Return
+        ordered: list[EnumType] = list(members)
+        index = {m: i for (i, m) in enumerate(ordered)}
+        width = flags_width(members)
+        return b"".join(sum(1 << index[v] for v in set(value)).to_bytes(width, "little") for value in values)
+
+
+class Snapshot:
+    """Memory-mapped Metadata catalogue snapshot."""
+
+    def __init__(self, path: str) -> None:
+        """Opens and memory-maps a snapshot.
+
+        Args:
+            path (str): Path to the snapshot.
+
+        Raises:
+            ValueError: Raised if the file is not a snapshot of this format.
+        """
+        # Memory-Map File
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Parse Header
+        view = memoryview(self.mmap)
+        (magic, fmt, self.version, self.built_at, self.count, columns) = HEADER.unpack_from(view)
+        if magic != MAGIC or fmt != FORMAT:
+            # Error
+            raise ValueError(f"Unsupported snapshot: {path}")
+
+        # Parse Directory
+        directory = {}
+        for i in range(columns):
+            (name, offset, length) = DIRECTORY_ENTRY.unpack_from(view, HEADER.size + i * DIRECTORY_ENTRY.size)
+            directory[name.rstrip(b"\0").decode()] = view[offset:offset + length]
+
+        # Columns
+        self.path = path
+        self.ids = UUIDColumn(directory["id"])
+        self.organisation_ids = UUIDColumn(directory["organisation_id"])
+        self.titles = TextColumn(directory["title"], self.count)
+        self.abstracts = TextColumn(directory["abstract"], self.count)
+        self.custodians = TextColumn(directory["custodian"], self.count)
+        self.taxa = TextColumn(directory["taxa_covered"], self.count)
+        self.keywords = FlagsColumn(directory["keywords"], keywords.Keyword)
+        self.locations = FlagsColumn(directory["locations"], locations.Location)
+        self.formats = FlagsColumn(directory["formats"], formats.Format)
+        self.access_rights = FlagsColumn(directory["access_rights"], access_rights.AccessRights)
+        self.coordinates = {name: IntColumn(directory[name], "h") for name in COORDINATES}
+        self.dates = {name: IntColumn(directory[name], "i") for name in DATES}
+
+    def summary(self, row: int) -> metadata_schemas.RASDMetadataSummary:
+        """Decodes the Metadata Summary of a row.
+
+        Args:
+            row (int): Row to decode.
+
+        Returns:
+            metadata_schemas.RASDMetadataSummary: Metadata Summary of the row.
+        """
+        # Decode Text
+        title = self.titles[row] or ""
+        abstract = self.abstracts[row]
+
+        # Construct and Return
+        # The fields were validated when the snapshot was written
+        return metadata_schemas.RASDMetadataSummary.construct(
+            active=True,
+            id=uuid.UUID(bytes=self.ids[row]),
+            title=title,
+            title_lower=title.lower(),
+            abstract=abstract,
+            abstract_lower=abstract.lower() if abstract is not None else None,
+            keywords=self.keywords.decode(row),
+            locations=self.locations.decode(row),
+            organisation_id=uuid.UUID(bytes=self.organisation_ids[row]),
+            custodian=self.custodians[row] or "",
+        )
+
+    def start(self, after: Optional[uuid.UUID]) -> int:
+        """Finds the first row after an ID.
+
+        Args:
+            after (Optional[uuid.UUID]): ID to start after, or None to start
+                from the first row.
+
+        Returns:
+            int: First row after the ID.
+        """
+        # Binary Search and Return
+        return bisect.bisect_right(self.ids, after.bytes) if after else 0
+
+    def rows(self, ids: Iterable[uuid.UUID]) -> int:
+        """Constructs the bitset of the rows of a set of IDs.
+
+        Args:
+            ids (Iterable[uuid.UUID]): IDs to find. IDs that are not in the
+                snapshot are ignored.
+
+        Returns:
+            int: Bitset of the rows.
+        """
+        # Binary Search for each ID
+        rows = []
+        for value in ids:
+            row = bisect.bisect_left(self.ids, value.bytes)
+            if row < self.count and self.ids[row] == value.bytes:
+                rows.append(row)
+
+        # Return
+        return bitsets.from_rows(rows, self.count)
+
+    def identifiers(self, mask: int) -> set[uuid.UUID]:
+        """Retrieves the IDs of the rows of a bitset.
+
+        Args:
+            mask (int): Bitset of rows.
+
+        Returns:
+            set[uuid.UUID]: IDs of the rows.
+        """
+        # Decode and Return
+        return {uuid.UUID(bytes=self.ids[row]) for row in bitsets.rows(mask)}
+
+    @functools.cached_property
+    def bitsets(self) -> dict[str, dict[Any, int]]:
+        """Bitsets of the rows with each value of each facet and organisation.
+
+        The bitsets are built on first use, and cached for the lifetime of the
+        snapshot.
+
+        Returns:
+            dict[str, dict[Any, int]]: Bitsets of each value of each facet.
+        """
+        # Collect Rows of each Value
+        rows: dict[str, dict[Any, list[int]]] = {name: collections.defaultdict(list) for name in BITSETS}
+        for row in range(self.count):
+            for name in FACETS:
+                for member in getattr(self, name).decode(row):
+                    rows[name][member].append(row)
+            rows["organisation_id"][self.organisation_ids[row]].append(row)
+
+        # Construct Bitsets and Return
+        return {
+            name: {v: bitsets.from_rows(r, self.count) for (v, r) in values.items()}
+            for (name, values) in rows.items()
+        }
+
+    @functools.cached_property
+    def texts(self) -> dict[str, tuple[str, list[int]]]:
+        """Lowercased `title` and `abstract` of every row, for substring scans.
+
+        The values of each column are joined into a single string, with each
+        value followed by a null separator. The joined strings are built on
+        first use, and cached for the lifetime of the snapshot.
+
+        Returns:
+            dict[str, tuple[str, list[int]]]: Joined text of each text field,
+                and the offset that each row starts at (followed by the length
+                of the text).
+        """
+        # Join Lowercased Values
+        texts = {}
+        for (name, column) in (("title", self.titles), ("abstract", self.abstracts)):
+            values = [(column[row] or "").lower() + "\0" for row in range(self.count)]
+            starts = list(itertools.accumulate((len(v) for v in values), initial=0))
+            texts[name] = ("".join(values), starts)
+
+        # Return
+        return texts
+
+    def contains(self, name: str, text: str) -> int:
+        """Constructs the bitset of the rows whose text contains a substring.
+
+        Args:
+            name (str): Name of the text field.
+            text (str): Substring to find, case insensitive.
+
+        Returns:
+            int: Bitset of the rows.
+        """
+        # Check Substring
+        # A null separator can never be part of a match
+        needle = text.lower()
+        if "\0" in needle:
+            return 0
+
+        # Find Matches
+        # After a match, the search skips to the start of the next row
+        (joined, starts) = self.texts[name]
+        rows = []
+        position = joined.find(needle)
+        while position != -1:
+            row = bisect.bisect_right(starts, position) - 1
+            rows.append(row)
+            position = joined.find(needle, starts[row + 1])
+
+        # Return
+        return bitsets.from_rows(rows, self.count)
+
+    @functools.cached_property
+    def grid(self) -> spatial.GridIndex:
+        """Grid index of the bounding boxes of the rows.
+
+        The index is built on first use, and cached for the lifetime of the
+        snapshot.
+
+        Returns:
+            spatial.GridIndex: Grid index of the bounding boxes.
+        """
+        # Decode Bounding Boxes
+        columns = [self.coordinates[name] for name in COORDINATES]
+        boxes = [spatial.BoundingBox(*(column[row] for column in columns)) for row in range(self.count)]
+
+        # Build and Return
+        return spatial.GridIndex(boxes)
+
+    @functools.cached_property
+    def intervals(self) -> temporal.IntervalIndex:
+        """Interval index of the temporal coverage of the rows.
+
+        The index is built on first use, and cached for the lifetime of the
+        snapshot.
+
+        Returns:
+            temporal.IntervalIndex: Interval index of the temporal coverage.
+        """
+        # Build and Return
+        return temporal.IntervalIndex(*(self.dates[name] for name in DATES))
+
+    def mask(
+        self,
+        *,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        keywords: Optional[set[keywords.Keyword]] = None,
+        locations: Optional[set[locations.Location]] = None,
+        organisation_id: Optional[uuid.UUID] = None,
+        bbox: Optional[spatial.BoundingBox] = None,
+        coverage: Optional[temporal.Interval] = None,
+    ) -> int:
+        """Constructs the bitset of the rows that match the search filters.
+
+        Args:
+            title (Optional[str]): Text that the `title` must contain (case
+                insensitive).
+            abstract (Optional[str]): Text that the `abstract` must contain
+                (case insensitive).
+            keywords (Optional[set[keywords.Keyword]]): Keywords of which the
+                row must contain at least one.
+            locations (Optional[set[locations.Location]]): Locations of which
+                the row must contain at least one.
+            organisation_id (Optional[uuid.UUID]): Organisation of the row.
+            bbox (Optional[spatial.BoundingBox]): Bounding box that the row
+                must overlap.
+            coverage (Optional[temporal.Interval]): Interval that the temporal
+                coverage of the row must overlap.
+
+        Returns:
+            int: Bitset of the matching rows.
+        """
+        # Start with every Row
+        mask: int = (1 << self.count) - 1
+
+        # Intersect Text Filters
+        for (name, text) in (("title", title), ("abstract", abstract)):
+            if text:
+                mask &= self.contains(name, text)
+
+        # Intersect Facet Filters
+        for (name, values) in (("keywords", keywords), ("locations", locations)):
+            if values:
+                mask &= self.any_of(name, values)
+
+        # Intersect Organisation Filter
+        if organisation_id:
+            mask &= self.bitsets["organisation_id"].get(organisation_id.bytes, 0)
+
+        # Intersect Spatial Filter
+        if bbox:
+            mask &= self.grid.mask(bbox)
+
+        # Intersect Temporal Filter
+        if coverage:
+            mask &= self.intervals.mask(coverage)
+
+        # Return
+        return mask
+
+    def any_of(self, name: str, values: Iterable[Any]) -> int:
+        """Constructs the bitset of the rows with any of the values of a facet.
+
+        Args:
+            name (str): Name of the facet.
+            values (Iterable[Any]): Values of the facet.
+
+        Returns:
+            int: Bitset of the rows.
+        """
+        # Union Bitsets
+        mask = 0
+        for value in values:
+            mask |= self.bitsets[name].get(value, 0)
+
+        # Return
+        return mask
+
+    def search(
+        self,
+        *,
+        start: int = 0,
+        **filters: Any,
+    ) -> Iterator[int]:
+        """Yields the rows that match the search filters.
+
+        Args:
+            start (int): Row to start from.
+            filters (Any): Search filters (see `mask`).
+
+        Yields:
+            int: Matching rows, in order of ID.
+        """
+        # Construct Mask from the Start Row and Yield Rows
+        yield from bitsets.rows(self.mask(**filters) >> start << start)
+
+    def facets(
+        self,
+        *,
+        restrict: Optional[int] = None,
+        keywords: Optional[set[keywords.Keyword]] = None,
+        locations: Optional[set[locations.Location]] = None,
+        **filters: Any,
+    ) -> dict[str, dict[Any, int]]:
+        """Counts the matching rows with each value of each facet.
+
+        The counts for each facet are intersected with every filter except the
+        filter on that facet itself, so that they are the number of results
+        that selecting another value of the facet would add.
+
+        Args:
+            restrict (Optional[int]): Optional bitset to restrict the rows to.
+            keywords (Optional[set[keywords.Keyword]]): Keywords filter.
+            locations (Optional[set[locations.Location]]): Locations filter.
+            filters (Any): Other search filters (see `mask`).
+
+        Returns:
+            dict[str, dict[Any, int]]: Count of each value of each facet.
+        """
+        # Construct Mask of the Filters that don't have Facets
+        common = self.mask(**filters)
+        if restrict is not None:
+            common &= restrict
+
+        # Construct Masks of the Facet Filters
+        selected = {
+            "keywords": self.any_of("keywords", keywords) if keywords else None,
+            "locations": self.any_of("locations", locations) if locations else None,
+        }
+
+        # Count Values of each Facet
+        counts = {}
+        for name in FACETS:
+            # Intersect with every other Facet Filter
+            mask = common
+            for (other, values) in selected.items():
+                if other != name and values is not None:
+                    mask &= values
+
+            # Count
+            counts[name] = {m: bitsets.count(self.bitsets[name].get(m, 0) & mask) for m in getattr(self, name).members}
+
+        # Return
+        return counts
+
+
+def write(
+    directory: str,
+    version: int,
+    metadata: Iterable[metadata_models.RASDMetadata],
+) -> str:
+    """Writes a snapshot of Metadata.
+
+    The snapshot is written to a temporary file and then renamed, so that a
+    partially written snapshot is never opened.
+
+    Args:
+        directory (str): Directory to write the snapshot to.
+        version (int): Catalogue version that the snapshot is of.
+        metadata (Iterable[metadata_models.RASDMetadata]): Metadata to write.
+
+    Returns:
+        str: Path to the written snapshot.
+    """
+    # Sort Metadata by ID
+    rows = sorted(metadata, key=lambda s: s.id.bytes)
+
+    # Encode Columns
+    columns = {
+        "id": UUIDColumn.encode([s.id for s in rows]),
+        "organisation_id": UUIDColumn.encode([s.organisation_id for s in rows]),
+        "title": TextColumn.encode([s.title for s in rows]),
+        "abstract": TextColumn.encode([s.abstract for s in rows]),
+        "custodian": TextColumn.encode([s.custodian for s in rows]),
+        "taxa_covered": TextColumn.encode([s.taxa_covered for s in rows]),
+        "keywords": FlagsColumn.encode([s.keywords for s in rows], keywords.Keyword),
+        "locations": FlagsColumn.encode([s.locations for s in rows], locations.Location),
+        "formats": FlagsColumn.encode([{s.stored_format, *(s.available_formats or [])} for s in rows], formats.Format),
+        "access_rights": FlagsColumn.encode([[s.access_rights] for s in rows], access_rights.AccessRights),
+        **{
+            name: IntColumn.encode([getattr(s, f"{name}_bounding_coordinate") for s in rows], "h")
+            for name in COORDINATES
+        },
+        "temporal_from": IntColumn.encode([s.temporal_coverage_from.toordinal() for s in rows], "i"),
+        "temporal_to": IntColumn.encode([s.temporal_coverage_to.toordinal() for s in rows], "i"),
+    }
+
+    # Lay Out Columns
+    header = HEADER.pack(MAGIC, FORMAT, version, time.time(), len(rows), len(columns))
+    offset = align(HEADER.size + len(columns) * DIRECTORY_ENTRY.size)
+    entries = []
+    for (name, data) in columns.items():
+        entries.append(DIRECTORY_ENTRY.pack(name.encode(), offset, len(data)))
+        offset = align(offset + len(data))
+
+    # Write Snapshot to Temporary File
+    (fd, temporary) = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as file:
+        file.write(header + b"".join(entries))
+        for data in columns.values():
+            file.write(b"\0" * (align(file.tell()) - file.tell()))
+            file.write(data)
+
+    # Rename and Return
+    path = os.path.join(directory, f"rasd-metadata-{version}.snapshot")
+    os.replace(temporary, path)
+    return path
+
+
+def align(offset: int) -> int:
+    """Rounds an offset up to the column alignment.
+
+    Args:
+        offset (int): Offset to align.
+
+    Returns:
+        int: Aligned offset.
+    """
+    # Align and Return
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def bitmap_size(count: int) -> int:
+    """Calculates the size of a validity bitmap, padded for the offset table.
+
+    Args:
+        count (int): Number of rows.
+
+    Returns:
+        int: Size of the bitmap in bytes.
+    """
+    # Calculate and Return
+    return -(-count // 32) * 4
+
+
+def flags_width(members: Type[enum.Enum]) -> int:
+    """Calculates the width of the flags of an enumeration.
+
+    Args:
+        members (Type[enum.Enum]): Enumeration.
+
+    Returns:
+        int: Width of the flags in bytes.
+    """
+    # Calculate and Return
+    return max(1, -(-len(members) // 8))
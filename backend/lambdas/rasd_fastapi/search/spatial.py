@@ -0,0 +1,220 @@
+"""RASD FastAPI Spatial Search.
+
+The bounding boxes of the Metadata are indexed in a fixed grid of cells, where
+each cell has a bitset of the rows whose bounding boxes intersect it. The rows
+in cells that lie entirely within a query bounding box are known to overlap
+it, so only the rows in the cells along its boundary are checked exactly.
+
+Bounding boxes whose western longitude is greater than their eastern longitude
+are treated as crossing the antimeridian.
+"""
+
+
+# Standard
+import math
+
+# Local
+from rasd_fastapi.search import bitsets
+
+# Typing
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+
+# Constants
+GRID_DEGREES = 10  # Size of each grid cell
+LATITUDE_CELLS = 180 // GRID_DEGREES
+LONGITUDE_CELLS = 360 // GRID_DEGREES
+
+
+class BoundingBox(NamedTuple):
+    """Geographic bounding box, in degrees."""
+    north: float
+    south: float
+    east: float
+    west: float
+
+    def latitudes(self) -> tuple[float, float]:
+        """Latitude range of the bounding box.
+
+        Returns:
+            tuple[float, float]: Southern and northern latitudes.
+        """
+        # Return
+        return (min(self.south, self.north), max(self.south, self.north))
+
+    def longitudes(self) -> list[tuple[float, float]]:
+        """Longitude ranges of the bounding box.
+
+        Returns:
+            list[tuple[float, float]]: Western and eastern longitudes of each
+                range, split in two if the box crosses the antimeridian.
+        """
+        # Check for Antimeridian
+        if self.west > self.east:
+            return [(self.west, 180), (-180, self.east)]
+
+        # Return
+        return [(self.west, self.east)]
+
+    def overlaps(self, other: "BoundingBox") -> bool:
+        """Checks whether the bounding box overlaps another.
+
+        Bounding boxes that only touch are considered to overlap.
+
+        Args:
+            other (BoundingBox): Bounding box to check.
+
+        Returns:
+            bool: Whether the bounding boxes overlap.
+        """
+        # Check Latitudes
+        (south, north) = self.latitudes()
+        (other_south, other_north) = other.latitudes()
+        if south > other_north or other_south > north:
+            return False
+
+        # Check Longitudes and Return
+        return any(
+            west <= other_east and other_west <= east
+            for (west, east) in self.longitudes()
+            for (other_west, other_east) in other.longitudes()
+        )
+
+
+class GridIndex:
+    """Grid index of bounding boxes."""
+
+    def __init__(self, boxes: Sequence[BoundingBox]) -> None:
+        """Builds the grid index.
+
+        Args:
+            boxes (Sequence[BoundingBox]): Bounding box of each row.
+        """
+        # Collect Rows of each Cell
+        rows: dict[tuple[int, int], list[int]] = {}
+        for (row, box) in enumerate(boxes):
+            for cell in cells(box):
+                rows.setdefault(cell, []).append(row)
+
+        # Instance Variables
+        self.boxes = boxes
+        self.cells = {cell: bitsets.from_rows(r, len(boxes)) for (cell, r) in rows.items()}
+
+    def mask(self, box: BoundingBox) -> int:
+        """Constructs the bitset of the rows that overlap a bounding box.
+
+        Args:
+            box (BoundingBox): Bounding box to search.
+
+        Returns:
+            int: Bitset of the overlapping rows.
+        """
+        # Collect Cells
+        matches = 0
+        candidates = 0
+        inside = set(interior_cells(box))
+        for cell in cells(box):
+            if cell in inside:
+                matches |= self.cells.get(cell, 0)
+            else:
+                candidates |= self.cells.get(cell, 0)
+
+        # Check Boundary Candidates Exactly
+        exact = [row for row in bitsets.rows(candidates & ~matches) if self.boxes[row].overlaps(box)]
+
+        # Return
+        return matches | bitsets.from_rows(exact, len(self.boxes))
+
+
+def bounding_box(
+    north: Optional[float],
+    south: Optional[float],
+    east: Optional[float],
+    west: Optional[float],
+) -> Optional[BoundingBox]:
+    """Constructs a bounding box from optional coordinates.
+
+    Args:
+        north (Optional[float]): Northern latitude.
+        south (Optional[float]): Southern latitude.
+        east (Optional[float]): Eastern longitude.
+        west (Optional[float]): Western longitude.
+
+    Raises:
+        ValueError: Raised if only some of the coordinates are supplied.
+
+    Returns:
+        Optional[BoundingBox]: Bounding box, or None if no coordinates are
+            supplied.
+    """
+    # Check Coordinates
+    if north is None and south is None and east is None and west is None:
+        return None
+
+    if north is None or south is None or east is None or west is None:
+        # Error
+        raise ValueError("All of `north`, `south`, `east` and `west` are required for a spatial filter")
+
+    # Construct and Return
+    return BoundingBox(north=north, south=south, east=east, west=west)
+
+
+def cells(box: BoundingBox) -> Iterator[tuple[int, int]]:
+    """Yields the grid cells that a bounding box intersects.
+
+    Args:
+        box (BoundingBox): Bounding box.
+
+    Yields:
+        tuple[int, int]: Latitude and longitude index of each cell.
+    """
+    # Loop through Cells
+    (south, north) = box.latitudes()
+    for latitude in range(latitude_cell(south), latitude_cell(north) + 1):
+        for (west, east) in box.longitudes():
+            for longitude in range(longitude_cell(west), longitude_cell(east) + 1):
+                yield (latitude, longitude)
+
+
+def interior_cells(box: BoundingBox) -> Iterator[tuple[int, int]]:
+    """Yields the grid cells that lie entirely within a bounding box.
+
+    Args:
+        box (BoundingBox): Bounding box.
+
+    Yields:
+        tuple[int, int]: Latitude and longitude index of each cell.
+    """
+    # Loop through Cells
+    (south, north) = box.latitudes()
+    for latitude in range(math.ceil((south + 90) / GRID_DEGREES), math.floor((north + 90) / GRID_DEGREES)):
+        for (west, east) in box.longitudes():
+            for longitude in range(math.ceil((west + 180) / GRID_DEGREES), math.floor((east + 180) / GRID_DEGREES)):
+                yield (latitude, longitude)
+
+
+def latitude_cell(latitude: float) -> int:
+    """Calculates the grid cell index of a latitude.
+
+    Args:
+        latitude (float): Latitude in degrees.
+
+    Returns:
+        int: Latitude index of the cell.
+    """
+    # Calculate and Return
+    return min(max(int((latitude + 90) // GRID_DEGREES), 0), LATITUDE_CELLS - 1)
+
+
+def longitude_cell(longitude: float) -> int:
+    """Calculates the grid cell index of a longitude.
+
+    Args:
+        longitude (float): Longitude in degrees.
+
+    Returns:
+        int: Longitude index of the cell.
+    """
+    # Calculate and Return
+    return min(max(int((longitude + 180) // GRID_DEGREES), 0), LONGITUDE_CELLS - 1)
+
@@ -0,0 +1,121 @@
+"""RASD FastAPI Temporal Search.
+
+The temporal coverage of the Metadata is indexed as two sorted lists of
+endpoints - the start dates and the end dates - with the rows in the same
+order. A row covers part of a query interval if it starts on or before the end
+of the interval, and ends on or after its start, so each half of the overlap
+condition is a single binary search, and the matching rows are a prefix or a
+suffix of one of the lists.
+
+Dates are stored as proleptic Gregorian ordinals (see `datetime.date.toordinal`).
+"""
+
+
+# Standard
+import bisect
+import datetime
+
+# Local
+from rasd_fastapi.search import bitsets
+
+# Typing
+from typing import NamedTuple, Optional, Sequence
+
+
+class Interval(NamedTuple):
+    """Date interval, where either end may be open."""
+    start: Optional[datetime.date]
+    end: Optional[datetime.date]
+
+
+class IntervalIndex:
+    """Sorted endpoints index of date intervals."""
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]) -> None:
+        """Builds the interval index.
+
+        Args:
+            starts (Sequence[int]): Start date ordinal of each row.
+            ends (Sequence[int]): End date ordinal of each row.
+        """
+        # Sort Rows by each Endpoint
+        by_start = sorted(range(len(starts)), key=starts.__getitem__)
+        by_end = sorted(range(len(ends)), key=ends.__getitem__)
+
+        # Instance Variables
+        self.count = len(starts)
+        self.starts = ([starts[row] for row in by_start], by_start)
+        self.ends = ([ends[row] for row in by_end], by_end)
+
+    def mask(self, interval: Interval) -> int:
+        """Constructs the bitset of the rows that overlap an interval.
+
+        Args:
+            interval (Interval): Interval to search.
+
+        Returns:
+            int: Bitset of the overlapping rows.
+        """
+        # Start with every Row
+        mask: int = (1 << self.count) - 1
+
+        # Intersect Rows that Start on or before the End of the Interval
+        if interval.end is not None:
+            (dates, rows) = self.starts
+            mask &= self.prefix(rows, bisect.bisect_right(dates, interval.end.toordinal()))
+
+        # Intersect Rows that End on or after the Start of the Interval
+        if interval.start is not None:
+            (dates, rows) = self.ends
+            mask &= ~self.prefix(rows, bisect.bisect_left(dates, interval.start.toordinal()))
+
+        # Return
+        return mask
+
+    def prefix(self, rows: Sequence[int], length: int) -> int:
+        """Constructs the bitset of a prefix of a sorted list of rows.
+
+        The bitset is built from whichever of the prefix and the remaining
+        suffix is shorter.
+
+        Args:
+            rows (Sequence[int]): Rows in sorted order.
+            length (int): Length of the prefix.
+
+        Returns:
+            int: Bitset of the rows in the prefix.
+        """
+        # Check Shorter Side
+        if length <= self.count // 2:
+            return bitsets.from_rows(rows[:length], self.count)
+
+        # Construct from the Complement of the Suffix and Return
+        return ((1 << self.count) - 1) & ~bitsets.from_rows(rows[length:], self.count)
+
+
+def interval(
+    start: Optional[datetime.date],
+    end: Optional[datetime.date],
+) -> Optional[Interval]:
+    """Constructs an interval from optional dates.
+
+    Args:
+        start (Optional[datetime.date]): Start of the interval.
+        end (Optional[datetime.date]): End of the interval.
+
+    Raises:
+        ValueError: Raised if the interval ends before it starts.
+
+    Returns:
+        Optional[Interval]: Interval, or None if no dates are supplied.
+    """
+    # Check Dates
+    if start is None and end is None:
+        return None
+
+    if start is not None and end is not None and start > end:
+        # Error
+        raise ValueError("Temporal filter must not end before it starts")
+
+    # Construct and Return
+    return Interval(start=start, end=end)
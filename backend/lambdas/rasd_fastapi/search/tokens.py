@@ -0,0 +1,51 @@
+"""RASD FastAPI Search Tokeniser.
+
+Text is normalised before it is split into tokens, so that searches match
+regardless of case and accents (e.g., `Ému` matches `emu`).
+"""
+
+
+# Standard
+import re
+import unicodedata
+
+# Typing
+from typing import Optional
+
+
+# Constants
+TOKEN_PATTERN = re.compile(r"[^\W_]+")  # Runs of letters and digits
+
+
+def normalise(text: str) -> str:
+    """Normalises text for searching.
+
+    Args:
+        text (str): Text to normalise.
+
+    Returns:
+        str: Case folded text without accents.
+    """
+    # Decompose Accented Characters and Remove the Accents
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+
+    # Case Fold and Return
+    return stripped.casefold()
+
+
+def tokenise(text: Optional[str]) -> list[str]:
+    """Splits text into normalised search tokens.
+
+    Args:
+        text (Optional[str]): Text to tokenise.
+
+    Returns:
+        list[str]: Normalised tokens in order, including any duplicates.
+    """
+    # Check for Text
+    if not text:
+        return []
+
+    # Normalise, Tokenise and Return
+    return TOKEN_PATTERN.findall(normalise(text))
@@ -0,0 +1,113 @@
+"""RASD FastAPI Typeahead Suggestions.
+
+Each value is indexed by its normalised text starting at each of its words, in
+one sorted array. The completions of a prefix are then a contiguous range of
+the array, which is found with a binary search. The top completions of each
+prefix are cached, so repeated keystrokes are served without searching again.
+"""
+
+
+# Standard
+import bisect
+import collections
+import heapq
+import threading
+
+# Local
+from rasd_fastapi.search import tokens
+
+# Typing
+from typing import Iterable
+
+
+# Constants
+MAX_SUGGESTIONS = 50  # Completions cached for each prefix
+CACHE_SIZE = 4096  # Prefixes cached
+
+
+class SuggestIndex:
+    """Prefix index of values, weighted by how often they occur."""
+
+    def __init__(self, values: Iterable[tuple[str, str]], version: int) -> None:
+        """Builds the prefix index.
+
+        Args:
+            values (Iterable[tuple[str, str]]): Field and text of each value.
+                Duplicate values are counted, and ranked higher.
+            version (int): Catalogue version that the index is of.
+        """
+        # Count Values
+        counts = collections.Counter(values)
+        self.version = version
+        self.entries = [(field, text, count) for ((field, text), count) in counts.items()]
+
+        # Index Values at each Word
+        keys: list[tuple[str, int]] = []
+        for (entry, (_, text, _)) in enumerate(self.entries):
+            words = tokens.tokenise(text)
+            keys.extend((" ".join(words[start:]), entry) for start in range(len(words)))
+
+        # Sort Keys
+        keys.sort()
+        self.keys = [key for (key, _) in keys]
+        self.positions = [entry for (_, entry) in keys]
+
+        # Cache
+        self.cache: collections.OrderedDict[str, list[int]] = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[str, str, int]]:
+        """Retrieves the top completions of a prefix.
+
+        Args:
+            prefix (str): Text typed so far.
+            limit (int): Number of completions to return, up to
+                `MAX_SUGGESTIONS`.
+
+        Returns:
+            list[tuple[str, str, int]]: Field, text and count of each
+                completion, most frequent first.
+        """
+        # Normalise Prefix
+        key = " ".join(tokens.tokenise(prefix))
+        if not key:
+            return []
+
+        # Check Cache
+        with self.lock:
+            top = self.cache.get(key)
+            if top is not None:
+                self.cache.move_to_end(key)
+
+        # Check for Cache Miss
+        if top is None:
+            # Search and Cache
+            top = self.search(key)
+            with self.lock:
+                self.cache[key] = top
+                if len(self.cache) > CACHE_SIZE:
+                    self.cache.popitem(last=False)
+
+        # Return
+        return [self.entries[entry] for entry in top[:limit]]
+
+    def search(self, key: str) -> list[int]:
+        """Searches the index for the top completions of a normalised prefix.
+
+        Args:
+            key (str): Normalised prefix.
+
+        Returns:
+            list[int]: Top entries, ranked by count, then by length and text.
+        """
+        # Find Range of Keys with the Prefix
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_left(self.keys, key + "\U0010ffff")
+        matches = set(self.positions[start:end])
+
+        # Select and Return Top Entries
+        return heapq.nsmallest(
+            MAX_SUGGESTIONS,
+            matches,
+            key=lambda e: (-self.entries[e][2], len(self.entries[e][1]), self.entries[e][1]),
+        )
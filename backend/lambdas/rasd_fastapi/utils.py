@@ -3,17 +3,20 @@
 
 # Standard
 import datetime
+import hashlib
 
 # Third-Party
 import fastapi
 
 # Typing
-from typing import Optional, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 
 # Constants
 T = TypeVar("T")
 ApiOrRouter = Union[fastapi.FastAPI, fastapi.APIRouter]
+PRIVATE_REVALIDATE = "private, no-cache"  # Responses that depend on the user must be revalidated
+PUBLIC_REVALIDATE = "no-cache"  # Responses that don't depend on the user must be revalidated
 
 
 def add_redirect(app: ApiOrRouter, path: str, url: Optional[str]) -> None:
@@ -37,6 +40,60 @@ def add_redirect(app: ApiOrRouter, path: str, url: Optional[str]) -> None:
     app.get(path, include_in_schema=False)(redirect)
 
 
+def etag(*parts: Any) -> str:
+    """Constructs a strong entity tag from the parts that identify a response.
+
+    Args:
+        *parts (Any): Parts that identify the response, such as the revision
+            of an item and anything else that its representation depends on.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    # Hash and Return
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], tag: str) -> bool:
+    """Checks whether an `If-None-Match` header matches an entity tag.
+
+    The header is compared with the weak comparison required for
+    `If-None-Match` (i.e., ignoring any `W/` prefixes).
+
+    Args:
+        if_none_match (Optional[str]): Value of the `If-None-Match` header.
+        tag (str): Quoted entity tag of the current response.
+
+    Returns:
+        bool: Whether the header matches the entity tag.
+    """
+    # Check Header
+    if not if_none_match:
+        return False
+
+    # Check Entity Tags and Return
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or tag in tags
+
+
+def not_modified(tag: str, cache_control: str) -> fastapi.Response:
+    """Constructs a `304 Not Modified` response.
+
+    Args:
+        tag (str): Quoted entity tag of the current response.
+        cache_control (str): Value of the `Cache-Control` header.
+
+    Returns:
+        fastapi.Response: Response without a body.
+    """
+    # Construct and Return
+    return fastapi.Response(
+        status_code=fastapi.status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": tag, "Cache-Control": cache_control},
+    )
+
+
 def unwrap_or_404(value: Optional[T]) -> T:
     """Unwraps the supplied optional value, raising a 404 error if applicable.
 
@@ -0,0 +1 @@
+"""RASD FastAPI REST API Unit Tests."""
@@ -0,0 +1,85 @@
+"""RASD FastAPI REST API Response Cache Unit Tests."""
+
+
+# Third-Party
+import fastapi
+import pytest
+
+# Local
+from rasd_fastapi.api import caching
+from rasd_fastapi.db import budgets
+
+# Typing
+from typing import Any
+
+
+def test_response_cache() -> None:
+    """Tests the response cache serves, evicts and invalidates responses."""
+    # Instantiate Cache
+    # The cache holds two of the responses below
+    response_cache = caching.ResponseCache("test", ttl=60, size=30)
+    builds: list[str] = []
+
+    # Construct Builder
+    def build(key: str) -> tuple[Any, dict[str, str]]:
+        builds.append(key)
+        return ({"key": key}, {"X-Key": key})
+
+    # Retrieve Responses
+    for key in ["a", "b", "a", "c", "a", "b"]:
+        response = response_cache.respond(key, lambda: build(key))  # noqa: B023
+
+        # Assert
+        assert response.body == f'{{"key":"{key}"}}'.encode()
+        assert response.headers["X-Key"] == key
+        assert response.headers["Cache-Control"] == "public, max-age=60"
+
+    # Assert
+    # "b" was evicted as the least recently used response when "c" was cached
+    assert builds == ["a", "b", "c", "b"]
+    assert response_cache.stats() == {"hits": 2, "misses": 4, "items": 2, "bytes": 22}
+
+    # Invalidate after a Write
+    response_cache.invalidate("any")
+    response_cache.respond("a", lambda: build("a"))
+
+    # Assert
+    assert builds == ["a", "b", "c", "b", "a"]
+
+
+def test_response_cache_errors() -> None:
+    """Tests the response cache doesn't cache errors."""
+    # Instantiate Cache
+    response_cache = caching.ResponseCache("test", ttl=60, size=1024)
+
+    # Construct Builder
+    def build() -> tuple[Any, dict[str, str]]:
+        raise fastapi.HTTPException(status_code=fastapi.status.HTTP_404_NOT_FOUND)
+
+    # Assert
+    for _ in range(2):
+        with pytest.raises(fastapi.HTTPException):
+            response_cache.respond("a", build)
+    assert response_cache.stats()["misses"] == 2
+
+
+def test_response_cache_budget() -> None:
+    """Tests the response cache doesn't cache responses built with an exhausted budget."""
+    # Instantiate Cache and Budget
+    response_cache = caching.ResponseCache("test", ttl=60, size=1024)
+    budget = budgets.ReadBudget(max_evaluated=1)
+
+    # Construct Builder
+    # The builder exhausts the budget, so its response may be partial
+    def build() -> tuple[Any, dict[str, str]]:
+        budget.evaluated += 1
+        return ({"partial": True}, {})
+
+    # Retrieve Responses
+    for _ in range(2):
+        response = response_cache.respond("a", build, budget=budget)
+
+        # Assert
+        assert response.headers["Cache-Control"] == "no-store"
+    assert response_cache.stats()["misses"] == 2
+    assert response_cache.stats()["items"] == 0
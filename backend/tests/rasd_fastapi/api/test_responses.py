@@ -0,0 +1,75 @@
+"""RASD FastAPI REST API Responses Unit Tests."""
+
+
+# Standard
+import json
+
+# Third-Party
+import fastapi.encoders
+import pydantic
+import pytest
+
+# Local
+from rasd_fastapi.api import responses
+from rasd_fastapi.models import metadata as metadata_models
+from rasd_fastapi.models import metadata_vocabs
+from rasd_fastapi.models import organisations as org_models
+from rasd_fastapi.schemas import metadata as metadata_schemas
+from rasd_fastapi.schemas import pagination
+from tests import conftest
+
+# Typing
+from typing import Any
+
+
+# Shortcuts
+FACETS: dict[str, Any] = {
+    "keywords": metadata_vocabs.keywords.Keyword,
+    "locations": metadata_vocabs.locations.Location,
+    "formats": metadata_vocabs.formats.Format,
+    "access_rights": metadata_vocabs.access_rights.AccessRights,
+}
+
+
+@pytest.mark.parametrize(
+    (
+        "source",
+        "model",
+        "name",
+    ),
+    [
+        (metadata_models.RASDMetadata, metadata_models.RASDMetadata, "metadata.json"),
+        (metadata_models.RASDMetadata, metadata_schemas.RASDMetadataSummary, "metadata.json"),
+        (org_models.Organisation, org_models.Organisation, "organisation.json"),
+    ]
+)
+def test_fast_json_response(source: type[pydantic.BaseModel], model: type[pydantic.BaseModel], name: str) -> None:
+    """Tests that fast responses are equivalent to FastAPI's encoding.
+
+    Args:
+        source (type[pydantic.BaseModel]): Model that the data is loaded as.
+        model (type[pydantic.BaseModel]): Model to serialise.
+        name (str): Name of the unit test data to load.
+    """
+    # Construct Page
+    item = model.parse_obj(source.parse_obj(conftest.load_data_json(name)).dict())
+    page = pagination.PaginatedResult(count=2, cursor="cursor", results=[item, item])
+
+    # Serialise
+    body = responses.FastJSONResponse(content=page).body
+
+    # Assert
+    assert json.loads(body) == fastapi.encoders.jsonable_encoder(page)
+
+
+def test_fast_json_response_enum_keys() -> None:
+    """Tests that fast responses serialise dictionaries keyed by enums."""
+    # Construct Facet Counts
+    counts: dict[str, Any] = {name: {m: i for (i, m) in enumerate(members)} for (name, members) in FACETS.items()}
+    item = metadata_schemas.RASDMetadataFacets.construct(**counts)
+
+    # Serialise
+    body = responses.FastJSONResponse(content=item).body
+
+    # Assert
+    assert json.loads(body) == fastapi.encoders.jsonable_encoder(item)
@@ -0,0 +1,79 @@
+"""RASD FastAPI Restricted Vocabularies REST API Endpoints Unit Tests."""
+
+
+# Third-Party
+import fastapi
+import fastapi.testclient
+import pytest
+
+# Local
+from rasd_fastapi import utils
+from rasd_fastapi.api.v1.endpoints import vocabularies
+
+# Typing
+from typing import Optional
+
+
+# Construct Client
+app = fastapi.FastAPI()
+app.include_router(vocabularies.router, prefix="/vocabularies")
+client = fastapi.testclient.TestClient(app)
+
+
+@pytest.mark.parametrize(
+    (
+        "if_none_match",
+        "expected_status",
+    ),
+    [
+        (None, 200),                                # No cached response
+        (vocabularies.ETAG, 304),                   # Matching
+        (f"W/{vocabularies.ETAG}", 304),            # Matching weak
+        (f'"other", {vocabularies.ETAG}', 304),     # Matching in list
+        ("*", 304),                                 # Wildcard
+        ('"other"', 200),                           # Not matching
+    ]
+)
+def test_read_vocabularies(if_none_match: Optional[str], expected_status: int) -> None:
+    """Tests that the unversioned bundle is revalidated with its entity tag.
+
+    Args:
+        if_none_match (Optional[str]): Value of the `If-None-Match` header.
+        expected_status (int): Expected status code.
+    """
+    # Read Vocabularies
+    headers = {"If-None-Match": if_none_match} if if_none_match else {}
+    response = client.get("/vocabularies", headers=headers)
+
+    # Assert
+    assert response.status_code == expected_status
+    assert response.headers["ETag"] == vocabularies.ETAG
+    assert response.headers["Cache-Control"] == utils.PUBLIC_REVALIDATE
+    assert response.content == (vocabularies.BUNDLE if expected_status == 200 else b"")
+
+
+@pytest.mark.parametrize(
+    (
+        "version",
+        "expected_status",
+    ),
+    [
+        (vocabularies.VERSION, 200),    # Current
+        ("0123456789abcdef", 404),      # Unknown
+    ]
+)
+def test_read_vocabularies_version(version: str, expected_status: int) -> None:
+    """Tests that only the current versioned bundle is cached indefinitely.
+
+    Args:
+        version (str): Version of the bundle to read.
+        expected_status (int): Expected status code.
+    """
+    # Read Vocabularies
+    response = client.get(f"/vocabularies/{version}")
+
+    # Assert
+    assert response.status_code == expected_status
+    if expected_status == 200:
+        assert "immutable" in response.headers["Cache-Control"]
+        assert response.content == vocabularies.BUNDLE
@@ -0,0 +1 @@
+"""RASD FastAPI Core Unit Tests."""
@@ -0,0 +1,71 @@
+"""RASD FastAPI AWS Registry Unit Tests."""
+
+
+# Standard
+import concurrent.futures
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.core import aws
+from rasd_fastapi.core import settings
+
+
+def test_registry() -> None:
+    """Tests re-use and resetting of the AWS registry."""
+    # Instantiate Registry
+    registry = aws.Registry()
+
+    # Retrieve Session, Client and Table
+    session = registry.session()
+    client = registry.client("sesv2")
+    table = registry.table("Metadata")
+
+    # Assert Re-Use
+    assert registry.session() is session
+    assert registry.client("sesv2") is client
+    assert registry.table("Metadata") is table
+    assert registry.table("Metadata", session) is table
+
+    # Assert Tables are not shared between Threads
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(registry.table, "Metadata").result() is not table
+
+    # Reset Registry
+    registry.reset()
+
+    # Assert Re-Construction
+    assert registry.session() is not session
+    assert registry.client("sesv2") is not client
+    assert registry.table("Metadata") is not table
+    assert registry.table("Metadata", session) is not registry.table("Metadata")
+
+
+def test_registry_rotation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that resetting the AWS registry picks up rotated credentials.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Instantiate Registry
+    registry = aws.Registry()
+    client = registry.client("sesv2")
+
+    # Rotate Credentials
+    # The settings and environment are restored after the test
+    monkeypatch.setattr(settings, "SETTINGS", settings.SETTINGS)
+    monkeypatch.setattr(settings, "retrieve_secrets", lambda: {"AWS_ACCESS_KEY_ID": "rotated"})
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", settings.SETTINGS.AWS_ACCESS_KEY_ID)
+
+    # Assert Old Credentials
+    assert client._request_signer._credentials.access_key != "rotated"
+
+    # Reset Registry
+    registry.reset()
+
+    # Assert New Credentials
+    assert settings.SETTINGS.AWS_ACCESS_KEY_ID == "rotated"
+    assert getattr(registry.session().get_credentials(), "access_key", None) == "rotated"
+    assert registry.client("sesv2")._request_signer._credentials.access_key == "rotated"
+    assert registry.table("Metadata").meta.client._request_signer._credentials.access_key == "rotated"
@@ -0,0 +1,501 @@
+"""RASD FastAPI CRUD Base Unit Tests."""
+
+
+# Standard
+import uuid
+
+# Third-Party
+import boto3.dynamodb.conditions as con
+import pytest
+
+# Local
+from rasd_fastapi.crud import base
+from rasd_fastapi.crud import metadata as metadata_crud
+from rasd_fastapi.crud import organisations as org_crud
+from rasd_fastapi.crud import requests as req_crud
+from rasd_fastapi.db import budgets
+from rasd_fastapi.models import metadata as metadata_models
+from rasd_fastapi.models import organisations as org_models
+from tests import conftest
+
+# Typing
+from typing import Any, Optional
+
+
+@pytest.mark.parametrize(
+    "positions",
+    [
+        [None, None, None, None],                            # Not started
+        [{"id": "a5f1c4d2-1a7b-4cfe-9d8b-6c1f2e3d4a5b"}, None],  # Partially started
+        [False, {"id": "RASD-20230204-73df14"}, False],      # Partially finished
+        [False, False],                                      # Finished
+    ]
+)
+def test_segments_cursor(positions: list[base.SegmentPosition]) -> None:
+    """Tests the parallel scan segments cursor round trip.
+
+    Args:
+        positions (list[base.SegmentPosition]): Segment positions to encode.
+    """
+    # Encode Cursor
+    cursor = base.encode_segments_cursor(positions)
+
+    # Assert
+    assert "=" not in cursor
+    assert base.decode_segments_cursor(cursor, len(positions), ["id"]) == positions
+
+
+@pytest.mark.parametrize(
+    (
+        "cursor",
+        "segments",
+    ),
+    [
+        ("not a cursor!", 2),                                       # Garbage
+        (base.encode_segments_cursor([None, None]) + "A", 2),       # Tampered
+        (base.encode_segments_cursor([None, None]), 4),             # Wrong number of segments
+        (base.encode_segments_cursor(["1", "2"]), 2),  # type: ignore[list-item]  # Wrong types
+        (base.encode_segments_cursor([{"other": "1"}, None]), 2),   # Wrong key attributes
+        (base.encode_segments_cursor({"a": 1}), 1),  # type: ignore[arg-type]  # Wrong structure
+    ]
+)
+def test_segments_cursor_invalid(cursor: Any, segments: int) -> None:
+    """Tests the parallel scan segments cursor validation.
+
+    Args:
+        cursor (Any): Cursor to decode.
+        segments (int): Expected number of segments.
+    """
+    # Assert
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        base.decode_segments_cursor(cursor, segments, ["id"])
+
+
+@pytest.mark.parametrize(
+    (
+        "pks",
+        "unprocessed",
+        "expected_requests",
+    ),
+    [
+        (list(range(250)), 0, [100, 100, 50]),               # Chunked into batches
+        ([5, 1, 5, 3], 0, [3]),                              # Duplicates requested once
+        (list(range(10)), 2, [10, 1, 1]),                    # Unprocessed keys retried
+    ]
+)
+def test_get_many(
+    monkeypatch: pytest.MonkeyPatch,
+    pks: list[int],
+    unprocessed: int,
+    expected_requests: list[int],
+) -> None:
+    """Tests retrieving multiple items with `BatchGetItem` requests.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        pks (list[int]): Primary keys to retrieve, as UUID integers.
+        unprocessed (int): Number of requests that leave a key unprocessed.
+        expected_requests (list[int]): Expected number of keys in each request.
+    """
+    # Construct Resource
+    (crud, resource) = batch_get_crud(unprocessed)
+    monkeypatch.setattr(base.time, "sleep", lambda seconds: None)
+
+    # Retrieve Items
+    results = crud.get_many(resource, pks=[uuid.UUID(int=pk) for pk in pks])
+
+    # Assert
+    # Every third item doesn't exist
+    assert [r.id.int if r else None for r in results] == [pk if pk % 3 else None for pk in pks]
+    assert resource.requests == expected_requests
+
+
+def test_get_many_unprocessed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that retrieving multiple items fails if keys remain unprocessed.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Construct Resource
+    (crud, resource) = batch_get_crud(base.BATCH_GET_ATTEMPTS)
+    monkeypatch.setattr(base.time, "sleep", lambda seconds: None)
+
+    # Assert
+    with pytest.raises(RuntimeError, match="Unable to retrieve all items"):
+        crud.get_many(resource, pks=[uuid.UUID(int=1)])
+    assert len(resource.requests) == base.BATCH_GET_ATTEMPTS
+
+
+def batch_get_crud(unprocessed: int) -> tuple[Any, Any]:
+    """Constructs a CRUD and a database resource that serves `BatchGetItem`.
+
+    The resource doubles as the database session. Every third item doesn't
+    exist, and the first `unprocessed` requests leave their last key
+    unprocessed.
+
+    Args:
+        unprocessed (int): Number of requests that leave a key unprocessed.
+
+    Returns:
+        tuple[Any, Any]: CRUD and database resource.
+    """
+    # Construct CRUD
+    crud = base.CRUDBase[Any, Any, Any, uuid.UUID](model=org_models.Organisation, table="Organisations", pk="id")
+    data = conftest.load_data_json("organisation.json")
+
+    # Construct Resource
+    class Resource:
+        requests: list[int] = []
+
+        def resource(self, name: str, **kwargs: Any) -> Any:
+            return self
+
+        def batch_get_item(self, *, RequestItems: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+            keys = RequestItems[crud.table]["Keys"]
+            self.requests = [*self.requests, len(keys)]
+            processed = keys if len(self.requests) > unprocessed else keys[:-1]
+            return {
+                "Responses": {crud.table: [data | k for k in processed if uuid.UUID(k["id"]).int % 3]},
+                **({"UnprocessedKeys": {crud.table: {"Keys": keys[-1:]}}} if processed != keys else {}),
+            }
+
+    # Return
+    return (crud, Resource())
+
+
+@pytest.mark.parametrize(
+    (
+        "changes",
+        "expression",
+    ),
+    [
+        # No changes
+        ({}, None),
+        # Changed attribute (and its computed attribute)
+        ({"title": "New Title"}, "SET #f2 = :f2, #f29 = :f29"),
+        # Changed list elements
+        ({"locations": ["Victoria", "Australia"]}, "SET #f5 = :f5"),
+        # Appended list elements
+        ({"keywords": ["Fauna", "Flora", "Flora-Exotic"]}, "SET #f4 = :f4"),
+        # Shortened list
+        ({"keywords": ["Fauna"]}, "SET #f4 = :f4"),
+    ]
+)
+def test_build_update_expression(changes: dict[str, Any], expression: Any) -> None:
+    """Tests building the partial update expression.
+
+    Args:
+        changes (dict[str, Any]): Changes to apply to the model.
+        expression (Any): Expected update expression.
+    """
+    # Load Data
+    data = conftest.load_data_json("metadata.json")
+    data |= {"keywords": ["Fauna", "Flora"], "locations": ["Australia", "Victoria"]}
+    old = metadata_models.RASDMetadata.parse_obj(data)
+    new = metadata_models.RASDMetadata.parse_obj(old.dict() | changes)
+
+    # Build Update Expression
+    result = base.build_update_expression(old, new)
+
+    # Assert
+    assert (result and result["UpdateExpression"]) == expression
+
+
+@pytest.mark.parametrize(
+    (
+        "changes",
+        "changed",
+    ),
+    [
+        ({}, False),                            # No changes
+        ({"active": False}, False),             # Checked separately
+        ({"title": "New Title"}, True),         # Changed attribute
+        ({"keywords": ["Flora", "Fauna"]}, True),  # Reordered list
+    ]
+)
+def test_revision(changes: dict[str, Any], changed: bool) -> None:
+    """Tests calculating the revision of an item.
+
+    Args:
+        changes (dict[str, Any]): Changes to apply to the model.
+        changed (bool): Whether the revision is expected to change.
+    """
+    # Load Data
+    data = conftest.load_data_json("metadata.json")
+    data |= {"keywords": ["Fauna", "Flora"]}
+    old = metadata_models.RASDMetadata.parse_obj(data)
+    new = metadata_models.RASDMetadata.parse_obj(old.dict() | changes)
+
+    # Assert
+    assert (base.revision(old) != base.revision(new)) == changed
+    assert base.revision(old) == base.revision(metadata_crud.metadata.load(old.dict()))
+
+
+@pytest.mark.parametrize(
+    (
+        "crud",
+        "projected",
+    ),
+    [
+        (metadata_crud.metadata, False),
+        (metadata_crud.metadata_summary, True),
+        (req_crud.data_access_request, False),
+        (req_crud.data_access_request_summary, True),
+    ]
+)
+def test_projection(crud: base.CRUDBase, projected: bool) -> None:
+    """Tests constructing the projection for a CRUD.
+
+    Args:
+        crud (base.CRUDBase): CRUD to construct the projection for.
+        projected (bool): Whether the CRUD is expected to be projected.
+    """
+    # Construct Projection
+    projection = crud.projection()
+
+    # Assert
+    assert bool(projection) == projected
+    if projected:
+        names = projection["ExpressionAttributeNames"]
+        assert projection["ProjectionExpression"] == ", ".join(names)
+        assert set(names.values()) == {*crud.keys, *crud.model.__fields__}
+        assert crud.projection()["ExpressionAttributeNames"] is not names
+
+
+@pytest.mark.parametrize(
+    (
+        "budget",
+        "expected_count",
+        "expected_key",
+    ),
+    [
+        (None, 5, "49"),                                  # Unbudgeted, reads until the limit
+        (budgets.ReadBudget(max_evaluated=25), 3, "29"),  # Items evaluated budget
+        (budgets.ReadBudget(max_capacity=2), 2, "19"),    # Capacity budget
+        (budgets.ReadBudget(deadline=0), 1, "9"),         # Deadline already passed
+    ]
+)
+def test_paginate_budget(
+    budget: Optional[budgets.ReadBudget],
+    expected_count: int,
+    expected_key: str,
+) -> None:
+    """Tests that pagination stops with a valid key when over budget.
+
+    Args:
+        budget (Optional[budgets.ReadBudget]): Read budget to use.
+        expected_count (int): Expected number of items returned.
+        expected_key (str): Expected key to continue from.
+    """
+    # Construct Operation
+    # Each page evaluates 10 items, of which only 1 matches the filter
+    def operation(**kwargs: Any) -> dict[str, Any]:
+        start = int(kwargs["ExclusiveStartKey"]["id"]) + 1 if "ExclusiveStartKey" in kwargs else 0
+        return {
+            "Items": [{"id": str(start)}],
+            "ScannedCount": 10,
+            "ConsumedCapacity": {"CapacityUnits": 1.0},
+            "LastEvaluatedKey": {"id": str(start + 9)},
+        }
+
+    # Paginate
+    items, last_key = metadata_crud.metadata.paginate(operation, keys=["id"], limit=5, budget=budget)
+
+    # Assert
+    assert len(items) == expected_count
+    assert last_key == {"id": expected_key}
+
+
+@pytest.mark.parametrize(
+    (
+        "segments",
+        "consistent",
+        "expected_scans",
+        "expected_queries",
+    ),
+    [
+        (None, False, [], 1),                                                     # Routed to the index
+        (None, True, [{"ConsistentRead": True}], 0),                              # Consistent scan
+        (2, True, [{"ConsistentRead": True, "Segment": i} for i in range(2)], 0),  # Consistent parallel scan
+    ]
+)
+def test_scan_consistent(
+    monkeypatch: pytest.MonkeyPatch,
+    segments: Optional[int],
+    consistent: bool,
+    expected_scans: list[dict[str, Any]],
+    expected_queries: int,
+) -> None:
+    """Tests that consistent scans read the table rather than an index.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        segments (Optional[int]): Optional number of parallel segments.
+        consistent (bool): Whether to scan consistently.
+        expected_scans (list[dict[str, Any]]): Expected consistency and
+            segment of each scan of the table.
+        expected_queries (int): Expected number of queries of the index.
+    """
+    # Construct CRUD
+    crud = base.CRUDBase[Any, Any, Any, uuid.UUID](
+        model=org_models.Organisation,
+        table="Organisations",
+        pk="id",
+        indexes={"name": "NameIndex"},
+    )
+    scans: list[dict[str, Any]] = []
+    queries: list[dict[str, Any]] = []
+
+    # Construct Pagination
+    def paginate(operation: Any, **kwargs: Any) -> tuple[list[dict[str, Any]], None]:
+        options = {k: v for (k, v) in kwargs.items() if k in ("ConsistentRead", "Segment")}
+        (queries if "IndexName" in kwargs else scans).append(options)
+        return ([], None)
+
+    # Patch Table and Pagination
+    monkeypatch.setattr(crud, "get_table", lambda db_session: type("Table", (), {"scan": None, "query": None}))
+    monkeypatch.setattr(crud, "paginate", paginate)
+
+    # Scan
+    filter = con.Attr("name").eq("a")  # noqa: A001
+    crud.scan_all(None, filter=filter, segments=segments, consistent=consistent)  # type: ignore[arg-type]
+
+    # Assert
+    assert sorted(scans, key=lambda s: s.get("Segment", 0)) == expected_scans
+    assert len(queries) == expected_queries
+
+
+def test_paginate_truncated_key() -> None:
+    """Tests that a truncated page continues from the full key of its last item."""
+    # Construct Operation
+    # A single page returns more items than the limit
+    def operation(**kwargs: Any) -> dict[str, Any]:
+        return {
+            "Items": [
+                {"id": str(i), base.ORDER_PARTITION_KEY: base.ORDER_PARTITION, "created_at": f"2023-02-0{9 - i}"}
+                for i in range(5)
+            ],
+            "LastEvaluatedKey": {"id": "4", base.ORDER_PARTITION_KEY: base.ORDER_PARTITION, "created_at": "2023-02-05"},
+        }
+
+    # Paginate
+    keys = ["id", base.ORDER_PARTITION_KEY, base.ORDER_SORT_KEY]
+    items, last_key = req_crud.data_access_request.paginate(operation, keys=keys, limit=3)
+
+    # Assert
+    assert len(items) == 3
+    assert last_key == {"id": "2", base.ORDER_PARTITION_KEY: base.ORDER_PARTITION, "created_at": "2023-02-07"}
+
+
+@pytest.mark.parametrize(
+    (
+        "budget",
+        "expected_evaluated",
+        "expected_capacity",
+    ),
+    [
+        (budgets.ReadBudget(max_evaluated=1000), 150, 0.0),      # Items budget
+        (budgets.ReadBudget(max_capacity=1000), 150, 75.0),      # Capacity budget
+    ]
+)
+def test_get_many_budget(
+    monkeypatch: pytest.MonkeyPatch,
+    budget: budgets.ReadBudget,
+    expected_evaluated: int,
+    expected_capacity: float,
+) -> None:
+    """Tests that retrieving multiple items charges the read budget.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        budget (budgets.ReadBudget): Read budget to use.
+        expected_evaluated (int): Expected number of items charged.
+        expected_capacity (float): Expected read capacity charged.
+    """
+    # Shortcuts
+    crud = req_crud.data_access_request_summary
+
+    # Construct Resource
+    # Each item consumes half a read capacity unit, which is only returned if
+    # it was requested
+    class Resource:
+        def batch_get_item(self, *, RequestItems: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+            keys = RequestItems[crud.table]["Keys"]
+            consumed = [{"TableName": crud.table, "CapacityUnits": 0.5 * len(keys)}]
+            return {
+                "Responses": {crud.table: keys},
+                **({"ConsumedCapacity": consumed} if kwargs.get("ReturnConsumedCapacity") else {}),
+            }
+
+    # Patch CRUD
+    monkeypatch.setattr(crud, "get_resource", lambda db_session: Resource())
+    monkeypatch.setattr(crud, "load", lambda item: item)
+
+    # Retrieve Items
+    pks: list[Any] = [str(i) for i in range(150)]
+    results = crud.get_many(None, pks=pks, budget=budget)  # type: ignore[arg-type]
+
+    # Assert
+    assert len(results) == 150
+    assert budget.evaluated == expected_evaluated
+    assert budget.capacity == expected_capacity
+
+
+@pytest.mark.parametrize(
+    (
+        "cached",
+        "expected_name",
+        "expected_requests",
+    ),
+    [
+        (True, "Cached", []),                                  # Served from the cache
+        (False, "Stored", [{"ConsistentRead": True}]),         # Read that a write is based on
+    ]
+)
+def test_get_cached(
+    monkeypatch: pytest.MonkeyPatch,
+    cached: bool,
+    expected_name: str,
+    expected_requests: list[dict[str, Any]],
+) -> None:
+    """Tests that uncached reads bypass the cache and are strongly consistent.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        cached (bool): Whether the item can be retrieved from the cache.
+        expected_name (str): Expected name of the retrieved item.
+        expected_requests (list[dict[str, Any]]): Expected consistency of the
+            requests made to the database.
+    """
+    # Shortcuts
+    crud = org_crud.organisation
+    org = org_models.Organisation.parse_obj(conftest.load_data_json("organisation.json"))
+    assert crud.cache is not None
+
+    # Construct Table
+    requests: list[dict[str, Any]] = []
+
+    class Table:
+        def get_item(self, **kwargs: Any) -> dict[str, Any]:
+            requests.append(kwargs)
+            return {"Item": org.copy(update={"name": "Stored"})}
+
+    # Patch CRUD
+    monkeypatch.setattr(crud, "get_table", lambda db_session: Table())
+    monkeypatch.setattr(crud, "load", lambda item: item)
+
+    # Cache Item
+    crud.cache.put(str(org.id), org.copy(update={"name": "Cached"}), crud.cache.generation)
+
+    # Retrieve Item
+    try:
+        result = crud.get(None, pk=org.id, cached=cached)  # type: ignore[arg-type]
+
+    finally:
+        # Clear Cache
+        crud.cache.clear()
+
+    # Assert
+    assert result is not None
+    assert result.name == expected_name
+    assert [{"ConsistentRead": r.get("ConsistentRead")} for r in requests] == expected_requests
@@ -1,11 +1,23 @@
 """RASD FastAPI Metadata CRUD Unit Tests."""
 
 
+# Standard
+import pathlib
+import threading
+import time
+import uuid
+
+# Third-Party
+import pytest
+
 # Local
+from rasd_fastapi.core import settings
 from rasd_fastapi.crud import metadata as metadata_crud
 from rasd_fastapi.db import session
+from rasd_fastapi.models import metadata as metadata_models
 from rasd_fastapi.models import organisations as org_models
 from rasd_fastapi.schemas import metadata as metadata_schemas
+from rasd_fastapi.search import snapshot
 from tests import conftest
 
 
@@ -74,3 +86,139 @@ def test_metadata_crud() -> None:
     # Assert
     assert metadata
     assert conftest.matches(data, metadata)
+
+
+@pytest.mark.parametrize(
+    (
+        "overdue",
+        "expected_waited",
+    ),
+    [
+        (-1.0, False),  # Expired, served while it is rebuilt
+        (1.0, True),    # Expired for longer than the grace period
+    ]
+)
+def test_ranked_index_overdue(monkeypatch: pytest.MonkeyPatch, overdue: float, expected_waited: bool) -> None:
+    """Tests that searches wait for an overdue rebuild of the ranked index.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        overdue (float): Seconds past the grace period that the index expired.
+        expected_waited (bool): Whether the rebuild is expected to be waited for.
+    """
+    # Construct CRUD with an Expired Index
+    crud = build_crud()
+    ttl = settings.SETTINGS.SEARCH_RANKED_INDEX_TTL + settings.SETTINGS.SEARCH_REBUILD_GRACE_SECONDS
+    crud.ranking.built_at = time.monotonic() - ttl - overdue
+    release = threading.Event()
+
+    # Construct Blocking Builder
+    # The rebuild is only released once the index has been served
+    def build_ranked(db_session: object) -> None:
+        release.wait(timeout=0 if expected_waited else 5)
+        crud.ranking.rebuild([])
+
+    # Retrieve Index
+    monkeypatch.setattr(crud, "build_ranked", build_ranked)
+    built_at = crud.ranking.built_at
+    crud.ranked_index(None)  # type: ignore[arg-type]
+
+    # Assert
+    assert (crud.ranking.built_at != built_at) == expected_waited
+    release.set()
+
+
+@pytest.mark.parametrize(
+    (
+        "overdue",
+        "expected_waited",
+    ),
+    [
+        (-1.0, False),  # Confirmed recently, served while it is checked
+        (1.0, True),    # Not confirmed for longer than the grace period
+    ]
+)
+def test_snapshot_overdue(monkeypatch: pytest.MonkeyPatch, overdue: float, expected_waited: bool) -> None:
+    """Tests that searches wait for an overdue check of the snapshot.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        overdue (float): Seconds past the grace period since the snapshot was
+            confirmed current.
+        expected_waited (bool): Whether the check is expected to be waited for.
+    """
+    # Construct CRUD with a Snapshot
+    # The version was checked recently, so no check is started in the background
+    crud = build_crud()
+    limit = settings.SETTINGS.SEARCH_SNAPSHOT_CHECK_SECONDS + settings.SETTINGS.SEARCH_REBUILD_GRACE_SECONDS
+    crud.snapshot = current = object()  # type: ignore[assignment]
+    crud.snapshot_checked = time.monotonic()
+    crud.snapshot_confirmed = time.monotonic() - limit - overdue
+    refreshed: list[bool] = []
+
+    # Construct Refresh
+    def refresh_snapshot(db_session: object) -> None:
+        refreshed.append(True)
+        crud.snapshot_confirmed = time.monotonic()
+
+    # Retrieve Snapshot
+    monkeypatch.setattr(crud, "refresh_snapshot", refresh_snapshot)
+    retrieved = crud.current_snapshot(None)  # type: ignore[arg-type]
+
+    # Assert
+    assert retrieved is current
+    assert bool(refreshed) == expected_waited
+
+
+def test_refresh_snapshot(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    """Tests that the indexes of the snapshot are built with it.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        tmp_path (pathlib.Path): Temporary directory to write to.
+    """
+    # Construct Metadata
+    metadata = [
+        metadata_models.RASDMetadata.parse_obj(
+            conftest.load_data_json("metadata.json") | {"id": str(uuid.UUID(int=i)), "active": True, "title": title}
+        )
+        for (i, title) in enumerate(["Koala survey", "Frog survey"])
+    ]
+
+    # Patch Catalogue Version and Scan
+    crud = build_crud()
+    monkeypatch.setattr(crud, "catalogue_version", lambda db_session: 3)
+    monkeypatch.setattr(
+        crud,
+        "build_snapshot",
+        lambda db_session, *, version: snapshot.Snapshot(snapshot.write(str(tmp_path), version, metadata)),
+    )
+
+    # Refresh Snapshot
+    crud.refresh_snapshot(None)  # type: ignore[arg-type]
+
+    # Assert
+    assert crud.snapshot
+    assert crud.snapshot.version == 3
+    assert crud.suggestions
+    assert crud.suggestions.version == 3
+    assert [text for (_, text, _) in crud.suggestions.suggest("koa", 5)] == ["Koala survey"]
+    assert crud.similarities
+    assert crud.similarities.version == 3
+    assert crud.heatmap
+    assert crud.heatmap.version == 3
+
+
+def build_crud() -> metadata_crud.RASDMetadataCRUD:
+    """Constructs a Metadata CRUD abstraction with its own indexes.
+
+    Returns:
+        metadata_crud.RASDMetadataCRUD: Metadata CRUD abstraction.
+    """
+    # Construct and Return
+    return metadata_crud.RASDMetadataCRUD(
+        model=metadata_models.RASDMetadata,
+        table="Metadata",
+        pk="id",
+        catalogue_table="Catalogue",
+    )
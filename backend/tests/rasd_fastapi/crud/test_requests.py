@@ -0,0 +1,255 @@
+"""RASD FastAPI Data Access Requests CRUD Unit Tests."""
+
+
+# Standard
+import uuid
+
+# Third-Party
+import boto3.dynamodb.conditions as con
+import pytest
+
+# Local
+from rasd_fastapi import types
+from rasd_fastapi.crud import base
+from rasd_fastapi.crud import requests as req_crud
+from rasd_fastapi.models import requests as req_models
+
+# Typing
+from typing import Any, Optional
+
+
+# Shortcuts
+CUSTODIAN_ID = uuid.UUID(int=1)
+REQUESTOR_ID = uuid.UUID(int=2)
+OTHER_CUSTODIAN_ID = uuid.UUID(int=3)
+
+
+@pytest.mark.parametrize(
+    (
+        "filters",
+        "expected_custodian",
+        "expected_remaining",
+    ),
+    [
+        ({"custodian_id": CUSTODIAN_ID}, str(CUSTODIAN_ID), con.Attr("active").eq(True)),      # Active only
+        ({"custodian_id": CUSTODIAN_ID, "active_only": False}, str(CUSTODIAN_ID), None),      # All
+        ({"requestor_id": REQUESTOR_ID}, None, req_crud.data_access_request.build_filter(requestor_id=REQUESTOR_ID)),  # noqa: E501
+        ({"active_only": False}, None, None),                                                   # No filter
+    ]
+)
+def test_split_custodian_condition(
+    filters: dict[str, Any],
+    expected_custodian: Optional[str],
+    expected_remaining: Optional[con.ConditionBase],
+) -> None:
+    """Tests splitting the Custodian condition out of a filter.
+
+    Args:
+        filters (dict[str, Any]): Arguments for the filter.
+        expected_custodian (Optional[str]): Expected Custodian ID.
+        expected_remaining (Optional[con.ConditionBase]): Expected remaining filter.
+    """
+    # Split Filter
+    crud = req_crud.data_access_request
+    (custodian_id, remaining) = crud.split_custodian_condition(crud.build_filter(**filters))
+
+    # Assert
+    assert custodian_id == expected_custodian
+    assert remaining == expected_remaining
+
+
+def test_scan_requestor_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that listing a requestor's Data Access Requests queries its index.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Patch Query
+    crud = req_crud.data_access_request
+    queries: list[dict[str, Any]] = []
+    monkeypatch.setattr(crud, "query", lambda db_session, **kwargs: queries.append(kwargs))
+
+    # Scan
+    crud.scan(None, filter=crud.build_filter(requestor_id=REQUESTOR_ID), limit=10)  # type: ignore[arg-type]
+
+    # Assert
+    assert crud.indexes["requestor_id"] == "RequestorIndex"
+    assert [(q["key"], q["value"], q["filter"], q["limit"]) for q in queries] == [
+        ("requestor_id", str(REQUESTOR_ID), con.Attr("active").eq(True), 10),
+    ]
+
+
+def test_scan_custodian_links(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that listing a Custodian's Data Access Requests queries the links.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Shortcuts
+    crud = req_crud.data_access_request
+    links = [{"custodian_id": str(CUSTODIAN_ID), "id": pk} for pk in ("RASD-1", "RASD-2", "RASD-3")]
+    stored = {
+        pk: req_models.DataAccessRequest.construct(id=types.rasd.RASDIdentifier(pk))  # type: ignore[call-arg]
+        for pk in ("RASD-1", "RASD-3")
+    }
+    queries: list[dict[str, Any]] = []
+
+    # Construct Link Query
+    def paginate(operation: Any, **kwargs: Any) -> tuple[list[dict[str, Any]], None]:
+        queries.append(kwargs)
+        return (links, None)
+
+    # Patch Link Query and Retrieval
+    # The second linked Data Access Request no longer exists
+    monkeypatch.setattr(crud, "paginate", paginate)
+    monkeypatch.setattr(crud, "get_many", lambda db_session, *, pks, **kwargs: [stored.get(pk) for pk in pks])
+
+    # Scan
+    page = crud.scan(mock_session(), filter=crud.build_filter(custodian_id=CUSTODIAN_ID))
+
+    # Assert
+    assert [q["KeyConditionExpression"] for q in queries] == [con.Key("custodian_id").eq(str(CUSTODIAN_ID))]
+    assert [q["FilterExpression"] for q in queries] == [con.Attr("active").eq(True)]
+    assert [r.id for r in page.results] == ["RASD-1", "RASD-3"]
+    assert page.cursor is None
+
+
+def test_scan_custodian_links_invalid_filter() -> None:
+    """Tests that the custodian links cannot be filtered on other attributes."""
+    # Construct Filter
+    crud = req_crud.data_access_request
+    filter = con.Attr("custodian_ids").contains(str(CUSTODIAN_ID)) & con.Attr("doi").exists()  # noqa: A001
+
+    # Scan and Assert
+    with pytest.raises(ValueError, match="doi"):
+        crud.scan(mock_session(), filter=filter)
+
+
+@pytest.mark.parametrize(
+    (
+        "previous_ids",
+        "expected_deletes",
+    ),
+    [
+        (None, []),                                        # New
+        ([CUSTODIAN_ID], []),                              # Unchanged
+        ([CUSTODIAN_ID, OTHER_CUSTODIAN_ID], [OTHER_CUSTODIAN_ID]),  # Custodian removed
+    ]
+)
+def test_sync_custodian_links(
+    monkeypatch: pytest.MonkeyPatch,
+    previous_ids: Optional[list[uuid.UUID]],
+    expected_deletes: list[uuid.UUID],
+) -> None:
+    """Tests that syncing the custodian links deletes the stale links.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+        previous_ids (Optional[list[uuid.UUID]]): Previous Custodian IDs.
+        expected_deletes (list[uuid.UUID]): Expected Custodian IDs to unlink.
+    """
+    # Patch Link Table
+    crud = req_crud.data_access_request
+    table = mock_link_table()
+    monkeypatch.setattr(req_crud.aws.REGISTRY, "table", lambda name, db_session: table)
+
+    # Construct Data Access Requests
+    db_obj = mock_request(custodian_ids=[CUSTODIAN_ID])
+    previous = mock_request(custodian_ids=previous_ids) if previous_ids else None
+
+    # Sync Links
+    crud.sync_custodian_links(None, db_obj=db_obj, previous=previous)  # type: ignore[arg-type]
+
+    # Assert
+    assert table.deletes == [{"custodian_id": str(c), "id": "RASD-1"} for c in expected_deletes]
+    assert table.puts == [{"custodian_id": str(CUSTODIAN_ID), "id": "RASD-1", "active": True}]
+
+
+def test_delete_custodian_links(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that deleting a Data Access Request deletes all of its links.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Patch Link Table and Deletion
+    crud = req_crud.data_access_request
+    table = mock_link_table()
+    item = mock_request(custodian_ids=[CUSTODIAN_ID, OTHER_CUSTODIAN_ID])
+    monkeypatch.setattr(req_crud.aws.REGISTRY, "table", lambda name, db_session: table)
+    monkeypatch.setattr(base.CRUDBase, "delete", lambda self, db_session, *, pk: item)
+
+    # Delete
+    crud.delete(None, pk=item.id)  # type: ignore[arg-type]
+
+    # Assert
+    assert table.deletes == [{"custodian_id": str(c), "id": "RASD-1"} for c in (CUSTODIAN_ID, OTHER_CUSTODIAN_ID)]
+    assert table.puts == []
+
+
+def mock_request(custodian_ids: list[uuid.UUID]) -> req_models.DataAccessRequest:
+    """Constructs a minimal Data Access Request.
+
+    Args:
+        custodian_ids (list[uuid.UUID]): Custodian IDs of the request.
+
+    Returns:
+        req_models.DataAccessRequest: Data Access Request.
+    """
+    # Construct and Return
+    return req_models.DataAccessRequest.construct(  # type: ignore[call-arg]
+        id=types.rasd.RASDIdentifier("RASD-1"),
+        custodian_ids=custodian_ids,
+        active=True,
+    )
+
+
+def mock_link_table() -> Any:
+    """Constructs a custodian link table that records its writes.
+
+    Returns:
+        Any: Mock link table.
+    """
+    # Construct Table
+    class Table:
+        def __init__(self) -> None:
+            self.puts: list[dict[str, Any]] = []
+            self.deletes: list[dict[str, Any]] = []
+
+        def batch_writer(self) -> Any:
+            return self
+
+        def __enter__(self) -> Any:
+            return self
+
+        def __exit__(self, *args: Any) -> None:
+            pass
+
+        def put_item(self, Item: dict[str, Any]) -> None:
+            self.puts.append(Item)
+
+        def delete_item(self, Key: dict[str, Any]) -> None:
+            self.deletes.append(Key)
+
+    # Return
+    return Table()
+
+
+def mock_session() -> Any:
+    """Constructs a database session that doesn't connect to a database.
+
+    Returns:
+        Any: Mock database session.
+    """
+    # Construct Session
+    class Session:
+        def resource(self, name: str, **kwargs: Any) -> Any:
+            return self
+
+        def Table(self, name: str) -> Any:
+            return self
+
+        def query(self, **kwargs: Any) -> Any:
+            raise AssertionError("Query should be paginated")
+
+    # Return
+    return Session()
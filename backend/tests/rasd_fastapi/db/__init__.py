@@ -0,0 +1 @@
+"""RASD FastAPI Database Unit Tests."""
@@ -0,0 +1,98 @@
+"""RASD FastAPI Database Read-Through Cache Unit Tests."""
+
+
+# Standard
+import time
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.db import cache
+from rasd_fastapi.models import organisations as org_models
+from tests import conftest
+
+
+@pytest.fixture()
+def organisation() -> org_models.Organisation:
+    """Organisation to cache.
+
+    Returns:
+        org_models.Organisation: Organisation loaded from the unit test data.
+    """
+    # Load and Return
+    return org_models.Organisation.parse_obj(conftest.load_data_json("organisation.json"))
+
+
+def test_read_cache(organisation: org_models.Organisation) -> None:
+    """Tests the read cache copies, counts and evicts items.
+
+    Args:
+        organisation (org_models.Organisation): Organisation to cache.
+    """
+    # Instantiate Cache
+    read_cache = cache.ReadCache[org_models.Organisation]("test", ttl=60, size=2)
+
+    # Cache Item and Modify Original
+    read_cache.put("a", organisation, read_cache.generation)
+    name = organisation.name
+    organisation.name = "Modified"
+
+    # Retrieve and Modify Copy
+    cached = read_cache.get("a")
+    assert cached is not None
+    assert cached.name == name
+    cached.name = "Modified"
+
+    # Assert
+    assert read_cache.get("a").name == name  # type: ignore[union-attr]
+    assert read_cache.get("b") is None
+    assert read_cache.stats() == {"hits": 2, "misses": 1, "items": 1}
+
+    # Evict Least Recently Used
+    read_cache.put("b", organisation, read_cache.generation)
+    read_cache.get("a")
+    read_cache.put("c", organisation, read_cache.generation)
+
+    # Assert
+    assert list(read_cache.entries) == ["a", "c"]
+
+
+def test_read_cache_invalidate(organisation: org_models.Organisation, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests the read cache invalidation and expiry.
+
+    Args:
+        organisation (org_models.Organisation): Organisation to cache.
+        monkeypatch (pytest.MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    # Isolate Registry
+    monkeypatch.setattr(cache, "CACHES", {})
+
+    # Register Caches of the same Table
+    caches = [
+        cache.register("test-table", cache.ReadCache[org_models.Organisation](f"test-{i}", ttl=60, size=10))
+        for i in range(2)
+    ]
+    for read_cache in caches:
+        read_cache.put("a", organisation, read_cache.generation)
+
+    # Read before a Write
+    generation = caches[0].generation
+    cache.invalidate("test-table", "a")
+
+    # Assert
+    assert all(c.get("a") is None for c in caches)
+
+    # Put Item Read before the Write
+    caches[0].put("a", organisation, generation)
+
+    # Assert
+    assert caches[0].get("a") is None
+
+    # Expire Item
+    caches[0].ttl = 0
+    caches[0].put("a", organisation, caches[0].generation)
+    time.sleep(0.01)
+
+    # Assert
+    assert caches[0].get("a") is None
@@ -0,0 +1,71 @@
+"""RASD FastAPI DynamoDB Codec Unit Tests."""
+
+
+# Third-Party
+import boto3.dynamodb.conditions
+import boto3.dynamodb.types
+import fastapi.encoders
+import pydantic
+import pytest
+
+# Local
+from rasd_fastapi.db import codec
+from rasd_fastapi.models import metadata as metadata_models
+from rasd_fastapi.models import organisations as org_models
+from tests import conftest
+
+
+@pytest.mark.parametrize(
+    (
+        "model",
+        "name",
+    ),
+    [
+        (metadata_models.RASDMetadata, "metadata.json"),
+        (org_models.Organisation, "organisation.json"),
+    ]
+)
+def test_encode_decode(model: type[pydantic.BaseModel], name: str) -> None:
+    """Tests that the codec is equivalent to the `boto3` resource API.
+
+    Args:
+        model (type[pydantic.BaseModel]): Model to encode.
+        name (str): Name of the unit test data to load.
+    """
+    # Load Data
+    obj = model.parse_obj(conftest.load_data_json(name))
+    encoded = fastapi.encoders.jsonable_encoder(obj)
+
+    # Encode with the Resource API
+    serializer = boto3.dynamodb.types.TypeSerializer()
+    expected = {k: serializer.serialize(v) for (k, v) in encoded.items()}
+
+    # Assert
+    assert codec.encode_item(obj) == expected
+    assert codec.encode_item(encoded) == expected
+    assert codec.decode_item(expected) == encoded  # type: ignore[arg-type]
+
+
+def test_encode_request() -> None:
+    """Tests encoding a request for the low-level client."""
+    # Construct Request
+    request = {
+        "Key": {"id": "abc"},
+        "KeyConditionExpression": boto3.dynamodb.conditions.Key("organisation_id").eq("def"),
+        "FilterExpression": boto3.dynamodb.conditions.Attr("active").eq(True),
+        "ProjectionExpression": "#p0",
+        "ExpressionAttributeNames": {"#p0": "id"},
+    }
+
+    # Encode Request
+    encoded = codec.encode_request(request)
+
+    # Assert
+    assert encoded == {
+        "Key": {"id": {"S": "abc"}},
+        "KeyConditionExpression": "#n0 = :v0",
+        "FilterExpression": "#n1 = :v1",
+        "ProjectionExpression": "#p0",
+        "ExpressionAttributeNames": {"#p0": "id", "#n0": "organisation_id", "#n1": "active"},
+        "ExpressionAttributeValues": {":v0": {"S": "def"}, ":v1": {"BOOL": True}},
+    }
@@ -0,0 +1,60 @@
+"""RASD FastAPI Signed Pagination Cursors Unit Tests."""
+
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.crud import base
+from rasd_fastapi.db import cursors
+
+# Typing
+from typing import Any
+
+
+# Shortcuts
+KEY = {"id": "RASD-20230204-73df14", "listing": "all", "created_at": "2023-02-04T01:02:03.456789+00:00"}
+
+
+def test_cursor() -> None:
+    """Tests the signed cursor round trip with a full key."""
+    # Encode Cursor
+    cursor = cursors.encode(KEY)
+
+    # Assert
+    assert "=" not in cursor
+    assert cursors.decode_key(cursor, list(KEY)) == KEY
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",                                    # Garbage
+        cursors.encode(KEY).replace(".", "A."),             # Tampered payload
+        cursors.encode(KEY)[:-1],                           # Tampered signature
+        cursors.b64encode(b'{"id":"1"}') + ".",             # Unsigned
+        cursors.encode({"id": "RASD-20230204-73df14"}),     # Missing key attributes
+        cursors.encode(KEY | {"listing": True}),            # Wrong types
+        cursors.encode([KEY]),                              # Wrong structure
+    ]
+)
+def test_cursor_invalid(cursor: Any) -> None:
+    """Tests the signed cursor validation.
+
+    Args:
+        cursor (Any): Cursor to decode.
+    """
+    # Assert
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        cursors.decode_key(cursor, list(KEY))
+
+
+def test_cursor_other_partition() -> None:
+    """Tests that a cursor can't continue a query of another partition."""
+    # Encode Cursor
+    cursor = cursors.encode({"custodian_id": "a", "id": "RASD-20230204-73df14"})
+
+    # Assert
+    assert base.decode_start_key(cursor, ["custodian_id", "id"], "custodian_id", "a")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        base.decode_start_key(cursor, ["custodian_id", "id"], "custodian_id", "b")
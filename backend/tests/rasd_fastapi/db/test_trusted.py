@@ -0,0 +1,136 @@
+"""RASD FastAPI Trusted Database Loads Unit Tests."""
+
+
+# Standard
+import decimal
+import json
+
+# Third-Party
+import fastapi.encoders
+import pydantic
+import pytest
+
+# Local
+from rasd_fastapi.crud import base
+from rasd_fastapi.db import codec
+from rasd_fastapi.db import trusted
+from rasd_fastapi.models import metadata as metadata_models
+from rasd_fastapi.models import organisations as org_models
+from rasd_fastapi.models import requests as req_models
+from rasd_fastapi.schemas import metadata as metadata_schemas
+from tests import conftest
+
+# Typing
+from typing import Any
+
+
+def stored(model: pydantic.BaseModel) -> dict[str, Any]:
+    """Encodes a model as it would be retrieved from the database.
+
+    Args:
+        model (pydantic.BaseModel): Model to encode.
+
+    Returns:
+        dict[str, Any]: Raw item with numbers as `Decimal`s.
+    """
+    # Encode and Return
+    encoded = json.dumps(fastapi.encoders.jsonable_encoder(model))
+    return json.loads(encoded, parse_float=decimal.Decimal, parse_int=decimal.Decimal)  # type: ignore[no-any-return]
+
+
+@pytest.mark.parametrize(
+    (
+        "source",
+        "model",
+        "name",
+    ),
+    [
+        (metadata_models.RASDMetadata, metadata_models.RASDMetadata, "metadata.json"),
+        (metadata_models.RASDMetadata, metadata_schemas.RASDMetadataSummary, "metadata.json"),
+        (org_models.Organisation, org_models.Organisation, "organisation.json"),
+    ]
+)
+def test_construct(source: type[pydantic.BaseModel], model: type[pydantic.BaseModel], name: str) -> None:
+    """Tests that trusted loads are equivalent to validated loads.
+
+    Args:
+        source (type[pydantic.BaseModel]): Model that the item was stored as.
+        model (type[pydantic.BaseModel]): Model to load.
+        name (str): Name of the unit test data to load.
+    """
+    # Load Data
+    item = stored(source.parse_obj(conftest.load_data_json(name)))
+
+    # Load Models
+    validated = model.parse_obj(item)
+    constructed = trusted.construct(model, item)
+
+    # Assert
+    assert constructed == validated
+    for field in model.__fields__:
+        assert isinstance(getattr(constructed, field), type(getattr(validated, field)))
+
+
+@pytest.mark.parametrize(
+    (
+        "changes",
+        "unchanged",
+    ),
+    [
+        ({}, True),                                                 # Stored by the CRUD
+        ({"created_at": "2023-02-04T01:23:45.678901Z"}, True),      # Falls back to validating before Python 3.11
+        ({"completed_at": decimal.Decimal("1675587600")}, False),   # Falls back to validating the field
+    ]
+)
+def test_construct_data_access_request(changes: dict[str, Any], unchanged: bool) -> None:
+    """Tests that trusted loads of Data Access Requests are equivalent to validated loads.
+
+    Data Access Requests are stored with the low-level client (see `codec`),
+    and contain nested lists of Dataset Requests and their audit logs.
+
+    Args:
+        changes (dict[str, Any]): Changes to apply to the stored item.
+        unchanged (bool): Whether the changes keep the content of the item.
+    """
+    # Load Data
+    obj = req_models.DataAccessRequest.parse_obj(conftest.load_data_json("data_access_request.json"))
+    item = codec.decode_item(codec.encode_item(codec.fields(obj))) | changes
+
+    # Load Models
+    validated = req_models.DataAccessRequest.parse_obj(item)
+    constructed = trusted.construct(req_models.DataAccessRequest, item)
+
+    # Assert
+    assert constructed == validated
+    assert constructed.dataset_requests == validated.dataset_requests
+    assert isinstance(constructed.dataset_requests[0], req_models.DatasetRequest)
+    assert base.revision(constructed) == base.revision(validated)
+    assert (base.revision(constructed) == base.revision(obj)) == unchanged
+
+    # Assert Revision is Stable when Re-Written and Re-Loaded
+    item = codec.decode_item(codec.encode_item(codec.fields(constructed)))
+    reloaded = trusted.construct(req_models.DataAccessRequest, item)
+    assert base.revision(reloaded) == base.revision(constructed)
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"title": None},                              # Missing required field
+        {"data_source_url": "not a url"},             # Invalid fallback field
+        {"temporal_coverage_from": "not a date"},     # Invalid converted field
+    ]
+)
+def test_construct_invalid(changes: dict[str, Any]) -> None:
+    """Tests that trusted loads still reject invalid items.
+
+    Args:
+        changes (dict[str, Any]): Changes to apply to the stored item.
+    """
+    # Load Data
+    item = stored(metadata_models.RASDMetadata.parse_obj(conftest.load_data_json("metadata.json")))
+    item = {k: v for (k, v) in (item | changes).items() if v is not None}
+
+    # Assert
+    with pytest.raises(pydantic.ValidationError):
+        trusted.construct(metadata_models.RASDMetadata, item)
@@ -0,0 +1 @@
+"""RASD FastAPI Search Unit Tests."""
@@ -0,0 +1,57 @@
+"""RASD FastAPI Coverage Heatmap Unit Tests."""
+
+
+# Third-Party
+import numpy as np
+import pytest
+
+# Local
+from rasd_fastapi.search import heatmap
+from rasd_fastapi.search import spatial
+
+
+# Shortcuts
+BOXES = [
+    spatial.BoundingBox(north=-10, south=-44, east=154, west=113),  # Australia
+    spatial.BoundingBox(north=0, south=-20, east=-170, west=170),   # Across antimeridian
+    spatial.BoundingBox(north=5, south=0, east=-1, west=1),         # Across antimeridian, covering every column
+    spatial.BoundingBox(north=90, south=-90, east=180, west=-180),  # Whole globe
+]
+
+
+def build(boxes: list[spatial.BoundingBox]) -> heatmap.Heatmap:
+    """Builds a heatmap of bounding boxes.
+
+    Args:
+        boxes (list[spatial.BoundingBox]): Bounding boxes to count.
+
+    Returns:
+        heatmap.Heatmap: Heatmap of the bounding boxes.
+    """
+    # Build and Return
+    coordinates = {name: np.array([getattr(b, name) for b in boxes]) for name in spatial.BoundingBox._fields}
+    return heatmap.Heatmap(coordinates, version=1)
+
+
+@pytest.mark.parametrize("zoom", range(len(heatmap.ZOOM_LEVELS)))
+def test_heatmap(zoom: int) -> None:
+    """Tests the vectorised counts against counting the cells of each box.
+
+    Args:
+        zoom (int): Zoom level.
+    """
+    # Count Cells of each Box
+    size = heatmap.ZOOM_LEVELS[zoom]
+    expected = np.zeros((180 // size, 360 // size), dtype=np.int32)
+    for box in BOXES:
+        cells: set[tuple[int, int]] = set()
+        (south, north) = heatmap.cell(np.array(box.latitudes()), size, 180)
+        for longitudes in box.longitudes():
+            (west, east) = heatmap.cell(np.array(longitudes), size, 360)
+            cells.update((row, column) for row in range(south, north + 1) for column in range(west, east + 1))
+        for c in cells:
+            expected[c] += 1
+
+    # Assert
+    assert np.array_equal(build(BOXES).counts(zoom), expected)
+
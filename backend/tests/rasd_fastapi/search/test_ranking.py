@@ -0,0 +1,89 @@
+"""RASD FastAPI Ranked Search Unit Tests."""
+
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import ranking
+
+# Typing
+from typing import Any, Callable, Optional
+
+
+# Shortcuts
+DOCUMENTS = {
+    "a": {"title": "Koala survey", "abstract": "Counts of koalas in Victoria"},
+    "b": {"title": "Bird survey", "abstract": "Koala sightings were also recorded"},
+    "c": {"title": "Frog survey", "abstract": "Frogs of Victoria"},
+}
+
+
+@pytest.fixture()
+def index() -> ranking.RankedIndex:
+    """Constructs a ranked index of the test documents.
+
+    Returns:
+        ranking.RankedIndex: Ranked index.
+    """
+    # Build Index
+    index = ranking.RankedIndex({"title": 3.0, "abstract": 1.0})
+    index.rebuild((doc_id, fields, doc_id) for (doc_id, fields) in DOCUMENTS.items())
+
+    # Return
+    return index
+
+
+@pytest.mark.parametrize(
+    (
+        "query",
+        "k",
+        "predicate",
+        "expected",
+    ),
+    [
+        ("koala", None, None, ["a", "b"]),                   # Title match ranked first
+        ("koala", 1, None, ["a"]),                           # Top k
+        ("koala", None, lambda d: d != "a", ["b"]),          # Predicate
+        ("frog victoria", None, None, ["c", "a"]),           # Multiple terms
+        ("survey", None, None, ["c", "b", "a"]),             # Ties broken by ID
+        ("platypus", None, None, []),                        # No matches
+    ]
+)
+def test_search(
+    index: ranking.RankedIndex,
+    query: str,
+    k: Optional[int],
+    predicate: Optional[Callable[[Any], bool]],
+    expected: list[str],
+) -> None:
+    """Tests ranking documents by relevance.
+
+    Args:
+        index (ranking.RankedIndex): Ranked index.
+        query (str): Free text query.
+        k (Optional[int]): Number of documents to return.
+        predicate (Optional[Callable[[Any], bool]]): Filter for documents.
+        expected (list[str]): Expected documents in order.
+    """
+    # Search
+    results = index.search(query, k=k, predicate=predicate)
+
+    # Assert
+    assert [doc for (_, doc) in results] == expected
+
+
+def test_update(index: ranking.RankedIndex) -> None:
+    """Tests updating documents in the ranked index incrementally.
+
+    Args:
+        index (ranking.RankedIndex): Ranked index.
+    """
+    # Update and Remove Documents
+    index.add("c", {"title": "Koala koala koala"}, "c")
+    index.remove("a")
+
+    # Assert
+    assert [doc for (_, doc) in index.search("koala")] == ["c", "b"]
+    assert index.search("frog") == []
+    assert index.total_length == sum(index.lengths.values())
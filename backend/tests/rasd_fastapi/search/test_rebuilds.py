@@ -0,0 +1,57 @@
+"""RASD FastAPI Background Index Rebuild Unit Tests."""
+
+
+# Standard
+import threading
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import rebuilds
+
+
+def test_rebuild() -> None:
+    """Tests that only one rebuild runs at a time."""
+    # Construct Blocking Builder
+    release = threading.Event()
+    built: list[int] = []
+
+    def build() -> None:
+        release.wait(timeout=5)
+        built.append(len(built))
+
+    # Start Rebuilds
+    rebuild = rebuilds.Rebuild("test")
+    first = rebuild.start(build)
+    second = rebuild.start(build)
+
+    # Assert
+    assert second is first
+    assert not first.done()
+
+    # Complete Rebuild
+    release.set()
+    first.result(timeout=5)
+
+    # Start Another Rebuild
+    rebuild.start(build).result(timeout=5)
+
+    # Assert
+    assert built == [0, 1]
+
+
+def test_rebuild_error() -> None:
+    """Tests that a failed rebuild is reported and then retried."""
+    # Construct Failing Builder
+    def build() -> None:
+        raise RuntimeError("scan failed")
+
+    # Start Rebuild
+    rebuild = rebuilds.Rebuild("test")
+    failed = rebuild.start(build)
+
+    # Assert
+    with pytest.raises(RuntimeError, match="scan failed"):
+        failed.result(timeout=5)
+    assert rebuild.start(lambda: None) is not failed
@@ -0,0 +1,81 @@
+"""RASD FastAPI Search Result Cache Unit Tests."""
+
+
+# Standard
+import datetime
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import results
+
+
+def test_result_cache() -> None:
+    """Tests caching, evicting and clearing result sets."""
+    # Build Cache
+    cache = results.ResultCache(size=5, ttl=60)
+    built: list[str] = []
+
+    # Construct Builder
+    def build(key: str, count: int) -> list[str]:
+        built.append(key)
+        return [f"{key}{i}" for i in range(count)]
+
+    # Cache Result Sets
+    assert cache.fetch("a", lambda: build("a", 2)) == ["a0", "a1"]
+    assert cache.fetch("a", lambda: build("a", 2)) == ["a0", "a1"]
+    cache.fetch("b", lambda: build("b", 2))
+    cache.fetch("a", lambda: build("a", 2))  # Marks "a" as recently used
+    cache.fetch("c", lambda: build("c", 2))  # Evicts "b"
+    cache.fetch("d", lambda: build("d", 6))  # Too large to cache
+
+    # Assert
+    assert built == ["a", "b", "c", "d"]
+    assert (cache.get("a"), cache.get("b"), cache.get("d")) == (["a0", "a1"], None, None)
+    assert cache.total == 4
+
+    # Clear Cache
+    # Result sets built before the clear aren't cached
+    generation = cache.generation
+    cache.clear()
+    cache.put("e", ["e0"], generation)
+
+    # Assert
+    assert (cache.get("a"), cache.get("e"), cache.total) == (None, None, 0)
+
+
+def test_result_cache_expiry() -> None:
+    """Tests that cached result sets expire."""
+    # Build Cache
+    cache = results.ResultCache(size=5, ttl=-1)
+    cache.put("a", ["a0"], cache.generation)
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.total == 0
+
+
+@pytest.mark.parametrize(
+    (
+        "a",
+        "b",
+        "same",
+    ),
+    [
+        ({"title": {"koala", "survey"}}, {"title": {"survey", "koala"}}, True),
+        ({"title": {"koala"}}, {"abstract": {"koala"}}, False),
+        ({"coverage": (datetime.date(1990, 1, 1), None)}, {"coverage": (datetime.date(1990, 1, 1), None)}, True),
+        ({"coverage": (datetime.date(1990, 1, 1), None)}, {"coverage": (None, datetime.date(1990, 1, 1))}, False),
+    ]
+)
+def test_key(a: dict, b: dict, same: bool) -> None:
+    """Tests normalising the keys of searches.
+
+    Args:
+        a (dict): Parameters of the first search.
+        b (dict): Parameters of the second search.
+        same (bool): Whether the searches are expected to share a key.
+    """
+    # Assert
+    assert (results.key(**a) == results.key(**b)) == same
@@ -0,0 +1,68 @@
+"""RASD FastAPI Similar Metadata Unit Tests."""
+
+
+# Third-Party
+import numpy as np
+import pytest
+
+# Local
+from rasd_fastapi.search import similarity
+
+# Typing
+from typing import Optional
+
+
+# Shortcuts
+DOCUMENTS = [
+    (b"a", "Koala survey of Victoria", 0b001),
+    (b"b", "Koala survey of Queensland", 0b001),
+    (b"c", "Frog survey of Victoria", 0b010),
+    (b"d", "Seagrass monitoring", 0b100),
+    (b"e", "Seagrass monitoring", 0b000),
+]
+
+
+@pytest.mark.parametrize(
+    (
+        "doc_id",
+        "limit",
+        "expected",
+    ),
+    [
+        (b"a", 10, [1, 2]),  # Shares terms and categories, then terms only
+        (b"a", 1, [1]),      # Limit
+        (b"d", 10, [4]),     # Rows without any similarity are excluded
+        (b"z", 10, None),    # Not indexed
+    ]
+)
+def test_similar(doc_id: bytes, limit: int, expected: Optional[list[int]]) -> None:
+    """Tests retrieving the nearest neighbours of a document.
+
+    Args:
+        doc_id (bytes): ID of the document.
+        limit (int): Number of neighbours to return.
+        expected (Optional[list[int]]): Expected neighbouring rows in order.
+    """
+    # Build Index
+    index = similarity.SimilarityIndex(DOCUMENTS, width=3, version=1)
+    neighbours = index.similar(doc_id, limit)
+
+    # Assert
+    assert ([row for (row, _) in neighbours] if neighbours is not None else None) == expected
+
+
+def test_neighbours() -> None:
+    """Tests the blocked nearest neighbours against sorting every similarity."""
+    # Generate Vectors
+    generator = np.random.default_rng(0)
+    matrix = similarity.normalise(generator.random((600, 8), dtype=np.float32))
+
+    # Compute Neighbours
+    (rows, scores) = similarity.neighbours(matrix, 5)
+    expected = matrix @ matrix.T
+    np.fill_diagonal(expected, -np.inf)
+
+    # Assert
+    assert rows.shape == (600, 5)
+    assert np.allclose(scores, -np.sort(-expected, axis=1)[:, :5])
+    assert np.allclose(np.take_along_axis(expected, rows, axis=1), scores)
@@ -0,0 +1,139 @@
+"""RASD FastAPI Metadata Catalogue Snapshot Unit Tests."""
+
+
+# Standard
+import datetime
+import pathlib
+import uuid
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.models.metadata_vocabs import keywords
+from rasd_fastapi.models import metadata as metadata_models
+from rasd_fastapi.models.metadata_vocabs import locations
+from rasd_fastapi.schemas import metadata as metadata_schemas
+from rasd_fastapi.search import snapshot
+from rasd_fastapi.search import spatial
+from rasd_fastapi.search import temporal
+from tests import conftest
+
+# Typing
+from typing import Any
+
+
+# Shortcuts
+EXCLUDE = {"keywords", "locations", "title_lower", "abstract_lower"}  # Decoded in another order, or computed
+ORGANISATION = uuid.UUID("c7dee788-561f-4434-a4bd-b0d6f73679cf")
+OVERRIDES: list[dict[str, Any]] = [
+    {"title": "Koala survey", "abstract": None},
+    {"title": "Birds of Brisbane survey", "keywords": ["Fauna"], "locations": ["Queensland"]},
+    {
+        "title": "Frog survey",
+        "organisation_id": str(uuid.UUID(int=0)),
+        "custodian": "Ünïcode",
+        "north_bounding_coordinate": 0,
+        "south_bounding_coordinate": -20,
+        "east_bounding_coordinate": -170,
+        "west_bounding_coordinate": 170,
+        "temporal_coverage_from": "1990-01-01",
+        "temporal_coverage_to": "2000-12-31",
+    },
+]
+METADATA = [
+    metadata_models.RASDMetadata.parse_obj(
+        conftest.load_data_json("metadata.json") | {"id": str(uuid.UUID(int=i)), "active": True} | overrides
+    )
+    for (i, overrides) in enumerate(OVERRIDES)
+]
+SUMMARIES = [metadata_schemas.RASDMetadataSummary.parse_obj(m.dict()) for m in METADATA]
+
+
+@pytest.fixture()
+def catalogue(tmp_path: pathlib.Path) -> snapshot.Snapshot:
+    """Writes and opens a snapshot of the test metadata.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory to write to.
+
+    Returns:
+        snapshot.Snapshot: Catalogue snapshot.
+    """
+    # Write in Reverse, to check that the rows are sorted by ID
+    return snapshot.Snapshot(snapshot.write(str(tmp_path), 7, reversed(METADATA)))
+
+
+def test_snapshot(catalogue: snapshot.Snapshot) -> None:
+    """Tests the snapshot round trip.
+
+    Args:
+        catalogue (snapshot.Snapshot): Catalogue snapshot.
+    """
+    # Decode Summaries
+    decoded = [catalogue.summary(row) for row in range(catalogue.count)]
+
+    # Assert
+    assert catalogue.version == 7
+    assert [s.id for s in decoded] == [s.id for s in SUMMARIES]
+    assert list(catalogue.ids) == [s.id.bytes for s in SUMMARIES]
+    assert [catalogue.taxa[row] for row in range(catalogue.count)] == [m.taxa_covered for m in METADATA]
+    for (a, b) in zip(decoded, SUMMARIES):
+        assert a.dict(exclude=EXCLUDE) == b.dict(exclude=EXCLUDE)
+        assert (set(a.keywords), set(a.locations)) == (set(b.keywords), set(b.locations))
+
+
+@pytest.mark.parametrize(
+    (
+        "filters",
+        "expected",
+    ),
+    [
+        ({}, [0, 1, 2]),                                                # No filters
+        ({"start": 1}, [1, 2]),                                         # Start row
+        ({"title": "bird"}, [1]),                                       # Title substring
+        ({"title": "BIRDS OF"}, [1]),                                   # Title substring, case insensitive
+        ({"title": "survey"}, [0, 1, 2]),                               # Title substring in every row
+        ({"title": "survey\0frog"}, []),                               # Title substring across rows
+        ({"abstract": "unit test"}, [1, 2]),                            # Abstract substring, skipping nulls
+        ({"keywords": {keywords.Keyword.FAUNA}}, [1]),                  # Keywords
+        ({"locations": {locations.Location.VICTORIA}}, [0, 2]),         # Locations
+        ({"organisation_id": ORGANISATION}, [0, 1]),                    # Organisation
+        ({"bbox": spatial.BoundingBox(-30, -35, 140, 130)}, [0, 1]),    # Bounding box
+        ({"bbox": spatial.BoundingBox(-5, -5, -175, 175)}, [2]),        # Bounding box across antimeridian
+        ({"bbox": spatial.BoundingBox(-5, -5, -175, 175), "title": "koala"}, []),  # Combined filters
+        ({"coverage": temporal.Interval(datetime.date(1995, 1, 1), None)}, [0, 1, 2]),  # Temporal coverage
+        ({"coverage": temporal.Interval(None, datetime.date(2001, 1, 1))}, [2]),        # Open start
+        ({"coverage": temporal.Interval(None, datetime.date(2001, 1, 1)), "title": "koala"}, []),  # Combined
+    ]
+)
+def test_snapshot_search(catalogue: snapshot.Snapshot, filters: dict[str, Any], expected: list[int]) -> None:
+    """Tests searching the snapshot.
+
+    Args:
+        catalogue (snapshot.Snapshot): Catalogue snapshot.
+        filters (dict[str, Any]): Search filters.
+        expected (list[int]): Expected rows.
+    """
+    # Assert
+    assert list(catalogue.search(**filters)) == expected
+    assert catalogue.start(SUMMARIES[0].id) == 1
+
+
+def test_snapshot_facets(catalogue: snapshot.Snapshot) -> None:
+    """Tests counting facets of the snapshot.
+
+    Args:
+        catalogue (snapshot.Snapshot): Catalogue snapshot.
+    """
+    # Count Facets
+    # The keywords filter applies to the other facets, but not to the keywords
+    facets = catalogue.facets(keywords={keywords.Keyword.FAUNA})
+    restricted = catalogue.facets(restrict=catalogue.rows([SUMMARIES[0].id]))
+
+    # Assert
+    assert facets["keywords"][keywords.Keyword.FAUNA] == 1
+    assert facets["keywords"][keywords.Keyword.FLORA] == 2
+    assert facets["locations"] == {m: int(m == locations.Location.QUEENSLAND) for m in locations.Location}
+    assert restricted["locations"][locations.Location.VICTORIA] == 1
+    assert sum(restricted["access_rights"].values()) == 1
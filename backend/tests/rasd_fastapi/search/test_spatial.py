@@ -0,0 +1,94 @@
+"""RASD FastAPI Spatial Search Unit Tests."""
+
+
+# Standard
+import random
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import spatial
+
+
+# Shortcuts
+BOX = spatial.BoundingBox(north=-10, south=-40, east=150, west=110)
+
+
+@pytest.mark.parametrize(
+    (
+        "other",
+        "expected",
+    ),
+    [
+        (spatial.BoundingBox(north=-20, south=-30, east=140, west=130), True),     # Contained
+        (spatial.BoundingBox(north=0, south=-10, east=110, west=100), True),       # Touching corner
+        (spatial.BoundingBox(north=0, south=-9, east=140, west=130), False),       # North of box
+        (spatial.BoundingBox(north=-20, south=-30, east=-170, west=160), False),   # Across antimeridian, east of box
+        (spatial.BoundingBox(north=-20, south=-30, east=-170, west=140), True),    # Across antimeridian, overlapping
+    ]
+)
+def test_overlaps(other: spatial.BoundingBox, expected: bool) -> None:
+    """Tests checking whether bounding boxes overlap.
+
+    Args:
+        other (spatial.BoundingBox): Bounding box to check.
+        expected (bool): Whether the bounding boxes are expected to overlap.
+    """
+    # Assert
+    assert BOX.overlaps(other) == expected
+    assert other.overlaps(BOX) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        BOX,                                                                  # Interior and boundary cells
+        spatial.BoundingBox(north=-21, south=-29, east=139, west=131),        # Within a single cell
+        spatial.BoundingBox(north=90, south=-90, east=180, west=-180),        # Whole globe
+        spatial.BoundingBox(north=10, south=-10, east=-150, west=150),        # Across antimeridian
+    ]
+)
+def test_grid_index(query: spatial.BoundingBox) -> None:
+    """Tests the grid index against checking every bounding box.
+
+    Args:
+        query (spatial.BoundingBox): Bounding box to search.
+    """
+    # Generate Bounding Boxes
+    generator = random.Random(0)
+    boxes = []
+    for _ in range(500):
+        (south, north) = sorted(generator.randint(-90, 90) for _ in range(2))
+        (west, east) = (generator.randint(-180, 180) for _ in range(2))
+        boxes.append(spatial.BoundingBox(north=north, south=south, east=east, west=west))
+
+    # Search Index
+    index = spatial.GridIndex(boxes)
+    expected = {row for (row, box) in enumerate(boxes) if box.overlaps(query)}
+
+    # Assert
+    assert set(spatial.bitsets.rows(index.mask(query))) == expected
+
+
+@pytest.mark.parametrize(
+    (
+        "coordinates",
+        "expected",
+    ),
+    [
+        ((None, None, None, None), None),
+        ((-10, -40, 150, 110), BOX),
+    ]
+)
+def test_bounding_box(coordinates: tuple, expected: spatial.BoundingBox) -> None:
+    """Tests constructing bounding boxes from optional coordinates.
+
+    Args:
+        coordinates (tuple): North, south, east and west coordinates.
+        expected (spatial.BoundingBox): Expected bounding box.
+    """
+    # Assert
+    assert spatial.bounding_box(*coordinates) == expected
+    with pytest.raises(ValueError, match="required"):
+        spatial.bounding_box(-10, None, None, None)
@@ -0,0 +1,62 @@
+"""RASD FastAPI Temporal Search Unit Tests."""
+
+
+# Standard
+import datetime
+import random
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import bitsets
+from rasd_fastapi.search import temporal
+
+# Typing
+from typing import Optional
+
+
+@pytest.mark.parametrize(
+    (
+        "start",
+        "end",
+    ),
+    [
+        (datetime.date(1990, 1, 1), datetime.date(2000, 12, 31)),  # Closed interval
+        (datetime.date(1990, 1, 1), datetime.date(1990, 1, 1)),    # Single day
+        (None, datetime.date(1950, 6, 30)),                        # Open start
+        (datetime.date(2010, 1, 1), None),                         # Open end
+        (datetime.date(1800, 1, 1), datetime.date(1801, 1, 1)),    # Before every row
+    ]
+)
+def test_interval_index(start: Optional[datetime.date], end: Optional[datetime.date]) -> None:
+    """Tests the interval index against checking every interval.
+
+    Args:
+        start (Optional[datetime.date]): Start of the interval to search.
+        end (Optional[datetime.date]): End of the interval to search.
+    """
+    # Generate Intervals
+    generator = random.Random(0)
+    first = datetime.date(1900, 1, 1).toordinal()
+    intervals = [sorted(generator.randint(first, first + 45_000) for _ in range(2)) for _ in range(500)]
+
+    # Search Index
+    index = temporal.IntervalIndex([s for (s, _) in intervals], [e for (_, e) in intervals])
+    query = temporal.interval(start=start, end=end)
+    assert query is not None
+    expected = {
+        row for (row, (s, e)) in enumerate(intervals)
+        if (end is None or s <= end.toordinal()) and (start is None or e >= start.toordinal())
+    }
+
+    # Assert
+    assert set(bitsets.rows(index.mask(query))) == expected
+
+
+def test_interval() -> None:
+    """Tests constructing intervals from optional dates."""
+    # Assert
+    assert temporal.interval(start=None, end=None) is None
+    with pytest.raises(ValueError, match="end before it starts"):
+        temporal.interval(start=datetime.date(2000, 1, 1), end=datetime.date(1990, 1, 1))
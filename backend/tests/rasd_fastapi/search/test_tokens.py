@@ -0,0 +1,36 @@
+"""RASD FastAPI Search Tokeniser Unit Tests."""
+
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import tokens
+
+# Typing
+from typing import Optional
+
+
+@pytest.mark.parametrize(
+    (
+        "text",
+        "expected",
+    ),
+    [
+        (None, []),                                                   # No text
+        ("", []),                                                     # Empty text
+        ("!?", []),                                                   # No tokens
+        ("Fauna of Victoria", ["fauna", "of", "victoria"]),           # Case folded
+        ("Émus, emus & EMUS", ["emus", "emus", "emus"]),              # Accents removed
+        ("2019-2020 survey_data", ["2019", "2020", "survey", "data"]),  # Punctuation split
+    ]
+)
+def test_tokenise(text: Optional[str], expected: list[str]) -> None:
+    """Tests tokenising text for searching.
+
+    Args:
+        text (Optional[str]): Text to tokenise.
+        expected (list[str]): Expected tokens.
+    """
+    # Assert
+    assert tokens.tokenise(text) == expected
@@ -0,0 +1,49 @@
+"""RASD FastAPI Typeahead Suggestions Unit Tests."""
+
+
+# Third-Party
+import pytest
+
+# Local
+from rasd_fastapi.search import typeahead
+
+
+# Shortcuts
+VALUES = [
+    ("title", "Koala survey of Victoria"),
+    ("title", "Kookaburra counts"),
+    ("taxa_covered", "Koala"),
+    ("taxa_covered", "Koala"),
+    ("custodian", "Victorian Museum"),
+]
+
+
+@pytest.mark.parametrize(
+    (
+        "prefix",
+        "limit",
+        "expected",
+    ),
+    [
+        ("ko", 10, ["Koala", "Kookaburra counts", "Koala survey of Victoria"]),  # Ranked by count then length
+        ("ko", 1, ["Koala"]),                                                    # Limit
+        ("KOALA S", 10, ["Koala survey of Victoria"]),                           # Normalised across words
+        ("vic", 10, ["Victorian Museum", "Koala survey of Victoria"]),           # Matched at any word
+        ("emu", 10, []),                                                         # No matches
+        ("  ", 10, []),                                                          # No tokens
+    ]
+)
+def test_suggest(prefix: str, limit: int, expected: list[str]) -> None:
+    """Tests suggesting completions of a prefix.
+
+    Args:
+        prefix (str): Text typed so far.
+        limit (int): Number of completions to return.
+        expected (list[str]): Expected completions in order.
+    """
+    # Build Index
+    index = typeahead.SuggestIndex(VALUES, version=1)
+
+    # Suggest Twice, to check the cached completions
+    for _ in range(2):
+        assert [text for (_, text, _) in index.suggest(prefix, limit)] == expected